@@ -9,9 +9,10 @@ import sys
 from typing import Optional
 
 from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtCore import QFile, QCoreApplication, QSettings, QTranslator, QLibraryInfo, QLocale
 
-from ui.main_window import MainWindow
+from ui.main_window import MainWindow, load_qss_cached
 from core.settings_service import SettingsService
 
 
@@ -45,9 +46,11 @@ def load_style(app: QApplication) -> None:
     dark_mode = SettingsService.dark_mode(False)
     qss_file = "resources/style_dark.qss" if dark_mode else "resources/style.qss"
     qss_path = resource_path(qss_file)
-    if os.path.exists(qss_path):
-        with open(qss_path, "r", encoding="utf-8") as f:
-            app.setStyleSheet(f.read())
+    # 与主窗口主题切换共用同一份内存缓存，启动后切换主题不再读盘
+    try:
+        app.setStyleSheet(load_qss_cached(os.path.abspath(qss_path)))
+    except OSError:
+        pass
 
 
 def main() -> None:
@@ -63,6 +66,8 @@ def main() -> None:
     QCoreApplication.setOrganizationName("计算器")
     QCoreApplication.setApplicationName("计算器")
     app = QApplication(sys.argv)
+    # 图标位图缓存：只放大不缩小（Qt 默认上限已大于 2048 KB）
+    QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 2048))
     try:
         QLocale.setDefault(QLocale("zh_CN"))
     except Exception:
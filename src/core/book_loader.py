@@ -6,7 +6,9 @@
 
 from __future__ import annotations
 
+import codecs
 from dataclasses import dataclass
+import io
 import os
 import posixpath
 import re
@@ -17,6 +19,9 @@ from xml.etree import ElementTree as ET
 
 SUPPORTED_BOOK_EXTENSIONS = (".txt", ".epub")
 
+# 流式读取 TXT 时的二进制缓冲区大小
+_TEXT_READ_BUFFER = 1 << 20
+
 _HTML_MEDIA_TYPES = {
     "application/xhtml+xml",
     "text/html",
@@ -200,14 +205,14 @@ def list_supported_book_files(path: str) -> list[str]:
     if not os.path.isdir(path):
         raise ValueError(f"非有效目录: {path}")
     try:
-        entries = os.listdir(path)
+        with os.scandir(path) as it:
+            files = [
+                entry.name
+                for entry in it
+                if is_supported_book_file(entry.name) and entry.is_file()
+            ]
     except Exception as exc:
         raise ValueError(f"读取目录失败: {exc}") from exc
-    files = [
-        name
-        for name in entries
-        if is_supported_book_file(name) and os.path.isfile(os.path.join(path, name))
-    ]
     files.sort(key=lambda item: item.lower())
     return files
 
@@ -225,24 +230,58 @@ def load_book_text(file_path: str) -> str:
     return load_book_content(file_path).text
 
 
-def iter_book_text_chunks(file_path: str, chunk_size: int = 64 * 1024):
-    text = load_book_text(file_path)
-    if not text:
-        return
+def iter_book_text_chunks(file_path: str, chunk_size: int = 256 * 1024):
+    # TXT 按块流式读取并增量解码，不在内存中保留整本文本；EPUB 仍整本解析后切块
     step = max(1, int(chunk_size))
+    ext = os.path.splitext(str(file_path or ""))[1].lower()
+    if ext == ".txt":
+        yield from _iter_text_file_chunks(file_path, step)
+        return
+    text = load_book_text(file_path)
     for idx in range(0, len(text), step):
         yield text[idx:idx + step]
 
 
 def _load_text_file(file_path: str) -> str:
-    last_error: Exception | None = None
-    for encoding, errors in (("utf-8", "strict"), ("gbk", "ignore")):
-        try:
-            with open(file_path, "r", encoding=encoding, errors=errors) as f:
-                return f.read()
-        except Exception as exc:
-            last_error = exc
-    raise ValueError(f"读取文本失败: {last_error}") from last_error
+    # 与流式读取共用同一次编码判定与解码，整本读取与按块读取结果一致
+    return "".join(_iter_text_file_chunks(file_path, _TEXT_READ_BUFFER))
+
+
+def _guess_text_encoding(raw: bytes) -> str:
+    # raw 为首个含非 ASCII 字节的数据块：带 UTF-8 BOM 或能按 UTF-8 严格解码（块尾允许截断的多字节字符）则为 UTF-8，否则按 GBK
+    if raw.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        codecs.getincrementaldecoder("utf-8")("strict").decode(raw, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "gbk"
+
+
+def _iter_text_file_chunks(file_path: str, block_size: int):
+    # 单次打开、单遍读取：纯 ASCII 前缀在 UTF-8 与 GBK 下解码相同，直接输出；
+    # 读到首个含非 ASCII 字节的块时判定编码，之后增量解码（非法字节忽略）；换行符按文本模式规则统一为 \n
+    newlines = io.IncrementalNewlineDecoder(None, translate=True)
+    decoder = None
+    try:
+        with open(file_path, "rb", buffering=_TEXT_READ_BUFFER) as f:
+            while True:
+                raw = f.read(block_size)
+                if decoder is None and not raw.isascii():
+                    # 判定样本至少取 4 KB（peek 不移动读取位置），避免小块截断的字节序列被误判为 UTF-8
+                    sample = raw + f.peek(4096)[:max(0, 4096 - len(raw))]
+                    decoder = codecs.getincrementaldecoder(_guess_text_encoding(sample))("ignore")
+                if decoder is None:
+                    text = raw.decode("ascii")
+                else:
+                    text = decoder.decode(raw, final=not raw)
+                text = newlines.decode(text, final=not raw)
+                if text:
+                    yield text
+                if not raw:
+                    return
+    except OSError as exc:
+        raise ValueError(f"读取文本失败: {exc}") from exc
 
 
 def _load_epub_content(file_path: str) -> BookContent:
@@ -6,20 +6,36 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QCoreApplication, QSettings
 
 
 class SettingsService:
     """
     类: SettingsService
     作用: 提供常用配置项的统一读写入口，减少键名散落与重复钳制逻辑。
+         内部复用同一个 QSettings 实例，避免每次读写都重新打开注册表/INI。
     """
 
+    _instance: Optional[QSettings] = None
+    _instance_key: Optional[Tuple[str, str]] = None
+
     @staticmethod
     def _settings() -> QSettings:
-        return QSettings()
+        # 组织/应用名变化时（如测试或启动早期）重新创建，保证写入位置正确
+        key = (QCoreApplication.organizationName(), QCoreApplication.applicationName())
+        if SettingsService._instance is None or SettingsService._instance_key != key:
+            SettingsService._instance = QSettings()
+            SettingsService._instance_key = key
+        return SettingsService._instance
+
+    @staticmethod
+    def sync() -> None:
+        try:
+            SettingsService._settings().sync()
+        except Exception:
+            pass
 
     @staticmethod
     def dark_mode(default: bool = False) -> bool:
@@ -123,3 +139,31 @@ class SettingsService:
             }
         except Exception:
             return defaults
+
+    @staticmethod
+    def set_minimal_theme(theme: Dict[str, str]) -> None:
+        settings = SettingsService._settings()
+        settings.setValue("minimal_theme_bg", str(theme.get("bg", "")))
+        settings.setValue("minimal_theme_fg", str(theme.get("fg", "")))
+        settings.setValue("minimal_theme_accent", str(theme.get("accent", "")))
+        settings.setValue("minimal_theme_name", str(theme.get("name", "")))
+
+    _CUSTOM1_KEYS = ("minimal_theme_custom1_bg", "minimal_theme_custom1_fg", "minimal_theme_custom1_accent")
+
+    @staticmethod
+    def minimal_theme_custom1() -> Tuple[str, str, str]:
+        try:
+            settings = SettingsService._settings()
+            bg, fg, accent = (str(settings.value(k, "", type=str) or "") for k in SettingsService._CUSTOM1_KEYS)
+            return bg, fg, accent
+        except Exception:
+            return "", "", ""
+
+    @staticmethod
+    def set_minimal_theme_custom1(bg: str, fg: str, accent: str) -> None:
+        # 仅写入有变化的键（QSettings 自身不做比较）；不主动 sync，交由 Qt 事件循环落盘
+        settings = SettingsService._settings()
+        current = SettingsService.minimal_theme_custom1()
+        for key, old, new in zip(SettingsService._CUSTOM1_KEYS, current, (bg, fg, accent)):
+            if old != new:
+                settings.setValue(key, new)
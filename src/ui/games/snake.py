@@ -22,6 +22,10 @@ class GameSnakeDialog(HoverHideMixin, DraggableMixin, QDialog):
         无。
     """
 
+    # 正常节拍与低透明度（不在视线焦点）时的降频节拍，单位毫秒
+    _TICK_MS = 260
+    _TICK_DIM_MS = 1000
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """
         函数: __init__
@@ -102,7 +106,7 @@ class GameSnakeDialog(HoverHideMixin, DraggableMixin, QDialog):
 
         try:
             self._tick_timer = QTimer(self)
-            self._tick_timer.setInterval(260)
+            self._tick_timer.setInterval(self._TICK_MS)
             self._tick_timer.timeout.connect(self._on_tick)
         except Exception:
             pass
@@ -298,7 +302,10 @@ class GameSnakeDialog(HoverHideMixin, DraggableMixin, QDialog):
             if getattr(self, "_hover_hidden", False):
                 return
             p = 1 if int(percent) < 1 else (100 if int(percent) > 100 else int(percent))
-            self.setWindowOpacity(p / 100.0 if p > 1 else 1.0)
+            opacity = p / 100.0 if p > 1 else 1.0
+            self.setWindowOpacity(opacity)
+            # 窗口半透明以下视为“余光模式”：计时器仍运行但降频，减少唤醒
+            self._tick_timer.setInterval(self._TICK_DIM_MS if opacity < 0.5 else self._TICK_MS)
         except Exception:
             pass
 
@@ -400,6 +407,7 @@ class GameSnakeDialog(HoverHideMixin, DraggableMixin, QDialog):
             if getattr(self, "_game_over", False):
                 return
             if hasattr(self, "_tick_timer") and self._tick_timer is not None:
+                self._tick_timer.setInterval(self._TICK_MS)
                 self._tick_timer.start()
         except Exception:
             pass
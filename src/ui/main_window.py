@@ -6,13 +6,14 @@
 
 from typing import Optional
 
-from PySide6.QtCore import Qt, QSettings, QSize
+from PySide6.QtCore import Qt, QEvent, QSettings, QSize, QRect, QTimer
 from PySide6.QtGui import (
     QIcon,
+    QImage,
     QPainter,
     QPixmap,
+    QPixmapCache,
     QFont,
-    QTransform,
     QColor,
     QPen,
     QPalette,
@@ -46,7 +47,9 @@ from PySide6.QtWidgets import (
     QColorDialog,
     QFrame,
 )
+import functools
 import os
+import stat
 import sys
 import ctypes
 
@@ -58,6 +61,195 @@ from ui.programmer_panel import ProgrammerPanel
 from ui.scientific_panel import ScientificPanel
 
 
+_IS_WIN = sys.platform.startswith("win")
+# 颜色校验用的字符集
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_DEC_DIGITS = frozenset("0123456789")
+
+
+def _win_func(dll, name: str, argtypes: list, restype):
+    """
+    函数: _win_func
+    作用: 解析一次 Win32 导出函数并设置 argtypes/restype；不存在时返回 None。
+    参数:
+        dll: ctypes 动态库对象（如 ctypes.windll.user32）。
+        name: 导出函数名。
+        argtypes: 参数类型列表。
+        restype: 返回值类型。
+    返回:
+        绑定好原型的函数对象，或 None（旧系统缺少该导出时）。
+    """
+    try:
+        fn = getattr(dll, name)
+    except AttributeError:
+        return None
+    fn.argtypes = argtypes
+    fn.restype = restype
+    return fn
+
+
+# Win32 函数原型：模块加载时解析一次，避免每次调用重复查找导出与推断参数类型。
+# 调用方仍包在 try 中：缺失的导出为 None，调用时抛出 TypeError 后走各自的回退分支。
+_SetWindowPos = None
+_GetDpiForWindow = None
+_GetSystemMetrics = None
+_GetSystemMetricsForDpi = None
+_DwmSetWindowAttribute = None
+_SetPreferredAppMode = None
+_AllowDarkModeForWindow = None
+if _IS_WIN:
+    from ctypes import wintypes
+
+    try:
+        _user32 = ctypes.windll.user32
+        _SetWindowPos = _win_func(
+            _user32, "SetWindowPos",
+            [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT],
+            wintypes.BOOL,
+        )
+        _GetDpiForWindow = _win_func(_user32, "GetDpiForWindow", [wintypes.HWND], wintypes.UINT)
+        _GetSystemMetrics = _win_func(_user32, "GetSystemMetrics", [ctypes.c_int], ctypes.c_int)
+        _GetSystemMetricsForDpi = _win_func(
+            _user32, "GetSystemMetricsForDpi", [ctypes.c_int, wintypes.UINT], ctypes.c_int
+        )
+    except Exception:
+        pass
+    try:
+        # HRESULT 返回类型：失败码会抛出 OSError，便于按顺序尝试不同属性
+        _DwmSetWindowAttribute = _win_func(
+            ctypes.windll.dwmapi, "DwmSetWindowAttribute",
+            [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD],
+            ctypes.HRESULT,
+        )
+    except Exception:
+        pass
+    try:
+        _uxtheme = ctypes.windll.uxtheme
+        _SetPreferredAppMode = _win_func(_uxtheme, "SetPreferredAppMode", [ctypes.c_int], ctypes.c_int)
+        _AllowDarkModeForWindow = _win_func(
+            _uxtheme, "AllowDarkModeForWindow", [wintypes.HWND, wintypes.BOOL], wintypes.BOOL
+        )
+    except Exception:
+        pass
+
+
+def _stat_mode(path: str) -> int:
+    """
+    函数: _stat_mode
+    作用: 对路径执行一次 os.stat 并返回 st_mode，供目录/文件判断复用。
+    参数:
+        path: 文件或目录路径。
+    返回:
+        int: st_mode；路径不存在或不可访问时返回 0。
+    """
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return 0
+
+
+@functools.lru_cache(maxsize=8)
+def load_qss_cached(path: str) -> str:
+    """
+    函数: load_qss_cached
+    作用: 按绝对路径读取 QSS 内容并缓存（QSS 为静态资源，主题切换时不再重复读盘）；
+          供 app.load_style 与主窗口主题切换共用；
+          读取失败时抛出异常，不写入缓存，下次仍会重试。
+    参数:
+        path: QSS 文件绝对路径。
+    返回:
+        样式字符串。
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _parse_rgb(s: str) -> Optional[tuple]:
+    """
+    函数: _parse_rgb
+    作用: 单遍解析 "rgb(r, g, b)"（前缀不区分大小写；首尾、括号前与分量两侧允许空格），
+          不做大小写转换/替换等中间字符串构建。
+    参数:
+        s: 输入字符串。
+    返回:
+        (r, g, b) 三元组（各 0~255）；格式不符时返回 None。
+    """
+    # 跳过首尾空格
+    i = 0
+    end = len(s)
+    while i < end and s[i] == " ":
+        i += 1
+    while end > i and s[end - 1] == " ":
+        end -= 1
+    if end - i < 10 or s[end - 1] != ")" or s[i:i + 3].lower() != "rgb":
+        return None
+    # 跳过 "rgb" 与 "(" 之间的空格
+    i += 3
+    while i < end and s[i] == " ":
+        i += 1
+    if s[i] != "(":
+        return None
+    i += 1
+    end -= 1
+    vals = []
+    while True:
+        # 跳过分量前空格
+        while i < end and s[i] == " ":
+            i += 1
+        j = i
+        while j < end and s[j] in _DEC_DIGITS:
+            j += 1
+        if j == i or j - i > 3:
+            return None
+        v = int(s[i:j])
+        if v > 255:
+            return None
+        vals.append(v)
+        # 跳过分量后空格，期待逗号或结尾
+        while j < end and s[j] == " ":
+            j += 1
+        if len(vals) == 3:
+            return (vals[0], vals[1], vals[2]) if j == end else None
+        if j >= end or s[j] != ",":
+            return None
+        i = j + 1
+
+
+# sRGB 8 位分量 -> 线性值查找表（WCAG 2.1：u <= 0.04045 即分量 <= 10 时走线性段）
+_SRGB_TO_LIN = tuple(
+    (i / 255.0) / 12.92 if i <= 10 else (((i / 255.0) + 0.055) / 1.055) ** 2.4
+    for i in range(256)
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _rel_luminance(color: str) -> float:
+    """
+    函数: _rel_luminance
+    作用: 计算颜色字符串（HEX 或 rgb(r,g,b)）的相对亮度（WCAG 2.1），按字符串缓存。
+    参数:
+        color: 颜色字符串。
+    返回:
+        相对亮度 0.0~1.0；解析失败时抛出异常（不写入缓存）。
+    """
+    n = len(color)
+    if n == 7 and color[0] == "#":
+        # 常见的 #RRGGBB：直接整数解析，无需构造 QColor
+        v = int(color[1:], 16)
+        r, g, b = (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+    elif n == 4 and color[0] == "#":
+        r, g, b = int(color[1], 16) * 17, int(color[2], 16) * 17, int(color[3], 16) * 17
+    else:
+        rgb = _parse_rgb(color)
+        if rgb is not None:
+            r, g, b = rgb
+        else:
+            c = QColor(color)
+            r, g, b = c.red(), c.green(), c.blue()
+    lut = _SRGB_TO_LIN
+    return 0.2126 * lut[r] + 0.7152 * lut[g] + 0.0722 * lut[b]
+
+
 class MainWindow(QMainWindow):
     """
     类: MainWindow
@@ -65,6 +257,31 @@ class MainWindow(QMainWindow):
          并承载自适应布局的主内容区域。
     """
 
+    # 深色标题栏可用的 DWM (属性, 形参类型) 组合，首次探测成功后缓存
+    _dwm_dark_variant: Optional[tuple] = None
+    # 顶部按钮统一尺寸（逻辑像素，Qt 会按屏幕 DPI 自动缩放），
+    # 与 QSS 中按钮 padding 6px 10px 的设计保持一致
+    _HEADER_BTN_W = 56
+    _HEADER_BTN_H = 36
+    # 无边框窗口边缘缩放的命中宽度（像素）
+    _EDGE_MARGIN = 6
+
+    # 主窗口会调用的标准面板方法，面板创建时一次性绑定
+    _NP_HOOK_NAMES = (
+        "is_in_moyu_mode",
+        "get_moyu_help_text",
+        "set_moyu_mode",
+        "save_moyu_current_page",
+        "show_moyu_disguise",
+        "load_moyu_texts_from_path",
+        "set_minimal_reader_opacity",
+        "set_minimal_reader_theme",
+        "preview_minimal_reader_theme",
+        "adjust_moyu_box_height",
+        "set_minimal_reader_hover_delay",
+        "preview_minimal_reader_hover_delay",
+    )
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """
         函数: __init__
@@ -76,6 +293,13 @@ class MainWindow(QMainWindow):
         """
         super().__init__(parent)
         self.setWindowTitle("计算器")
+        # 尺寸手柄在 _create_size_grip 中创建；先置空，热路径只需判空
+        self._size_grip: Optional[QSizeGrip] = None
+        # 尺寸手柄定位合并到下一轮事件循环，拖动缩放时不再逐事件移动
+        self._grip_timer = QTimer(self)
+        self._grip_timer.setSingleShot(True)
+        self._grip_timer.setInterval(0)
+        self._grip_timer.timeout.connect(self._update_size_grip_geometry)
         try:
             self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         except Exception:
@@ -88,22 +312,54 @@ class MainWindow(QMainWindow):
         self.dark_mode: bool = SettingsService.dark_mode(False)
         # 置顶状态：读取持久化设置（默认不置顶）
         self.pin_on_top: bool = SettingsService.always_on_top(False)
+        # 图标缓存：主题切换/最大化还原时直接复用，避免重复绘制 QPixmap
+        self._icon_cache: dict[tuple, QIcon] = {}
+        # 标题栏三键当前图标对应的 (深色, 最大化) 状态，状态未变时不重复 setIcon
+        self._caption_icons_state: Optional[tuple] = None
+        # 图标配色缓存：按主题存放派生颜色与画笔，调色板变化时清空
+        self._icon_palette_cache: dict[bool, dict] = {}
+        # 系统标题栏度量缓存：按 DPI 存 (标题栏高, 按钮宽, 按钮高)，屏幕切换时清空
+        self._sys_metric_cache: dict[int, tuple] = {}
+        # 鼠标事件热路径使用的缓存引用：标题栏控件与原生窗口句柄（每次显示时刷新）
+        self._title_bar: Optional[QWidget] = None
+        self._cached_window_handle = None
+        # 路径校验等提示复用同一个消息框（首次使用时创建）
+        self._msgbox: Optional[QMessageBox] = None
 
         # 顶部工具区（模式切换按钮）
         header = self._create_header()
         # 自绘系统标题栏（1:1 替换原系统边框，不改变原有内容布局）
         title_bar = self._create_title_bar()
+        # 顶部栏与标题栏按钮统一连接点击信号
+        for btn, slot in (
+            (self.min_btn, self._on_minimize),
+            (self.max_btn, self._on_toggle_max_restore),
+            (self.close_btn, self.close),
+            (self.pin_btn, self._toggle_pin),
+            (self.theme_btn, self._toggle_theme),
+            (self.help_btn, self._show_help),
+            (self.moyu_btn, self._open_moyu_settings_dialog),
+            (self.game_btn, self._open_game_selector_via_scientific),
+        ):
+            btn.clicked.connect(slot)
 
         # 主内容堆栈：普通 / 程序员 / 科学
+        # 仅同步创建默认显示的程序员面板，其余面板在首次使用或空闲时再创建
         self.stack = QStackedWidget()
-        self.normal_panel = NormalPanel(self.memory_store)
-        self.programmer_panel = ProgrammerPanel(self.memory_store, bits=32)
-        self.checksum_panel = ChecksumPanel(self.memory_store)
-        self.scientific_panel = ScientificPanel(self.memory_store, default_angle_mode="deg")
-        self.stack.addWidget(self.normal_panel)
-        self.stack.addWidget(self.programmer_panel)
-        self.stack.addWidget(self.checksum_panel)
-        self.stack.addWidget(self.scientific_panel)
+        self._panel_factories = {
+            "normal": lambda: NormalPanel(self.memory_store),
+            "programmer": lambda: ProgrammerPanel(self.memory_store, bits=32),
+            "checksum": lambda: ChecksumPanel(self.memory_store),
+            "scientific": lambda: ScientificPanel(self.memory_store, default_angle_mode="deg"),
+        }
+        self._panels: dict[str, QWidget] = {}
+        # 面板在堆栈中的索引（addWidget 返回值），切换时直接 setCurrentIndex
+        self._panel_index: dict[str, int] = {}
+        self._index_panel: dict[int, str] = {}
+        # 标准面板摸鱼相关方法的绑定缓存，避免每次调用前 hasattr 探测
+        self._np_hooks: dict[str, object] = {}
+        # 默认显示程序员计算器
+        self._show_panel("programmer")
 
         # 根布局
         root = QWidget()
@@ -114,40 +370,119 @@ class MainWindow(QMainWindow):
         vbox.addWidget(header, 0)
         vbox.addWidget(self.stack, 1)
         self.setCentralWidget(root)
-        try:
-            self._create_size_grip()
-        except Exception:
-            pass
 
-        # 默认显示程序员计算器
-        self.stack.setCurrentWidget(self.programmer_panel)
         # 应用默认置顶状态（若用户曾开启置顶）
         try:
             self.setWindowFlag(Qt.WindowStaysOnTopHint, self.pin_on_top)
         except Exception:
             pass
-        # 启用无边框与自绘标题栏
+        # 启用无边框与自绘标题栏（首次显示前仅设置窗口标志，不创建原生窗口）
         try:
             self._enable_frameless_titlebar()
         except Exception:
             pass
-        # Windows 标题栏与页面主题一致
-        try:
-            self._apply_windows_dark_titlebar(self.dark_mode)
-        except Exception:
-            pass
+        # 尺寸手柄与 Windows 标题栏配色不影响首帧，推迟到事件循环空闲时执行
+        QTimer.singleShot(0, self._post_show_init)
 
         # 全局快捷键：Ctrl+M 进入摸鱼模式；Esc 退出摸鱼模式
         try:
-            self._shortcut_moyu = QShortcut(QKeySequence("Ctrl+M"), self)
-            self._shortcut_moyu.setContext(Qt.WindowShortcut)
-            self._shortcut_moyu.activated.connect(self._shortcut_quick_moyu)
-
-            self._shortcut_exit = QShortcut(QKeySequence("Esc"), self)
-            self._shortcut_exit.setContext(Qt.WindowShortcut)
-            self._shortcut_exit.activated.connect(self._shortcut_exit_moyu)
+            shortcuts = []
+            for seq, slot in (
+                (QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_M), self._shortcut_quick_moyu),
+                (QKeySequence(Qt.Key.Key_Escape), self._shortcut_exit_moyu),
+            ):
+                sc = QShortcut(seq, self)
+                sc.setContext(Qt.WindowShortcut)
+                sc.activated.connect(slot)
+                shortcuts.append(sc)
+            self._shortcut_moyu, self._shortcut_exit = shortcuts
         except Exception:
             pass
+        # 首帧绘制后再在空闲时预建其余面板，首次切换模式时无需等待
+        QTimer.singleShot(0, self._preload_panels)
+
+    def _panel(self, key: str) -> QWidget:
+        """
+        函数: _panel
+        作用: 获取指定模式的面板；首次访问时创建并加入主内容堆栈。
+        参数:
+            key: 面板键（"normal"/"programmer"/"checksum"/"scientific"）。
+        返回:
+            面板 QWidget。
+        """
+        panel = self._panels.get(key)
+        if panel is None:
+            panel = self._panel_factories[key]()
+            self._panels[key] = panel
+            idx = self.stack.addWidget(panel)
+            self._panel_index[key] = idx
+            self._index_panel[idx] = key
+            if key == "normal":
+                self._np_hooks = {name: getattr(panel, name, None) for name in self._NP_HOOK_NAMES}
+        return panel
+
+    def _np(self, name: str):
+        """
+        函数: _np
+        作用: 取标准面板的已绑定方法（构建面板时缓存），不存在时返回 None。
+        参数:
+            name: 方法名，须在 _NP_HOOK_NAMES 中。
+        返回:
+            绑定方法或 None。
+        """
+        self._panel("normal")
+        return self._np_hooks.get(name)
+
+    def _show_panel(self, key: str) -> None:
+        """
+        函数: _show_panel
+        作用: 按预先记录的堆栈索引切换到指定面板（必要时先创建）。
+        参数:
+            key: 面板键。
+        返回:
+            无。
+        """
+        self._panel(key)
+        self.stack.setCurrentIndex(self._panel_index[key])
+
+    def _current_panel_key(self) -> Optional[str]:
+        """
+        函数: _current_panel_key
+        作用: 返回当前显示面板的键。
+        参数:
+            无。
+        返回:
+            面板键；堆栈为空时返回 None。
+        """
+        return self._index_panel.get(self.stack.currentIndex())
+
+    def _preload_panels(self) -> None:
+        """
+        函数: _preload_panels
+        作用: 空闲时创建尚未构建的面板，避免首次切换模式时卡顿。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        for key in self._panel_factories:
+            self._panel(key)
+
+    @property
+    def normal_panel(self) -> NormalPanel:
+        return self._panel("normal")
+
+    @property
+    def programmer_panel(self) -> ProgrammerPanel:
+        return self._panel("programmer")
+
+    @property
+    def checksum_panel(self) -> ChecksumPanel:
+        return self._panel("checksum")
+
+    @property
+    def scientific_panel(self) -> ScientificPanel:
+        return self._panel("scientific")
 
     def _create_size_grip(self) -> None:
         """
@@ -161,9 +496,11 @@ class MainWindow(QMainWindow):
         try:
             self._size_grip = QSizeGrip(self)
             self._size_grip.setToolTip("拖动调整窗口大小")
+            # 手柄尺寸固定，缓存后定位时无需再查询
+            self._size_grip_size = QSize(18, 18)
             try:
                 # 统一手柄尺寸，便于点击与拖动
-                self._size_grip.setFixedSize(QSize(18, 18))
+                self._size_grip.setFixedSize(self._size_grip_size)
             except Exception:
                 pass
             self._update_size_grip_geometry()
@@ -180,16 +517,13 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        try:
-            if not hasattr(self, "_size_grip") or self._size_grip is None:
-                return
-            r = self.rect()
-            sz = self._size_grip.size()
-            x = max(0, r.right() - sz.width() - 2)
-            y = max(0, r.bottom() - sz.height() - 2)
-            self._size_grip.move(x, y)
-        except Exception:
-            pass
+        if self._size_grip is None:
+            return
+        r = self.rect()
+        sz = self._size_grip_size
+        x = max(0, r.right() - sz.width() - 2)
+        y = max(0, r.bottom() - sz.height() - 2)
+        self._size_grip.move(x, y)
 
     def resizeEvent(self, event) -> None:
         """
@@ -200,14 +534,9 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        try:
-            super().resizeEvent(event)
-        except Exception:
-            pass
-        try:
-            self._update_size_grip_geometry()
-        except Exception:
-            pass
+        super().resizeEvent(event)
+        if self._size_grip is not None:
+            self._grip_timer.start()
 
     def _create_header(self) -> QWidget:
         """
@@ -250,10 +579,6 @@ class MainWindow(QMainWindow):
         self.game_btn.setText("选择")
         self.game_btn.setToolTip("隐藏游戏选择")
         self.game_btn.setVisible(False)
-        try:
-            self.game_btn.clicked.connect(self._open_game_selector_via_scientific)
-        except Exception:
-            pass
 
         # 隐藏摸鱼设置按钮：初始隐藏，解锁后显示，位于“模式”按钮之后
         self.moyu_btn = QToolButton()
@@ -265,10 +590,6 @@ class MainWindow(QMainWindow):
             self.moyu_btn.setPopupMode(QToolButton.DelayedPopup)
         except Exception:
             pass
-        try:
-            self.moyu_btn.clicked.connect(self._open_moyu_settings_dialog)
-        except Exception:
-            pass
 
         # 摸鱼路径粘贴框：位于当前模式标题之后，默认隐藏
         self.moyu_path_edit = QLineEdit()
@@ -288,34 +609,23 @@ class MainWindow(QMainWindow):
         self.pin_btn.setCheckable(True)
         self.pin_btn.setChecked(self.pin_on_top)
         self.pin_btn.setToolTip("窗口置顶")
-        self.pin_btn.clicked.connect(self._toggle_pin)
         self._update_pin_button_label()
 
         # 日/夜切换
         self.theme_btn = QToolButton()
         self.theme_btn.setToolTip("浅色/深色切换")
-        self.theme_btn.clicked.connect(self._toggle_theme)
         # 初始化图标/提示（稍后统一按钮尺寸后再设置 iconSize）
 
         # 帮助按钮
         self.help_btn = QToolButton()
         self.help_btn.setText("?")
         self.help_btn.setToolTip("使用说明")
-        self.help_btn.clicked.connect(self._show_help)
 
         # 统一四个按钮的固定尺寸（模式后的“设置”、置顶、主题、帮助）
-        size_hint_moyu = self.moyu_btn.sizeHint()
-        size_hint_pin = self.pin_btn.sizeHint()
-        size_hint_theme = self.theme_btn.sizeHint()
-        size_hint_help = self.help_btn.sizeHint()
-        fixed_w = max(size_hint_moyu.width(), size_hint_pin.width(), size_hint_theme.width(), size_hint_help.width())
-        fixed_h = max(size_hint_moyu.height(), size_hint_pin.height(), size_hint_theme.height(), size_hint_help.height())
-        fixed_size = QSize(fixed_w, fixed_h)
-        self.moyu_btn.setFixedSize(fixed_size)
-        self.game_btn.setFixedSize(fixed_size)
-        self.pin_btn.setFixedSize(fixed_size)
-        self.theme_btn.setFixedSize(fixed_size)
-        self.help_btn.setFixedSize(fixed_size)
+        fixed_h = self._HEADER_BTN_H
+        fixed_size = QSize(self._HEADER_BTN_W, fixed_h)
+        for b in (self.moyu_btn, self.game_btn, self.pin_btn, self.theme_btn, self.help_btn):
+            b.setFixedSize(fixed_size)
 
         # 在相同按钮尺寸下，增大主题按钮的 iconSize（占按钮高度约 82%）
         icon_dim = int(fixed_h * 0.90)
@@ -352,10 +662,7 @@ class MainWindow(QMainWindow):
             bar.setObjectName("titleBar")
         except Exception:
             pass
-        try:
-            self._title_bar = bar
-        except Exception:
-            pass
+        self._title_bar = bar
         lay = QHBoxLayout(bar)
         lay.setContentsMargins(6, 0, 0, 0)
         lay.setSpacing(0)
@@ -366,11 +673,10 @@ class MainWindow(QMainWindow):
         # 右侧系统控制按钮
         self.min_btn = QToolButton()
         try:
-            self.min_btn.setIcon(self._make_caption_icon("min"))
+            self.min_btn.setIcon(self._caption_icon_cached("min"))
         except Exception:
             self.min_btn.setText("—")
         self.min_btn.setToolTip("最小化")
-        self.min_btn.clicked.connect(self._on_minimize)
         try:
             self.min_btn.setObjectName("winMinBtn")
             self.min_btn.setAutoRaise(True)
@@ -379,11 +685,10 @@ class MainWindow(QMainWindow):
 
         self.max_btn = QToolButton()
         try:
-            self.max_btn.setIcon(self._make_caption_icon("max"))
+            self.max_btn.setIcon(self._caption_icon_cached("max"))
         except Exception:
             self.max_btn.setText("□")
         self.max_btn.setToolTip("最大化/还原")
-        self.max_btn.clicked.connect(self._on_toggle_max_restore)
         try:
             self.max_btn.setObjectName("winMaxBtn")
             self.max_btn.setAutoRaise(True)
@@ -392,11 +697,10 @@ class MainWindow(QMainWindow):
 
         self.close_btn = QToolButton()
         try:
-            self.close_btn.setIcon(self._make_caption_icon("close"))
+            self.close_btn.setIcon(self._caption_icon_cached("close"))
         except Exception:
             self.close_btn.setText("×")
         self.close_btn.setToolTip("关闭")
-        self.close_btn.clicked.connect(self.close)
         try:
             self.close_btn.setObjectName("winCloseBtn")
             self.close_btn.setAutoRaise(True)
@@ -444,7 +748,7 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        self.stack.setCurrentWidget(self.normal_panel)
+        self._show_panel("normal")
         try:
             self.game_btn.setVisible(False)
         except Exception:
@@ -460,7 +764,7 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        self.stack.setCurrentWidget(self.programmer_panel)
+        self._show_panel("programmer")
         try:
             self.game_btn.setVisible(False)
         except Exception:
@@ -476,7 +780,7 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        self.stack.setCurrentWidget(self.checksum_panel)
+        self._show_panel("checksum")
         try:
             self.game_btn.setVisible(False)
         except Exception:
@@ -492,7 +796,7 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        self.stack.setCurrentWidget(self.scientific_panel)
+        self._show_panel("scientific")
         try:
             self.game_btn.setVisible(False)
         except Exception:
@@ -508,13 +812,16 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
+        key = self._current_panel_key()
         widget = self.stack.currentWidget()
         title = f"使用说明 - {self.title_label.text()}"
         text = "暂无使用说明"
         try:
             # 标准计算器处于摸鱼模式时，显示摸鱼说明；否则显示各面板的普通说明
-            if widget is self.normal_panel and hasattr(self.normal_panel, "is_in_moyu_mode") and self.normal_panel.is_in_moyu_mode() and hasattr(self.normal_panel, "get_moyu_help_text"):
-                text = self.normal_panel.get_moyu_help_text()
+            in_moyu = self._np_hooks.get("is_in_moyu_mode")
+            get_moyu_help = self._np_hooks.get("get_moyu_help_text")
+            if key == "normal" and in_moyu is not None and in_moyu() and get_moyu_help is not None:
+                text = get_moyu_help()
             elif hasattr(widget, "get_help_text"):
                 text = widget.get_help_text()
         except Exception:
@@ -617,7 +924,7 @@ class MainWindow(QMainWindow):
             无。
         """
         angle = 180 if self.dark_mode else 0
-        self.theme_btn.setIcon(self._make_yinyang_icon(angle))
+        self.theme_btn.setIcon(self._yinyang_icon_cached(angle))
         self.theme_btn.setIconSize(self.theme_btn.iconSize())
         if self.dark_mode:
             self.theme_btn.setToolTip("切换为浅色主题")
@@ -688,7 +995,7 @@ class MainWindow(QMainWindow):
             无。
         """
         try:
-            if self.stack.currentWidget() is not self.normal_panel:
+            if self._current_panel_key() != "normal":
                 self._switch_to_normal()
             init_path = SettingsService.moyu_path("")
             init_opacity = SettingsService.minimal_opacity_percent(100)
@@ -716,29 +1023,48 @@ class MainWindow(QMainWindow):
                 # 取消：恢复持久化透明度预览，并隐藏设置按钮
                 current = SettingsService.minimal_opacity_percent(100)
                 try:
-                    if hasattr(self.normal_panel, "set_minimal_reader_opacity"):
-                        self.normal_panel.set_minimal_reader_opacity(int(current))
+                    fn = self._np("set_minimal_reader_opacity")
+                    if fn is not None:
+                        fn(int(current))
                 except Exception:
                     pass
                 d_saved = SettingsService.minimal_hover_delay_ms(1500)
                 try:
-                    if hasattr(self.normal_panel, "preview_minimal_reader_hover_delay"):
-                        self.normal_panel.preview_minimal_reader_hover_delay(int(d_saved))
+                    fn = self._np("preview_minimal_reader_hover_delay")
+                    if fn is not None:
+                        fn(int(d_saved))
                 except Exception:
                     pass
                 try:
                     theme_saved = self._get_saved_theme_for_preview()
-                    if hasattr(self.normal_panel, "preview_minimal_reader_theme"):
-                        self.normal_panel.preview_minimal_reader_theme(theme_saved)
+                    fn = self._np("preview_minimal_reader_theme")
+                    if fn is not None:
+                        fn(theme_saved)
                 except Exception:
                     pass
                 try:
                     self.moyu_btn.setVisible(False)
                 except Exception:
                     pass
+            # 对话框以主窗口为父对象，用完即释放，不随每次打开累积
+            dlg.deleteLater()
         except Exception:
             pass
 
+    def preview_minimal_reader_opacity(self, percent: int) -> None:
+        """
+        函数: preview_minimal_reader_opacity
+        作用: 将设置对话框中的透明度预览值应用到极简阅读窗口；
+              连续输入已由对话框的预览防抖合并，此处直接应用。
+        参数:
+            percent: 透明度（1~100）。
+        返回:
+            无。
+        """
+        fn = self._np("set_minimal_reader_opacity")
+        if fn is not None:
+            fn(int(percent))
+
     def _apply_moyu_settings(self, path: str, opacity: int, hide_button: bool, theme: dict | None = None, hover_delay_ms: int | None = None) -> bool:
         """
         函数: _apply_moyu_settings
@@ -754,29 +1080,33 @@ class MainWindow(QMainWindow):
             # 透明度持久化与即时应用
             p = SettingsService.set_minimal_opacity_percent(int(opacity))
             try:
-                if hasattr(self.normal_panel, "set_minimal_reader_opacity"):
-                    self.normal_panel.set_minimal_reader_opacity(p)
+                fn = self._np("set_minimal_reader_opacity")
+                if fn is not None:
+                    fn(p)
             except Exception:
                 pass
             # 路径校验并加载
             if path:
-                if os.path.isdir(path):
+                if stat.S_ISDIR(_stat_mode(path)):
                     SettingsService.set_moyu_path(path)
-                    if hasattr(self.normal_panel, "load_moyu_texts_from_path"):
-                        self.normal_panel.load_moyu_texts_from_path(path)
+                    fn = self._np("load_moyu_texts_from_path")
+                    if fn is not None:
+                        fn(path)
                 else:
-                    QMessageBox.warning(self, "错误", f"非有效目录: {path}")
+                    self._show_message("错误", f"非有效目录: {path}", QMessageBox.Warning)
                     return False
             if theme:
                 try:
-                    if hasattr(self.normal_panel, "set_minimal_reader_theme"):
-                        self.normal_panel.set_minimal_reader_theme(theme, persist=True)
+                    fn = self._np("set_minimal_reader_theme")
+                    if fn is not None:
+                        fn(theme, persist=True)
                 except Exception:
                     pass
             if hover_delay_ms is not None:
                 try:
-                    if hasattr(self.normal_panel, "set_minimal_reader_hover_delay"):
-                        self.normal_panel.set_minimal_reader_hover_delay(int(hover_delay_ms))
+                    fn = self._np("set_minimal_reader_hover_delay")
+                    if fn is not None:
+                        fn(int(hover_delay_ms))
                 except Exception:
                     pass
             if hide_button:
@@ -796,6 +1126,27 @@ class MainWindow(QMainWindow):
         except Exception:
             return False
 
+    def _show_message(self, title: str, text: str, icon: QMessageBox.Icon) -> None:
+        """
+        函数: _show_message
+        作用: 以模态方式显示提示；复用同一个 QMessageBox，避免反复构建对话框控件树。
+        参数:
+            title: 标题。
+            text: 提示文本。
+            icon: 图标类型（Information/Warning 等）。
+        返回:
+            无。
+        """
+        box = self._msgbox
+        if box is None:
+            box = QMessageBox(self)
+            box.setStandardButtons(QMessageBox.Ok)
+            self._msgbox = box
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setIcon(icon)
+        box.exec()
+
     def _get_saved_theme_for_preview(self) -> dict:
         """
         函数: _get_saved_theme_for_preview
@@ -828,14 +1179,15 @@ class MainWindow(QMainWindow):
         try:
             path = self.moyu_path_edit.text().strip()
             if not path:
-                QMessageBox.information(self, "提示", "请输入电子书目录路径")
+                self._show_message("提示", "请输入电子书目录路径", QMessageBox.Information)
                 return
-            if not os.path.isdir(path):
-                QMessageBox.warning(self, "错误", f"非有效目录: {path}")
+            if not stat.S_ISDIR(_stat_mode(path)):
+                self._show_message("错误", f"非有效目录: {path}", QMessageBox.Warning)
                 return
             # 调用标准面板加载逻辑
-            if hasattr(self.normal_panel, "load_moyu_texts_from_path"):
-                self.normal_panel.load_moyu_texts_from_path(path)
+            fn = self._np("load_moyu_texts_from_path")
+            if fn is not None:
+                fn(path)
             # 成功后隐藏路径框与设置按钮
             self.moyu_path_edit.setVisible(False)
             self.moyu_btn.setVisible(False)
@@ -853,24 +1205,17 @@ class MainWindow(QMainWindow):
         """
         try:
             # 切到标准计算器以便显示摸鱼文本窗口
-            if self.stack.currentWidget() is not self.normal_panel:
+            if self._current_panel_key() != "normal":
                 self._switch_to_normal()
             # 尝试读取持久化路径
             saved = SettingsService.moyu_path("")
-            if saved and os.path.isdir(saved):
+            if saved and stat.S_ISDIR(_stat_mode(saved)):
                 last = SettingsService.moyu_last_file("")
-                try:
-                    if last:
-                        fp = os.path.join(saved, last)
-                        if os.path.isfile(fp):
-                            try:
-                                setattr(self.normal_panel, "_moyu_force_file", str(last))
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
-                if hasattr(self.normal_panel, "load_moyu_texts_from_path"):
-                    self.normal_panel.load_moyu_texts_from_path(saved)
+                if last and stat.S_ISREG(_stat_mode(os.path.join(saved, last))):
+                    self.normal_panel._moyu_force_file = str(last)
+                fn = self._np("load_moyu_texts_from_path")
+                if fn is not None:
+                    fn(saved)
                 # 保持顶部路径框隐藏，用户需要再配置时可点击“设置”
                 self.moyu_path_edit.setVisible(False)
             else:
@@ -889,46 +1234,35 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        try:
-            # 退出摸鱼模式标志（用于帮助说明恢复）
-            if hasattr(self.normal_panel, "set_moyu_mode"):
-                try:
-                    self.normal_panel.set_moyu_mode(False)
-                except Exception:
-                    pass
-            # 退出前先保存当前页码，便于下次恢复
-            if hasattr(self.normal_panel, "save_moyu_current_page"):
-                try:
-                    self.normal_panel.save_moyu_current_page()
-                except Exception:
-                    pass
-            # 退出摸鱼时进行伪装：显示随机数学公式，隐藏页码
-            if hasattr(self.normal_panel, "show_moyu_disguise"):
-                try:
-                    self.normal_panel.show_moyu_disguise()
-                except Exception:
-                    # 回退策略：若伪装失败则仍隐藏文本视图
-                    if hasattr(self.normal_panel, "moyu_view"):
-                        self.normal_panel.moyu_view.setVisible(False)
-            elif hasattr(self.normal_panel, "moyu_view"):
-                # 无伪装能力时回退为隐藏
-                self.normal_panel.moyu_view.setVisible(False)
-            # 隐藏标准面板内的路径框（若存在且可见）
-            if hasattr(self.normal_panel, "moyu_path_edit"):
-                try:
-                    self.normal_panel.moyu_path_edit.setVisible(False)
-                except Exception:
-                    pass
-            # 隐藏页码标签（伪装文本不显示页码）
-            if hasattr(self.normal_panel, "moyu_page_label"):
-                try:
-                    self.normal_panel.moyu_page_label.setVisible(False)
-                except Exception:
-                    pass
-            self.moyu_path_edit.setVisible(False)
-            # 保持当前模式不变（若用户在标准模式则继续保留）
-        except Exception:
-            pass
+        np = self.normal_panel
+        # 退出摸鱼模式标志（用于帮助说明恢复）
+        fn = self._np("set_moyu_mode")
+        if fn is not None:
+            fn(False)
+        # 退出前先保存当前页码，便于下次恢复
+        fn = self._np("save_moyu_current_page")
+        if fn is not None:
+            fn()
+        # 退出摸鱼时进行伪装：显示随机数学公式，隐藏页码
+        view = getattr(np, "moyu_view", None)
+        show_disguise = self._np("show_moyu_disguise")
+        if show_disguise is not None:
+            try:
+                show_disguise()
+            except Exception:
+                # 回退策略：若伪装失败则仍隐藏文本视图
+                if view is not None:
+                    view.setVisible(False)
+        elif view is not None:
+            # 无伪装能力时回退为隐藏
+            view.setVisible(False)
+        # 隐藏标准面板内的路径框与页码标签（伪装文本不显示页码）
+        for name in ("moyu_path_edit", "moyu_page_label"):
+            w = getattr(np, name, None)
+            if w is not None:
+                w.setVisible(False)
+        self.moyu_path_edit.setVisible(False)
+        # 保持当前模式不变（若用户在标准模式则继续保留）
 
     def _toggle_pin(self) -> None:
         """
@@ -955,30 +1289,36 @@ class MainWindow(QMainWindow):
             return
         qss_name = "style_dark.qss" if dark else "style.qss"
         qss = self._read_qss(qss_name)
-        if qss:
-            app.setStyleSheet(qss)
+        if not qss:
+            return
+        # 冻结重绘：批量修改完成后统一刷新一次，避免中间状态多次重绘
+        self.setUpdatesEnabled(False)
+        try:
             self.dark_mode = dark
             # 持久化主题选择
             SettingsService.set_dark_mode(dark)
+            # 同步标题栏三键图标颜色（尤其是最小化短横线）
+            self._sync_caption_icons()
+            # 同步 Windows 标题栏颜色
+            if _IS_WIN:
+                try:
+                    self._apply_windows_dark_titlebar(dark)
+                except Exception:
+                    pass
+            # 样式表放在图标修改之后，让各控件只重新 polish 一次
+            app.setStyleSheet(qss)
+            # ☯ 图标取色依赖新样式下的调色板，须在样式表生效后生成
             self._update_theme_button_label()
             # 主题切换后重算摸鱼区域高度，避免字体变化导致三行显示不完整
             try:
-                if hasattr(self.normal_panel, "adjust_moyu_box_height"):
-                    self.normal_panel.adjust_moyu_box_height()
-            except Exception:
-                pass
-            # 同步 Windows 标题栏颜色
-            try:
-                self._apply_windows_dark_titlebar(dark)
-            except Exception:
-                pass
-            # 同步标题栏三键图标颜色（尤其是最小化短横线）
-            try:
-                self.min_btn.setIcon(self._make_caption_icon("min"))
-                self.max_btn.setIcon(self._make_caption_icon("restore" if self.isMaximized() else "max"))
-                self.close_btn.setIcon(self._make_caption_icon("close"))
+                fn = self._np_hooks.get("adjust_moyu_box_height")
+                if fn is not None:
+                    fn()
             except Exception:
                 pass
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def _apply_pin(self, on_top: bool) -> None:
         """
@@ -989,56 +1329,50 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
+        # 状态未变化时跳过：回退路径会重建原生窗口，重复切换只会带来闪烁
+        if on_top == self.pin_on_top and getattr(self, "_pin_ever_applied", False):
+            return
+        self._pin_ever_applied = True
         self.pin_on_top = on_top
         # Windows 下优先使用 Win32 API 切换置顶，避免窗口重建导致的闪烁
         applied = False
-        if sys.platform.startswith("win"):
+        if _IS_WIN:
             applied = self._set_topmost_win32(on_top)
         if not applied:
-            # 其他平台或 Win32 调用失败时，回退到 Qt 标志位方案
-            self.setWindowFlag(Qt.WindowStaysOnTopHint, on_top)
+            # 其他平台或 Win32 调用失败时，回退到 Qt 标志位方案；冻结重绘以减少闪烁
+            self.setUpdatesEnabled(False)
             try:
+                self.setWindowFlag(Qt.WindowStaysOnTopHint, on_top)
                 self.show()
             except Exception:
                 pass
+            finally:
+                self.setUpdatesEnabled(True)
         SettingsService.set_always_on_top(on_top)
         # 保持按钮选中状态与文案同步
-        try:
-            self.pin_btn.setChecked(on_top)
-        except Exception:
-            pass
+        self.pin_btn.setChecked(on_top)
         self._update_pin_button_label()
         # 主程序置顶时，取消极简窗口置顶；避免两者抢占前台
-        try:
-            if on_top:
-                if hasattr(self, "normal_panel") and hasattr(self.normal_panel, "_minimal_reader"):
-                    dlg = getattr(self.normal_panel, "_minimal_reader")
-                    if dlg is not None:
-                        try:
-                            dlg.setWindowFlag(Qt.WindowStaysOnTopHint, False)
-                            dlg.show()
-                        except Exception:
-                            pass
-        except Exception:
-            pass
+        if on_top:
+            np = self._panels.get("normal")
+            dlg = getattr(np, "_minimal_reader", None) if np is not None else None
+            if dlg is not None:
+                try:
+                    dlg.setWindowFlag(Qt.WindowStaysOnTopHint, False)
+                    dlg.show()
+                except Exception:
+                    pass
 
         # 与所有小游戏窗口置顶互斥：
         # - 主窗置顶时取消所有已打开小游戏置顶；主窗取消置顶时恢复小游戏置顶
-        try:
-            if hasattr(self, "scientific_panel"):
-                for name in ("_game_2048_dialog", "_game_snake_dialog", "_game_minesweeper_dialog", "_game_gomoku_dialog"):
-                    try:
-                        dlg = getattr(self.scientific_panel, name, None)
-                    except Exception:
-                        dlg = None
-                    if dlg is not None:
-                        try:
-                            dlg.setWindowFlag(Qt.WindowStaysOnTopHint, not on_top)
-                            dlg.show()
-                        except Exception:
-                            pass
-        except Exception:
-            pass
+        sp = self._panels.get("scientific")
+        if sp is not None:
+            for dlg in sp.iter_game_dialogs():
+                try:
+                    dlg.setWindowFlag(Qt.WindowStaysOnTopHint, not on_top)
+                    dlg.show()
+                except Exception:
+                    pass
 
     def _set_topmost_win32(self, on_top: bool) -> bool:
         """
@@ -1060,7 +1394,7 @@ class MainWindow(QMainWindow):
             hwnd = int(self.winId())
             flags = SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE | SWP_SHOWWINDOW
             hpos = HWND_TOPMOST if on_top else HWND_NOTOPMOST
-            res = ctypes.windll.user32.SetWindowPos(hwnd, hpos, 0, 0, 0, 0, flags)
+            res = _SetWindowPos(hwnd, hpos, 0, 0, 0, 0, flags)
             return bool(res)
         except Exception:
             return False
@@ -1068,7 +1402,7 @@ class MainWindow(QMainWindow):
     def _read_qss(self, file_name: str) -> str:
         """
         函数: _read_qss
-        作用: 读取 resources 目录下的 QSS 文件内容。
+        作用: 读取 resources 目录下的 QSS 文件内容（经模块级缓存，仅首次读盘）。
         参数:
             file_name: QSS 文件名，例如 "style.qss" 或 "style_dark.qss"。
         返回:
@@ -1081,8 +1415,7 @@ class MainWindow(QMainWindow):
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         qss_path = os.path.join(base_dir, "resources", file_name)
         try:
-            with open(qss_path, "r", encoding="utf-8") as f:
-                return f.read()
+            return load_qss_cached(os.path.abspath(qss_path))
         except Exception:
             return ""
 
@@ -1090,58 +1423,123 @@ class MainWindow(QMainWindow):
         """
         函数: _apply_windows_dark_titlebar
         作用: 在 Windows 10/11 上切换沉浸式深色标题栏，使其与页面主题一致。
+              仅限 Windows：调用方需先判断模块级 _IS_WIN。
         参数:
             dark: True 使用深色标题栏；False 使用浅色标题栏。
         返回:
             无。
         """
-        if not sys.platform.startswith("win"):
-            return
         try:
             hwnd = int(self.winId())
         except Exception:
             return
+        # 同一原生窗口已按相同主题设置过则跳过；窗口重建（句柄变化）后会重新应用
+        state = (hwnd, bool(dark))
+        if getattr(self, "_last_dark_titlebar", None) == state:
+            return
+        # 仅在窗口可见后记录：部分 Win10 版本需可见后再次调用才生效
+        if self.isVisible():
+            self._last_dark_titlebar = state
         # 应用层偏好：优先开启应用暗色模式（Win10 1809+）
         try:
-            uxtheme = ctypes.windll.uxtheme
-            if hasattr(uxtheme, "SetPreferredAppMode"):
+            if _SetPreferredAppMode is not None:
                 # 2=ForceDark, 1=AllowDarkMode；浅色时回退为 Allow 以跟随系统
-                uxtheme.SetPreferredAppMode(2 if dark else 1)
+                _SetPreferredAppMode(2 if dark else 1)
         except Exception:
             pass
         # 允许窗口使用暗色标题栏
         try:
-            uxtheme = ctypes.windll.uxtheme
-            if hasattr(uxtheme, "AllowDarkModeForWindow"):
-                uxtheme.AllowDarkModeForWindow(hwnd, 1 if dark else 0)
+            if _AllowDarkModeForWindow is not None:
+                _AllowDarkModeForWindow(hwnd, 1 if dark else 0)
         except Exception:
             pass
-        # DWM 属性：优先 20，再尝试 19；分别测试 int 与 bool 形参
-        try:
-            val_i = ctypes.c_int(1 if dark else 0)
-            sz_i = ctypes.sizeof(ctypes.c_int)
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, 20, ctypes.byref(val_i), sz_i)
+        # DWM 属性：优先 20，再尝试 19；分别测试 int 与 bool 形参。
+        # 首次成功的 (属性, 形参类型) 记为类级缓存，之后只调用该组合
+        variant = MainWindow._dwm_dark_variant
+        if variant is not None:
+            attr, ctype = variant
+            try:
+                val = ctype(1 if dark else 0)
+                _DwmSetWindowAttribute(hwnd, attr, ctypes.byref(val), ctypes.sizeof(ctype))
+                return
+            except Exception:
+                # 缓存组合失效（如系统更新后），重新探测
+                MainWindow._dwm_dark_variant = None
+        for attr, ctype in ((20, ctypes.c_int), (20, ctypes.c_bool), (19, ctypes.c_int)):
+            try:
+                val = ctype(1 if dark else 0)
+                _DwmSetWindowAttribute(hwnd, attr, ctypes.byref(val), ctypes.sizeof(ctype))
+            except Exception:
+                continue
+            MainWindow._dwm_dark_variant = (attr, ctype)
             return
-        except Exception:
-            pass
-        try:
-            val_b = ctypes.c_bool(bool(dark))
-            sz_b = ctypes.sizeof(ctypes.c_bool)
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, 20, ctypes.byref(val_b), sz_b)
+
+    def _yinyang_icon_cached(self, angle: int = 0) -> QIcon:
+        """
+        函数: _yinyang_icon_cached
+        作用: 按（角度、主题、图标尺寸）缓存“☯”图标，命中时不再重新绘制。
+        参数:
+            angle: 旋转角度（0 或 180）。
+        返回:
+            QIcon 图标对象。
+        """
+        icon_sz = self.theme_btn.iconSize()
+        key = ("yy", angle, self.dark_mode, icon_sz.width(), icon_sz.height())
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = self._make_yinyang_icon(angle)
+            self._icon_cache[key] = icon
+        return icon
+
+    def _sync_caption_icons(self) -> None:
+        """
+        函数: _sync_caption_icons
+        作用: 按当前主题与最大化状态设置标题栏三键图标；已显示相同图标时跳过。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        state = (self.dark_mode, self.isMaximized())
+        if self._caption_icons_state == state:
             return
-        except Exception:
-            pass
         try:
-            val_i = ctypes.c_int(1 if dark else 0)
-            sz_i = ctypes.sizeof(ctypes.c_int)
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, 19, ctypes.byref(val_i), sz_i)
+            self.min_btn.setIcon(self._caption_icon_cached("min"))
+            self.max_btn.setIcon(self._caption_icon_cached("restore" if state[1] else "max"))
+            self.close_btn.setIcon(self._caption_icon_cached("close"))
+            self._caption_icons_state = state
         except Exception:
             pass
 
+    def _caption_icon_cached(self, kind: str, dark: Optional[bool] = None) -> QIcon:
+        """
+        函数: _caption_icon_cached
+        作用: 按（类型、主题）缓存标题栏系统按钮图标，命中时不再重新绘制。
+        参数:
+            kind: 图标类型（"min"/"max"/"restore"/"close"）。
+            dark: 主题，None 表示使用当前主题。
+        返回:
+            QIcon 图标对象。
+        """
+        if dark is None:
+            dark = self.dark_mode
+        key = ("cap", kind, dark)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = self._make_caption_icon(kind, dark)
+            self._icon_cache[key] = icon
+        return icon
+
+    # “☯”字形路径缓存：按图标尺寸存放已居中的路径，避免重复字形排版
+    _yy_path_cache: dict[int, QPainterPath] = {}
+    # 图标预渲染的设备像素比：一个 QIcon 覆盖常见缩放，跨屏/DPI 变化时无需重绘
+    _ICON_DPRS = (1.0, 1.5, 2.0, 3.0)
+
     def _make_yinyang_icon(self, angle: int = 0) -> QIcon:
         """
         函数: _make_yinyang_icon
-        作用: 生成“☯”图标：带圆形底纹、半透明描边、抗锯齿，并按角度旋转（用于日/夜切换按钮）。
+        作用: 生成“☯”图标：带圆形底纹、半透明描边、抗锯齿，并按角度旋转（用于日/夜切换按钮）；
+              按多个设备像素比预渲染，加入同一个 QIcon。
         参数:
             angle: 旋转角度（0 或 180）。
         返回:
@@ -1150,27 +1548,116 @@ class MainWindow(QMainWindow):
         # 以按钮当前 iconSize 为基准，确保与“?”按钮一致
         icon_sz = self.theme_btn.iconSize()
         size = max(16, max(icon_sz.width(), icon_sz.height()))
-        pix = QPixmap(size, size)
+        icon = QIcon()
+        for dpr in self._ICON_DPRS:
+            icon.addPixmap(self._render_yinyang_pixmap(angle, size, dpr))
+        return icon
+
+    def _render_yinyang_pixmap(self, angle: int, size: int, dpr: float) -> QPixmap:
+        """
+        函数: _render_yinyang_pixmap
+        作用: 按逻辑尺寸与设备像素比绘制一张“☯”图标位图。
+        参数:
+            angle: 旋转角度（0 或 180）。
+            size: 逻辑边长（像素）。
+            dpr: 设备像素比。
+        返回:
+            QPixmap 位图（已设置 devicePixelRatio）。
+        """
+        # 绘制结果只取决于尺寸/主题/角度/像素比，命中缓存直接复用
+        key = f"yy:{size}:{int(self.dark_mode)}:{angle}:{dpr}"
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            return cached
+        side = int(round(size * dpr))
+        pix = QPixmap(side, side)
+        pix.setDevicePixelRatio(dpr)
         pix.fill(Qt.transparent)
         painter = QPainter(pix)
         painter.setRenderHint(QPainter.Antialiasing, True)
+        if angle % 360 != 0:
+            # 绕中心旋转（逻辑坐标系），替代绘制后再对位图做变换
+            painter.translate(size / 2, size / 2)
+            painter.rotate(angle)
+            painter.translate(-size / 2, -size / 2)
+        ip = self._icon_palette(self.dark_mode)
         # 底纹：使用按钮颜色并根据主题进行明暗调整
-        pal = self.palette()
-        bg = pal.color(QPalette.Button)
-        if self.dark_mode:
+        painter.setBrush(ip["bg"])
+        painter.setPen(ip["edge_pen"])
+        painter.drawEllipse(QRect(0, 0, size, size).adjusted(2, 2, -2, -2))
+
+        # 前景：根据主题选择高对比色，并使用半透明描边
+        path = self._yinyang_glyph_path(size)
+        painter.setBrush(ip["fg"])
+        painter.setPen(ip["outline_pen"])
+        painter.drawPath(path)
+        painter.end()
+        QPixmapCache.insert(key, pix)
+        return pix
+
+    def _icon_palette(self, dark: bool) -> dict:
+        """
+        函数: _icon_palette
+        作用: 返回某主题下图标绘制所用的颜色与画笔（☯底纹/描边/前景、标题栏按钮画笔），
+              按主题缓存；窗口调色板变化时清空。
+        参数:
+            dark: 是否深色主题。
+        返回:
+            dict: bg/edge_pen/fg/outline_pen/caption_pen。
+        """
+        ip = self._icon_palette_cache.get(dark)
+        if ip is not None:
+            return ip
+        bg = self.palette().color(QPalette.Button)
+        if dark:
             bg = bg.lighter(120)  # 暗色下略提亮
         else:
             bg = bg.darker(115)   # 浅色下略加深
-        painter.setBrush(bg)
         edge_col = bg.darker(130)
         edge_col.setAlpha(140)
-        painter.setPen(QPen(edge_col, 1))
-        painter.drawEllipse(pix.rect().adjusted(2, 2, -2, -2))
-
-        # 前景：根据主题选择高对比色，并使用半透明描边
-        fg = QColor(255, 255, 255) if self.dark_mode else QColor(0, 0, 0)
+        fg = QColor(255, 255, 255) if dark else QColor(0, 0, 0)
         outline = QColor(fg)
         outline.setAlpha(120)
+        # 标题栏按钮：在深色下略提亮，浅色下略加深
+        col = fg.lighter(110) if dark else fg.darker(130)
+        caption_pen = QPen(col, 1, Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin)
+        caption_pen.setWidthF(1.2)
+        ip = {
+            "bg": bg,
+            "edge_pen": QPen(edge_col, 1),
+            "fg": fg,
+            "outline_pen": QPen(outline, 1.4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin),
+            "caption_pen": caption_pen,
+        }
+        self._icon_palette_cache[dark] = ip
+        return ip
+
+    def changeEvent(self, event) -> None:
+        """
+        函数: changeEvent
+        作用: 调色板变化（主题 QSS 切换）时清空图标配色缓存。
+        参数:
+            event: 变化事件。
+        返回:
+            无。
+        """
+        if event.type() == QEvent.PaletteChange:
+            self._icon_palette_cache.clear()
+        super().changeEvent(event)
+
+    @classmethod
+    def _yinyang_glyph_path(cls, size: int) -> QPainterPath:
+        """
+        函数: _yinyang_glyph_path
+        作用: 返回按尺寸居中的“☯”字形路径；字形排版只在每个尺寸首次使用时执行。
+        参数:
+            size: 图标逻辑边长（像素）。
+        返回:
+            QPainterPath 字形路径（已居中，调用方只读使用）。
+        """
+        path = cls._yy_path_cache.get(size)
+        if path is not None:
+            return path
         font = QFont()
         # 字体大小按尺寸比例设置
         font.setPointSize(int(size * 0.82))
@@ -1182,46 +1669,53 @@ class MainWindow(QMainWindow):
         dx = (size - rectp.width()) / 2 - rectp.x()
         dy = (size - rectp.height()) / 2 - rectp.y()
         path.translate(dx, dy)
+        cls._yy_path_cache[size] = path
+        return path
 
-        painter.setBrush(fg)
-        painter.setPen(QPen(outline, 1.4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-        painter.drawPath(path)
-        painter.end()
-        if angle % 360 != 0:
-            tfm = QTransform()
-            tfm.rotate(angle)
-            pix = pix.transformed(tfm)
-        return QIcon(pix)
-
-    def _make_caption_icon(self, kind: str) -> QIcon:
+    def _make_caption_icon(self, kind: str, dark: Optional[bool] = None) -> QIcon:
         """
         函数: _make_caption_icon
         作用: 生成标题栏系统按钮的小型图标（目前支持 minimize），
-              使用短横线以降低突兀感，并随主题切换颜色。
+              使用短横线以降低突兀感，并随主题切换颜色；按多个设备像素比预渲染。
         参数:
             kind: 图标类型（"min"）。
+            dark: 主题，None 表示使用当前主题。
         返回:
             QIcon 图标对象。
         """
+        if dark is None:
+            dark = self.dark_mode
         sz_w, sz_h = self._system_caption_button_size()
         size = max(16, int(sz_h * 0.9))
-        pix = QPixmap(size, size)
+        icon = QIcon()
+        for dpr in self._ICON_DPRS:
+            icon.addPixmap(self._render_caption_pixmap(kind, size, dark, dpr))
+        return icon
+
+    def _render_caption_pixmap(self, kind: str, size: int, dark: bool, dpr: float) -> QPixmap:
+        """
+        函数: _render_caption_pixmap
+        作用: 按逻辑尺寸与设备像素比绘制一张标题栏按钮图标位图。
+        参数:
+            kind: 图标类型（"min"/"max"/"restore"/"close"）。
+            size: 逻辑边长（像素）。
+            dark: 是否深色主题。
+            dpr: 设备像素比。
+        返回:
+            QPixmap 位图（已设置 devicePixelRatio）。
+        """
+        key = f"cap:{kind}:{size}:{int(dark)}:{dpr}"
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            return cached
+        side = int(round(size * dpr))
+        pix = QPixmap(side, side)
+        pix.setDevicePixelRatio(dpr)
         pix.fill(Qt.transparent)
         p = QPainter(pix)
         try:
             p.setRenderHint(QPainter.Antialiasing, True)
-            col = QColor(255, 255, 255) if self.dark_mode else QColor(0, 0, 0)
-            # 在深色下略提亮，浅色下略加深
-            if self.dark_mode:
-                col = col.lighter(110)
-            else:
-                col = col.darker(130)
-            pen = QPen(col, 1, Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin)
-            try:
-                pen.setWidthF(1.2)
-            except Exception:
-                pass
-            p.setPen(pen)
+            p.setPen(self._icon_palette(dark)["caption_pen"])
             if kind == "min":
                 # 短横线：长度为图标宽度的 50%，居中，垂直位置略靠下
                 w = int(size * 0.50)
@@ -1251,7 +1745,8 @@ class MainWindow(QMainWindow):
                 p.drawLine(size - m, m, m, size - m)
         finally:
             p.end()
-        return QIcon(pix)
+        QPixmapCache.insert(key, pix)
+        return pix
 
     def _update_pin_button_label(self) -> None:
         """
@@ -1320,23 +1815,14 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        try:
-            QMessageBox.information(self, "提示", text)
-        except Exception:
-            pass
-        try:
-            self.moyu_btn.setVisible(False)
-        except Exception:
-            pass
-        try:
-            self.moyu_path_edit.setVisible(False)
-        except Exception:
-            pass
-        try:
-            if hasattr(self, "_moyu_menu") and self._moyu_menu is not None:
-                self._moyu_menu.close()
-        except Exception:
-            pass
+        self._show_message("提示", text, QMessageBox.Information)
+        for name in ("moyu_btn", "moyu_path_edit"):
+            w = getattr(self, name, None)
+            if w is not None:
+                w.setVisible(False)
+        menu = getattr(self, "_moyu_menu", None)
+        if menu is not None:
+            menu.close()
 
     def _open_game_selector_via_scientific(self) -> None:
         """
@@ -1348,7 +1834,7 @@ class MainWindow(QMainWindow):
             无。
         """
         try:
-            if self.stack.currentWidget() is not self.scientific_panel:
+            if self._current_panel_key() != "scientific":
                 self._switch_to_scientific()
             if hasattr(self.scientific_panel, "open_game_selector"):
                 self.scientific_panel.open_game_selector()
@@ -1360,7 +1846,7 @@ class MainWindow(QMainWindow):
         """
         函数: showEvent
         作用: 窗口显示后再次尝试应用 Windows 标题栏暗色属性与边框设置，
-              部分 Win10 版本需要窗口可见后调用才会生效。
+              部分 Win10 版本需要窗口可见后调用才会生效；首次显示时挂接屏幕切换信号。
         参数:
             event: 显示事件。
         返回:
@@ -1370,10 +1856,76 @@ class MainWindow(QMainWindow):
             super().showEvent(event)
         except Exception:
             pass
-        try:
-            self._apply_windows_dark_titlebar(self.dark_mode)
-        except Exception:
-            pass
+        # 原生窗口可能因切换窗口标志而重建，每次显示时刷新缓存句柄；
+        # 新句柄挂接一次屏幕切换信号：切换到不同 DPI 的屏幕时清空系统度量缓存
+        handle = self.windowHandle()
+        if handle is not None and handle is not self._cached_window_handle:
+            self._cached_window_handle = handle
+            try:
+                handle.screenChanged.connect(self._on_screen_changed)
+                handle.destroyed.connect(self._on_window_handle_destroyed)
+            except Exception:
+                pass
+        if _IS_WIN:
+            try:
+                self._apply_windows_dark_titlebar(self.dark_mode)
+            except Exception:
+                pass
+
+    def _on_screen_changed(self, screen) -> None:
+        """
+        函数: _on_screen_changed
+        作用: 窗口移动到其他屏幕时清空按 DPI 缓存的系统度量，并重建标题栏图标。
+        参数:
+            screen: 新屏幕（未使用）。
+        返回:
+            无。
+        """
+        self._sys_metric_cache.clear()
+        # 标题栏图标尺寸取自系统度量：丢弃旧尺寸的图标并按新 DPI 重建
+        for key in [k for k in self._icon_cache if k[0] == "cap"]:
+            del self._icon_cache[key]
+        self._caption_icons_state = None
+        self._sync_caption_icons()
+        self._prewarm_caption_icons()
+
+    def _on_window_handle_destroyed(self, *_args) -> None:
+        """
+        函数: _on_window_handle_destroyed
+        作用: 原生窗口销毁（如切换窗口标志重建）时丢弃缓存句柄，下次使用时重新获取。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        self._cached_window_handle = None
+
+    def _window_handle(self):
+        """
+        函数: _window_handle
+        作用: 返回缓存的原生窗口句柄（QWindow），尚未缓存时即时获取。
+        参数:
+            无。
+        返回:
+            QWindow 或 None。
+        """
+        handle = self._cached_window_handle
+        if handle is None:
+            handle = self.windowHandle()
+            self._cached_window_handle = handle
+        return handle
+
+    def closeEvent(self, event) -> None:
+        """
+        函数: closeEvent
+        作用: 窗口关闭前将共享 QSettings 中尚未落盘的修改同步到存储。
+        参数:
+            event: 关闭事件。
+        返回:
+            无。
+        """
+        SettingsService.sync()
+        super().closeEvent(event)
 
     def eventFilter(self, obj, event):
         """
@@ -1385,22 +1937,19 @@ class MainWindow(QMainWindow):
         返回:
             bool: True 表示事件已处理。
         """
-        try:
-            if obj is getattr(self, "_title_bar", None):
-                et = event.type()
-                if et == event.Type.MouseButtonDblClick:
-                    self._on_toggle_max_restore()
-                    return True
-                if et == event.Type.MouseButtonPress and event.button() == Qt.LeftButton:
-                    try:
-                        wh = self.windowHandle()
-                        if wh is not None:
-                            wh.startSystemMove()
-                            return True
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+        if obj is self._title_bar:
+            et = event.type()
+            if et == event.Type.MouseButtonDblClick:
+                self._on_toggle_max_restore()
+                return True
+            if et == event.Type.MouseButtonPress and event.button() == Qt.LeftButton:
+                try:
+                    wh = self._window_handle()
+                    if wh is not None:
+                        wh.startSystemMove()
+                        return True
+                except Exception:
+                    pass
         return super().eventFilter(obj, event)
 
     def mousePressEvent(self, event) -> None:
@@ -1416,7 +1965,7 @@ class MainWindow(QMainWindow):
             if event.button() == Qt.LeftButton:
                 edges = self._edges_for_pos(event.pos())
                 if int(edges) != 0:
-                    wh = self.windowHandle()
+                    wh = self._window_handle()
                     if wh is not None:
                         try:
                             wh.startSystemResize(edges)
@@ -1439,15 +1988,8 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        try:
-            edges = self._edges_for_pos(event.pos())
-            self._apply_resize_cursor(edges)
-        except Exception:
-            pass
-        try:
-            super().mouseMoveEvent(event)
-        except Exception:
-            pass
+        self._apply_resize_cursor(self._edges_for_pos(event.pos()))
+        super().mouseMoveEvent(event)
 
     def leaveEvent(self, event) -> None:
         """
@@ -1458,14 +2000,8 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
-        try:
-            self.unsetCursor()
-        except Exception:
-            pass
-        try:
-            super().leaveEvent(event)
-        except Exception:
-            pass
+        self.unsetCursor()
+        super().leaveEvent(event)
 
     def _edges_for_pos(self, pos) -> Qt.Edges:
         """
@@ -1476,25 +2012,21 @@ class MainWindow(QMainWindow):
         返回:
             Qt.Edges: 需要缩放的边缘组合。
         """
-        try:
-            m = 6
-            r = self.rect()
-            left = pos.x() <= m
-            right = (r.width() - pos.x()) <= m
-            top = pos.y() <= m
-            bottom = (r.height() - pos.y()) <= m
-            edges = Qt.Edges()
-            if left:
-                edges |= Qt.LeftEdge
-            if right:
-                edges |= Qt.RightEdge
-            if top:
-                edges |= Qt.TopEdge
-            if bottom:
-                edges |= Qt.BottomEdge
-            return edges
-        except Exception:
-            return Qt.Edges()
+        m = self._EDGE_MARGIN
+        x = pos.x()
+        y = pos.y()
+        w = self.width()
+        h = self.height()
+        edges = Qt.Edges()
+        if x <= m:
+            edges |= Qt.LeftEdge
+        if (w - x) <= m:
+            edges |= Qt.RightEdge
+        if y <= m:
+            edges |= Qt.TopEdge
+        if (h - y) <= m:
+            edges |= Qt.BottomEdge
+        return edges
 
     def _apply_resize_cursor(self, edges: Qt.Edges) -> None:
         """
@@ -1505,25 +2037,60 @@ class MainWindow(QMainWindow):
         返回:
             无。
         """
+        if int(edges) == 0:
+            self.unsetCursor()
+            return
+        left = bool(edges & Qt.LeftEdge)
+        right = bool(edges & Qt.RightEdge)
+        top = bool(edges & Qt.TopEdge)
+        bottom = bool(edges & Qt.BottomEdge)
+        if (left and top) or (right and bottom):
+            self.setCursor(Qt.SizeFDiagCursor)
+        elif (right and top) or (left and bottom):
+            self.setCursor(Qt.SizeBDiagCursor)
+        elif left or right:
+            self.setCursor(Qt.SizeHorCursor)
+        elif top or bottom:
+            self.setCursor(Qt.SizeVerCursor)
+
+    def _post_show_init(self) -> None:
+        """
+        函数: _post_show_init
+        作用: 构造完成后的延迟初始化：创建右下角尺寸手柄并同步 Windows 标题栏配色，
+              使构造函数尽快返回、首帧尽早绘制。
+        参数:
+            无。
+        返回:
+            无。
+        """
         try:
-            e = int(edges)
-            if e == 0:
-                self.unsetCursor()
-                return
-            left = bool(edges & Qt.LeftEdge)
-            right = bool(edges & Qt.RightEdge)
-            top = bool(edges & Qt.TopEdge)
-            bottom = bool(edges & Qt.BottomEdge)
-            if (left and top) or (right and bottom):
-                self.setCursor(Qt.SizeFDiagCursor)
-            elif (right and top) or (left and bottom):
-                self.setCursor(Qt.SizeBDiagCursor)
-            elif left or right:
-                self.setCursor(Qt.SizeHorCursor)
-            elif top or bottom:
-                self.setCursor(Qt.SizeVerCursor)
+            self._create_size_grip()
         except Exception:
             pass
+        # Windows 标题栏与页面主题一致
+        if _IS_WIN:
+            try:
+                self._apply_windows_dark_titlebar(self.dark_mode)
+            except Exception:
+                pass
+        self._prewarm_caption_icons()
+
+    def _prewarm_caption_icons(self) -> None:
+        """
+        函数: _prewarm_caption_icons
+        作用: 首帧显示后按当前屏幕 DPI 预先生成两套主题下的全部标题栏图标，
+              之后主题切换与最大化/还原只做字典查找，不再绘制。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        for dark in (False, True):
+            for kind in ("min", "max", "restore", "close"):
+                try:
+                    self._caption_icon_cached(kind, dark)
+                except Exception:
+                    pass
 
     def _enable_frameless_titlebar(self) -> None:
         """
@@ -1535,15 +2102,56 @@ class MainWindow(QMainWindow):
             无。
         """
         try:
+            was_visible = self.isVisible()
             flags = self.windowFlags() | Qt.FramelessWindowHint | Qt.Window
             self.setWindowFlags(flags)
-            try:
-                self.show()
-            except Exception:
-                pass
+            # 修改窗口标志会隐藏已显示的窗口；尚未显示时交由调用方 show()
+            if was_visible:
+                try:
+                    self.show()
+                except Exception:
+                    pass
         except Exception:
             pass
 
+    def _system_metrics(self) -> tuple:
+        """
+        函数: _system_metrics
+        作用: 获取当前窗口 DPI 下的系统标题栏高度与按钮宽高；按 DPI 缓存，
+              避免每次重建图标/布局都跨 ctypes 调用 Win32。
+        参数:
+            无。
+        返回:
+            (caption_h, btn_w, btn_h): 像素尺寸。
+        """
+        hwnd = int(self.winId())
+        try:
+            dpi = int(_GetDpiForWindow(hwnd))
+        except Exception:
+            dpi = 96
+        cached = self._sys_metric_cache.get(dpi)
+        if cached is not None:
+            return cached
+        SM_CYCAPTION = 4
+        SM_CXSIZE = 30
+        SM_CYSIZE = 31
+        try:
+            # 优先使用按窗口 DPI 的度量
+            metrics = (
+                int(_GetSystemMetricsForDpi(SM_CYCAPTION, dpi)),
+                int(_GetSystemMetricsForDpi(SM_CXSIZE, dpi)),
+                int(_GetSystemMetricsForDpi(SM_CYSIZE, dpi)),
+            )
+        except Exception:
+            # 回退到默认度量（不考虑 DPI 缩放）
+            metrics = (
+                int(_GetSystemMetrics(SM_CYCAPTION)),
+                int(_GetSystemMetrics(SM_CXSIZE)),
+                int(_GetSystemMetrics(SM_CYSIZE)),
+            )
+        self._sys_metric_cache[dpi] = metrics
+        return metrics
+
     def _system_caption_height(self) -> int:
         """
         函数: _system_caption_height
@@ -1553,24 +2161,10 @@ class MainWindow(QMainWindow):
         返回:
             int: 像素高度，失败返回 32 的合理默认值。
         """
-        if not sys.platform.startswith("win"):
+        if not _IS_WIN:
             return 32
         try:
-            # 优先使用按窗口 DPI 的度量
-            hwnd = int(self.winId())
-            try:
-                dpi = ctypes.windll.user32.GetDpiForWindow(hwnd)
-            except Exception:
-                dpi = 96
-            try:
-                SM_CYCAPTION = 4
-                h = ctypes.windll.user32.GetSystemMetricsForDpi(SM_CYCAPTION, dpi)
-                return int(h)
-            except Exception:
-                # 回退到默认度量（不考虑 DPI 缩放）
-                SM_CYCAPTION = 4
-                h = ctypes.windll.user32.GetSystemMetrics(SM_CYCAPTION)
-                return int(h)
+            return self._system_metrics()[0]
         except Exception:
             return 32
 
@@ -1583,26 +2177,11 @@ class MainWindow(QMainWindow):
         返回:
             (width, height): 像素尺寸，失败返回 (36, 28)。
         """
-        if not sys.platform.startswith("win"):
+        if not _IS_WIN:
             return (36, 28)
         try:
-            hwnd = int(self.winId())
-            try:
-                dpi = ctypes.windll.user32.GetDpiForWindow(hwnd)
-            except Exception:
-                dpi = 96
-            try:
-                SM_CXSIZE = 30
-                SM_CYSIZE = 31
-                w = ctypes.windll.user32.GetSystemMetricsForDpi(SM_CXSIZE, dpi)
-                h = ctypes.windll.user32.GetSystemMetricsForDpi(SM_CYSIZE, dpi)
-                return (int(w), int(h))
-            except Exception:
-                SM_CXSIZE = 30
-                SM_CYSIZE = 31
-                w = ctypes.windll.user32.GetSystemMetrics(SM_CXSIZE)
-                h = ctypes.windll.user32.GetSystemMetrics(SM_CYSIZE)
-                return (int(w), int(h))
+            _, w, h = self._system_metrics()
+            return (w, h)
         except Exception:
             return (36, 28)
 
@@ -1633,13 +2212,15 @@ class MainWindow(QMainWindow):
             if self.isMaximized():
                 self.showNormal()
                 try:
-                    self.max_btn.setIcon(self._make_caption_icon("max"))
+                    self.max_btn.setIcon(self._caption_icon_cached("max"))
+                    self._caption_icons_state = (self.dark_mode, False)
                 except Exception:
                     self.max_btn.setText("□")
             else:
                 self.showMaximized()
                 try:
-                    self.max_btn.setIcon(self._make_caption_icon("restore"))
+                    self.max_btn.setIcon(self._caption_icon_cached("restore"))
+                    self._caption_icons_state = (self.dark_mode, True)
                 except Exception:
                     self.max_btn.setText("❐")
         except Exception:
@@ -1651,6 +2232,23 @@ class _MoyuSettingsDialog(QDialog):
           并包含“确定/取消/应用”按钮。
     """
 
+    # 内置配色方案（基础/进阶），为类级常量，不随对话框重复构建
+    _SCHEMES_BASIC = (
+        {"id": "day", "name": "白天默认", "emoji": "🌞", "bg": "#FDF6E3", "fg": "#1F2937", "accent": "#D97706"},
+        {"id": "night", "name": "夜间护眼", "emoji": "🌙", "bg": "#0F172A", "fg": "#F1F5F9", "accent": "#60A5FA"},
+        {"id": "paper", "name": "纸质仿真", "emoji": "📜", "bg": "#F4ECD8", "fg": "#2D1B1B", "accent": "#B85450"},
+        {"id": "stealth", "name": "摸鱼隐蔽", "emoji": "🕶️", "bg": "#F8FAFC", "fg": "#334155", "accent": "#64748B"},
+    )
+    _SCHEMES_ADV = (
+        {"id": "green", "name": "护眼绿色", "emoji": "🌿", "bg": "#F0FDF4", "fg": "#14532D", "accent": "#16A34A"},
+        {"id": "contrast", "name": "专业学术", "emoji": "🎓", "bg": "#EFF6FF", "fg": "#1F2937", "accent": "#2563EB"},
+        {"id": "dark", "name": "现代科技", "emoji": "💻", "bg": "#111827", "fg": "#F3F4F6", "accent": "#2DD4BF"},
+        {"id": "pink", "name": "柔和粉色", "emoji": "🌸", "bg": "#FFF1F2", "fg": "#1F2937", "accent": "#F43F5E"},
+    )
+
+    # 方案色块图标缓存（类级，跨对话框实例共享）：键为 (bg, accent, checked)
+    _swatch_icon_cache: dict[tuple, QIcon] = {}
+
     def __init__(self, parent: QWidget, init_path: str, init_opacity: int, init_delay_ms: int) -> None:
         """
         函数: __init__
@@ -1713,15 +2311,33 @@ class _MoyuSettingsDialog(QDialog):
         # 外观：基础方案网格
         self.selected_scheme = None
         self._custom1_scheme = None
+        # 方案按钮按 id 索引（按钮, 未选中图标, 选中图标），选择切换时只更新前后两个按钮
+        self._all_scheme_buttons: dict[str, tuple] = {}
+        self._current_scheme_id: Optional[str] = None
+        # 最近一次预览到面板的方案，相同方案不再重复预览
+        self._last_applied_scheme: Optional[dict] = None
         self._build_appearance_section(root)
         root.addWidget(btns)
-        # 透明度实时预览：仅应用到极简窗口显示，不持久化
+        # 透明度/移入延迟实时预览：仅应用到极简窗口显示，不持久化；
+        # 共用 60ms 防抖计时器，连续输入或按住箭头时只预览最后一次的值。
+        # 透明度/延迟预览只在此合并一次，主窗口的透明度预览接口直接应用；关闭对话框时在 done() 中停止
+        self._pending_opacity: Optional[int] = None
+        self._pending_delay: Optional[int] = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(60)
+        self._preview_timer.timeout.connect(self._apply_preview_pending)
+        # 自定义颜色预览：120ms 防抖，合并连续的取色结果
+        self._custom_preview_timer = QTimer(self)
+        self._custom_preview_timer.setSingleShot(True)
+        self._custom_preview_timer.setInterval(120)
+        self._custom_preview_timer.timeout.connect(self._do_preview_custom)
         try:
-            self.opacity_spin.valueChanged.connect(self._on_preview_opacity_change)
+            self.opacity_spin.valueChanged.connect(self._queue_preview_opacity)
         except Exception:
             pass
         try:
-            self.hover_delay_spin.valueChanged.connect(self._on_preview_hover_delay_change)
+            self.hover_delay_spin.valueChanged.connect(self._queue_preview_delay)
         except Exception:
             pass
 
@@ -1734,6 +2350,10 @@ class _MoyuSettingsDialog(QDialog):
         返回:
             无。
         """
+        # 尚在防抖等待中的自定义颜色预览先执行，确保应用的是最新选择
+        if self._custom_preview_timer.isActive():
+            self._custom_preview_timer.stop()
+            self._do_preview_custom()
         try:
             if callable(self.apply_requested):
                 self.apply_requested()
@@ -1744,6 +2364,23 @@ class _MoyuSettingsDialog(QDialog):
         except Exception:
             pass
 
+    def done(self, r: int) -> None:
+        """
+        函数: done
+        作用: 关闭对话框（确定/取消/关闭窗口均经过此处）前停止预览防抖计时器并丢弃待预览值，
+              避免关闭后计时器到期，把预览值覆盖到调用方刚恢复或保存的设置上；
+              自定义颜色预览同样停止（确定时已由 _on_accept 先行执行）。
+        参数:
+            r: 对话框结果码。
+        返回:
+            无。
+        """
+        self._preview_timer.stop()
+        self._custom_preview_timer.stop()
+        self._pending_opacity = None
+        self._pending_delay = None
+        super().done(r)
+
     def _on_help(self) -> None:
         """
         函数: _on_help
@@ -1786,34 +2423,65 @@ class _MoyuSettingsDialog(QDialog):
             p = 1 if int(value) < 1 else (100 if int(value) > 100 else int(value))
             parent = self.parentWidget()
             if parent is not None:
+                if hasattr(parent, "preview_minimal_reader_opacity"):
+                    parent.preview_minimal_reader_opacity(p)
+                # 主题只解析一次，两个面板共用；未选择方案时读取已保存主题
+                theme = getattr(self, "selected_scheme", None)
+                if theme is None:
+                    theme = SettingsService.minimal_theme()
                 if hasattr(parent, "normal_panel"):
                     np = parent.normal_panel
-                    if hasattr(np, "set_minimal_reader_opacity"):
-                        np.set_minimal_reader_opacity(p)
-                    theme = getattr(self, "selected_scheme", None)
-                    if theme is None:
-                        settings = QSettings()
-                        bg = str(settings.value("minimal_theme_bg", "#F5F5F7", type=str))
-                        fg = str(settings.value("minimal_theme_fg", "#1E1E1E", type=str))
-                        ac = str(settings.value("minimal_theme_accent", "#3B82F6", type=str))
-                        theme = {"bg": bg, "fg": fg, "accent": ac}
                     if hasattr(np, "preview_minimal_reader_theme"):
                         np.preview_minimal_reader_theme(theme)
                 if hasattr(parent, "scientific_panel"):
                     sp = parent.scientific_panel
                     if hasattr(sp, "preview_game_2048_opacity"):
                         sp.preview_game_2048_opacity(p)
-                    theme = getattr(self, "selected_scheme", None)
-                    if theme is None:
-                        settings = QSettings()
-                        bg = str(settings.value("minimal_theme_bg", "#F5F5F7", type=str))
-                        fg = str(settings.value("minimal_theme_fg", "#1E1E1E", type=str))
-                        ac = str(settings.value("minimal_theme_accent", "#3B82F6", type=str))
-                        theme = {"bg": bg, "fg": fg, "accent": ac}
                     if hasattr(sp, "preview_game_2048_theme"):
                         sp.preview_game_2048_theme(theme)
         except Exception:
             pass
+
+    def _queue_preview_opacity(self, value: int) -> None:
+        """
+        函数: _queue_preview_opacity
+        作用: 记录最新透明度并（重新）启动预览防抖计时器。
+        参数:
+            value: 当前透明度值。
+        返回:
+            无。
+        """
+        self._pending_opacity = int(value)
+        self._preview_timer.start()
+
+    def _queue_preview_delay(self, value: int) -> None:
+        """
+        函数: _queue_preview_delay
+        作用: 记录最新移入显示延迟并（重新）启动预览防抖计时器。
+        参数:
+            value: 当前延迟毫秒值。
+        返回:
+            无。
+        """
+        self._pending_delay = int(value)
+        self._preview_timer.start()
+
+    def _apply_preview_pending(self) -> None:
+        """
+        函数: _apply_preview_pending
+        作用: 防抖计时器到期后，以最后一次的值各执行一次透明度/延迟预览。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        opacity, self._pending_opacity = self._pending_opacity, None
+        delay, self._pending_delay = self._pending_delay, None
+        if opacity is not None:
+            self._on_preview_opacity_change(opacity)
+        if delay is not None:
+            self._on_preview_hover_delay_change(delay)
+
     def _on_preview_hover_delay_change(self, value: int) -> None:
         """
         函数: _on_preview_hover_delay_change
@@ -1841,18 +2509,6 @@ class _MoyuSettingsDialog(QDialog):
         返回:
             无。
         """
-        self._schemes_basic = [
-            {"id": "day", "name": "白天默认", "emoji": "🌞", "bg": "#FDF6E3", "fg": "#1F2937", "accent": "#D97706"},
-            {"id": "night", "name": "夜间护眼", "emoji": "🌙", "bg": "#0F172A", "fg": "#F1F5F9", "accent": "#60A5FA"},
-            {"id": "paper", "name": "纸质仿真", "emoji": "📜", "bg": "#F4ECD8", "fg": "#2D1B1B", "accent": "#B85450"},
-            {"id": "stealth", "name": "摸鱼隐蔽", "emoji": "🕶️", "bg": "#F8FAFC", "fg": "#334155", "accent": "#64748B"},
-        ]
-        self._schemes_adv = [
-            {"id": "green", "name": "护眼绿色", "emoji": "🌿", "bg": "#F0FDF4", "fg": "#14532D", "accent": "#16A34A"},
-            {"id": "contrast", "name": "专业学术", "emoji": "🎓", "bg": "#EFF6FF", "fg": "#1F2937", "accent": "#2563EB"},
-            {"id": "dark", "name": "现代科技", "emoji": "💻", "bg": "#111827", "fg": "#F3F4F6", "accent": "#2DD4BF"},
-            {"id": "pink", "name": "柔和粉色", "emoji": "🌸", "bg": "#FFF1F2", "fg": "#1F2937", "accent": "#F43F5E"},
-        ]
         box = QVBoxLayout()
         box.setContentsMargins(0, 0, 0, 0)
         box.setSpacing(6)
@@ -1861,17 +2517,15 @@ class _MoyuSettingsDialog(QDialog):
         grid = QGridLayout()
         grid.setContentsMargins(0, 0, 0, 0)
         grid.setSpacing(6)
-        self._scheme_buttons_basic = []
-        for i, sc in enumerate(self._schemes_basic):
+        for i, sc in enumerate(self._SCHEMES_BASIC):
             btn = QToolButton(self)
             btn.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-            btn.setIcon(self._make_swatch_icon(sc["bg"], sc["accent"], False))
+            self._register_scheme_button(sc["id"], btn, sc["bg"], sc["accent"])
             btn.setText(f"{sc['emoji']} {sc['name']}")
             btn.clicked.connect(lambda checked=False, s=sc: self._on_select_scheme(s))
             r = i // 2
             c = i % 2
             grid.addWidget(btn, r, c)
-            self._scheme_buttons_basic.append((btn, sc))
         box.addLayout(grid)
         # 进阶方案（不折叠，直接展示）
         box.addWidget(QLabel("进阶方案"))
@@ -1879,17 +2533,15 @@ class _MoyuSettingsDialog(QDialog):
         adv_l = QGridLayout(adv)
         adv_l.setContentsMargins(0, 0, 0, 0)
         adv_l.setSpacing(6)
-        self._scheme_buttons_adv = []
-        for i, sc in enumerate(self._schemes_adv):
+        for i, sc in enumerate(self._SCHEMES_ADV):
             btn = QToolButton(self)
             btn.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-            btn.setIcon(self._make_swatch_icon(sc["bg"], sc["accent"], False))
+            self._register_scheme_button(sc["id"], btn, sc["bg"], sc["accent"])
             btn.setText(f"{sc['emoji']} {sc['name']}")
             btn.clicked.connect(lambda checked=False, s=sc: self._on_select_scheme(s))
             r = i // 2
             c = i % 2
             adv_l.addWidget(btn, r, c)
-            self._scheme_buttons_adv.append((btn, sc))
         adv.setVisible(True)
         box.addWidget(adv)
         # 自定义
@@ -1922,10 +2574,7 @@ class _MoyuSettingsDialog(QDialog):
         box.addLayout(cust_box)
         box.addWidget(save_btn)
         try:
-            settings = QSettings()
-            c_bg = str(settings.value("minimal_theme_custom1_bg", "", type=str))
-            c_fg = str(settings.value("minimal_theme_custom1_fg", "", type=str))
-            c_ac = str(settings.value("minimal_theme_custom1_accent", "", type=str))
+            c_bg, c_fg, c_ac = SettingsService.minimal_theme_custom1()
             has_custom = bool(c_bg and c_fg and c_ac)
         except Exception:
             c_bg = c_fg = c_ac = ""
@@ -1936,14 +2585,15 @@ class _MoyuSettingsDialog(QDialog):
         self._btn_custom1.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         self._btn_custom1.setEnabled(has_custom)
         if has_custom:
-            self._btn_custom1.setIcon(self._make_swatch_icon(c_bg, c_ac, False))
+            self._register_scheme_button("custom1", self._btn_custom1, c_bg, c_ac)
             self._btn_custom1.setText("🎨 自定义方案")
             sc = {"id": "custom1", "name": "自定义方案", "emoji": "🎨", "bg": c_bg, "fg": c_fg, "accent": c_ac}
             self._custom1_scheme = dict(sc)
-            self._btn_custom1.clicked.connect(lambda checked=False, s=sc: self._on_select_scheme(s))
         else:
             self._btn_custom1.setText("暂无已保存")
             self._custom1_scheme = None
+        # 只连接一次：点击时读取当前保存的自定义方案，保存新方案无需重连信号
+        self._btn_custom1.clicked.connect(self._on_custom1_clicked)
         custom1_row.addWidget(custom1_lbl)
         custom1_row.addWidget(self._btn_custom1)
         box.addLayout(custom1_row)
@@ -1962,34 +2612,36 @@ class _MoyuSettingsDialog(QDialog):
         返回:
             QIcon 图标。
         """
-        try:
-            pix = QPixmap(16, 16)
-            pix.fill(QColor(bg))
-            p = QPainter(pix)
-            pen = QPen(QColor(accent))
-            pen.setWidth(2)
-            p.setPen(pen)
-            p.drawRect(1, 1, 14, 14)
-            if checked:
-                # 勾选颜色：优先用强调色，若与背景对比度不足则选黑/白中对比更高者
-                chk_color = QColor(accent)
-                try:
-                    if self._contrast_ratio(bg, accent) < 3.0:
-                        c_black = self._contrast_ratio(bg, "#000000")
-                        c_white = self._contrast_ratio(bg, "#FFFFFF")
-                        chk_color = QColor("#000000" if c_black >= c_white else "#FFFFFF")
-                except Exception:
-                    pass
-                pen2 = QPen(chk_color)
-                pen2.setWidth(2)
-                p.setPen(pen2)
-                # 画一个简单的对号
-                p.drawLine(4, 9, 7, 12)
-                p.drawLine(7, 12, 12, 5)
-            p.end()
-            return QIcon(pix)
-        except Exception:
-            return QIcon()
+        # 色块只取决于 (bg, accent, checked)：选择方案刷新与再次打开对话框时直接复用
+        key = (bg, accent, bool(checked))
+        icon = _MoyuSettingsDialog._swatch_icon_cache.get(key)
+        if icon is not None:
+            return icon
+        # 纯光栅绘制在 QImage 上完成（不依赖窗口系统后备存储），最后一次性转为 QPixmap
+        img = QImage(16, 16, QImage.Format_ARGB32_Premultiplied)
+        img.fill(QColor(bg))
+        p = QPainter(img)
+        pen = QPen(QColor(accent))
+        pen.setWidth(2)
+        p.setPen(pen)
+        p.drawRect(1, 1, 14, 14)
+        if checked:
+            # 勾选颜色：优先用强调色，若与背景对比度不足则选黑/白中对比更高者
+            chk_color = QColor(accent)
+            if self._contrast_ratio(bg, accent) < 3.0:
+                c_black = self._contrast_ratio(bg, "#000000")
+                c_white = self._contrast_ratio(bg, "#FFFFFF")
+                chk_color = QColor("#000000" if c_black >= c_white else "#FFFFFF")
+            pen2 = QPen(chk_color)
+            pen2.setWidth(2)
+            p.setPen(pen2)
+            # 画一个简单的对号
+            p.drawLine(4, 9, 7, 12)
+            p.drawLine(7, 12, 12, 5)
+        p.end()
+        icon = QIcon(QPixmap.fromImage(img))
+        _MoyuSettingsDialog._swatch_icon_cache[key] = icon
+        return icon
 
     def _on_select_scheme(self, scheme: dict) -> None:
         """
@@ -2000,51 +2652,73 @@ class _MoyuSettingsDialog(QDialog):
         返回:
             无。
         """
+        self.selected_scheme = dict(scheme)
+        self._apply_scheme_to_panels(self.selected_scheme)
+        self._refresh_scheme_icons(str(scheme.get("id", "")))
+
+    def _apply_scheme_to_panels(self, scheme: dict) -> None:
+        """
+        函数: _apply_scheme_to_panels
+        作用: 将方案预览到极简阅读窗口与 2048 窗口；与上次预览的方案相同时跳过，
+              避免取色预览后再选择同一方案时重复整窗重绘。
+        参数:
+            scheme: 方案字典。
+        返回:
+            无。
+        """
+        if self._last_applied_scheme == scheme:
+            return
+        parent = self.parentWidget()
+        if parent is None:
+            return
         try:
-            self.selected_scheme = dict(scheme)
-            parent = self.parentWidget()
-            if parent is not None:
-                if hasattr(parent, "normal_panel"):
-                    parent.normal_panel.preview_minimal_reader_theme(self.selected_scheme)
-                if hasattr(parent, "scientific_panel"):
-                    parent.scientific_panel.preview_game_2048_theme(self.selected_scheme)
-            self._refresh_scheme_icons(str(scheme.get("id", "")))
+            if hasattr(parent, "normal_panel"):
+                parent.normal_panel.preview_minimal_reader_theme(scheme)
+            if hasattr(parent, "scientific_panel"):
+                parent.scientific_panel.preview_game_2048_theme(scheme)
         except Exception:
-            pass
+            return
+        self._last_applied_scheme = dict(scheme)
 
     def _refresh_scheme_icons(self, selected_id: str) -> None:
         """
         函数: _refresh_scheme_icons
-        作用: 刷新所有方案按钮图标勾选状态（基础/进阶/自定义）。
+        作用: 刷新方案按钮图标勾选状态（基础/进阶/自定义），仅更新状态变化的按钮。
         参数:
             selected_id: 当前选中的方案 id。
         返回:
             无。
         """
         sid = str(selected_id or "").strip()
-        try:
-            for btn, sc in getattr(self, "_scheme_buttons_basic", []):
-                checked = str(sc.get("id", "")) == sid
-                btn.setIcon(self._make_swatch_icon(sc["bg"], sc["accent"], checked))
-                btn.setText(f"{sc['emoji']} {sc['name']}")
-        except Exception:
-            pass
-        try:
-            for btn, sc in getattr(self, "_scheme_buttons_adv", []):
-                checked = str(sc.get("id", "")) == sid
-                btn.setIcon(self._make_swatch_icon(sc["bg"], sc["accent"], checked))
-                btn.setText(f"{sc['emoji']} {sc['name']}")
-        except Exception:
-            pass
-        try:
-            btn = getattr(self, "_btn_custom1", None)
-            sc = getattr(self, "_custom1_scheme", None)
-            if btn is not None and isinstance(sc, dict):
-                checked = str(sc.get("id", "")) == sid
-                btn.setIcon(self._make_swatch_icon(str(sc.get("bg", "#F5F5F7")), str(sc.get("accent", "#3B82F6")), checked))
-                btn.setText(f"{sc.get('emoji', '🎨')} {sc.get('name', '自定义方案')}")
-        except Exception:
-            pass
+        prev = self._current_scheme_id
+        if prev == sid:
+            return
+        # 只有取消勾选的旧按钮与新勾选的按钮需要换图标，按钮文字不随勾选变化
+        for key in (prev, sid):
+            entry = self._all_scheme_buttons.get(key) if key else None
+            if entry is None:
+                continue
+            btn, icon_off, icon_on = entry
+            btn.setIcon(icon_on if key == sid else icon_off)
+        self._current_scheme_id = sid
+
+    def _register_scheme_button(self, scheme_id: str, btn: QToolButton, bg: str, accent: str) -> None:
+        """
+        函数: _register_scheme_button
+        作用: 预先生成方案按钮的未选中/选中两套色块图标并登记，
+              选择切换时只需 setIcon，不再绘制。
+        参数:
+            scheme_id: 方案 id。
+            btn: 方案按钮。
+            bg: 背景色。
+            accent: 强调色。
+        返回:
+            无。
+        """
+        icon_off = self._make_swatch_icon(bg, accent, False)
+        icon_on = self._make_swatch_icon(bg, accent, True)
+        self._all_scheme_buttons[scheme_id] = (btn, icon_off, icon_on)
+        btn.setIcon(icon_on if self._current_scheme_id == scheme_id else icon_off)
 
     def _pick_color(self, target_edit: QLineEdit) -> None:
         """
@@ -2057,37 +2731,40 @@ class _MoyuSettingsDialog(QDialog):
         """
         try:
             col = QColorDialog.getColor(QColor(target_edit.text() or "#FFFFFF"), self, "选择颜色")
-            if col.isValid():
-                target_edit.setText(col.name())
-                self._preview_custom_current()
         except Exception:
-            pass
+            return
+        if col.isValid():
+            target_edit.setText(col.name())
+            self._preview_custom_current()
 
     def _preview_custom_current(self) -> None:
         """
         函数: _preview_custom_current
+        作用: 请求预览自定义颜色；经 120ms 防抖，连续的取色/输入只预览一次。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        self._custom_preview_timer.start()
+
+    def _do_preview_custom(self) -> None:
+        """
+        函数: _do_preview_custom
         作用: 读取自定义颜色并进行预览，非法输入忽略。
         参数:
             无。
         返回:
             无。
         """
-        try:
-            bg = self.custom_bg.text().strip()
-            fg = self.custom_fg.text().strip()
-            ac = self.custom_accent.text().strip() or "#3B82F6"
-            if not (self._valid_color(bg) and self._valid_color(fg) and self._valid_color(ac)):
-                return
-            scheme = {"id": "custom1", "name": "自定义方案1", "emoji": "🎨", "bg": bg, "fg": fg, "accent": ac}
-            parent = self.parentWidget()
-            if parent is not None:
-                if hasattr(parent, "normal_panel"):
-                    parent.normal_panel.preview_minimal_reader_theme(scheme)
-                if hasattr(parent, "scientific_panel"):
-                    parent.scientific_panel.preview_game_2048_theme(scheme)
-            self.selected_scheme = scheme
-        except Exception:
-            pass
+        bg = self.custom_bg.text().strip()
+        fg = self.custom_fg.text().strip()
+        ac = self.custom_accent.text().strip() or "#3B82F6"
+        if not (self._valid_color(bg) and self._valid_color(fg) and self._valid_color(ac)):
+            return
+        scheme = {"id": "custom1", "name": "自定义方案1", "emoji": "🎨", "bg": bg, "fg": fg, "accent": ac}
+        self._apply_scheme_to_panels(scheme)
+        self.selected_scheme = scheme
 
     def _on_save_custom(self) -> None:
         """
@@ -2098,46 +2775,40 @@ class _MoyuSettingsDialog(QDialog):
         返回:
             无。
         """
+        bg = self.custom_bg.text().strip()
+        fg = self.custom_fg.text().strip()
+        ac = self.custom_accent.text().strip() or "#3B82F6"
+        if not (self._valid_color(bg) and self._valid_color(fg) and self._valid_color(ac)):
+            QMessageBox.warning(self, "错误", "请输入有效 HEX/RGB 颜色值")
+            return
+        if self._contrast_ratio(bg, fg) < 4.5:
+            QMessageBox.warning(self, "错误", "颜色对比度未达 AA 标准 (≥4.5)")
+            return
         try:
-            bg = self.custom_bg.text().strip()
-            fg = self.custom_fg.text().strip()
-            ac = self.custom_accent.text().strip() or "#3B82F6"
-            if not (self._valid_color(bg) and self._valid_color(fg) and self._valid_color(ac)):
-                QMessageBox.warning(self, "错误", "请输入有效 HEX/RGB 颜色值")
-                return
-            if self._contrast_ratio(bg, fg) < 4.5:
-                QMessageBox.warning(self, "错误", "颜色对比度未达 AA 标准 (≥4.5)")
-                return
-            settings = QSettings()
-            settings.setValue("minimal_theme_custom1_bg", bg)
-            settings.setValue("minimal_theme_custom1_fg", fg)
-            settings.setValue("minimal_theme_custom1_accent", ac)
-            self.selected_scheme = {"id": "custom1", "name": "自定义方案1", "emoji": "🎨", "bg": bg, "fg": fg, "accent": ac}
-            self._custom1_scheme = dict(self.selected_scheme)
-            try:
-                if hasattr(self, "_btn_custom1") and self._btn_custom1 is not None:
-                    self._btn_custom1.setEnabled(True)
-                    self._btn_custom1.setText("🎨 自定义方案1")
-                    sc = dict(self.selected_scheme)
-                    try:
-                        for c in self._btn_custom1.clicked.connections():
-                            pass
-                    except Exception:
-                        pass
-                    try:
-                        self._btn_custom1.clicked.disconnect()
-                    except Exception:
-                        pass
-                    self._btn_custom1.clicked.connect(lambda checked=False, s=sc: self._on_select_scheme(s))
-            except Exception:
-                pass
-            try:
-                self._refresh_scheme_icons("custom1")
-            except Exception:
-                pass
-            QMessageBox.information(self, "提示", "自定义方案已保存")
+            SettingsService.set_minimal_theme_custom1(bg, fg, ac)
         except Exception:
-            pass
+            QMessageBox.warning(self, "错误", "自定义方案保存失败")
+            return
+        self.selected_scheme = {"id": "custom1", "name": "自定义方案1", "emoji": "🎨", "bg": bg, "fg": fg, "accent": ac}
+        self._custom1_scheme = dict(self.selected_scheme)
+        # 颜色已变：重建自定义按钮的两套图标，再切换勾选到自定义方案
+        self._register_scheme_button("custom1", self._btn_custom1, bg, ac)
+        self._btn_custom1.setEnabled(True)
+        self._btn_custom1.setText("🎨 自定义方案1")
+        self._refresh_scheme_icons("custom1")
+        QMessageBox.information(self, "提示", "自定义方案已保存")
+
+    def _on_custom1_clicked(self) -> None:
+        """
+        函数: _on_custom1_clicked
+        作用: 点击“已保存自定义方案”按钮时选择当前保存的自定义方案。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        if self._custom1_scheme is not None:
+            self._on_select_scheme(dict(self._custom1_scheme))
 
     def _valid_color(self, s: str) -> bool:
         """
@@ -2148,20 +2819,15 @@ class _MoyuSettingsDialog(QDialog):
         返回:
             bool。
         """
-        try:
-            if not s:
-                return False
-            if s.startswith("#") and len(s) in (4, 7):
-                return True
-            t = s.lower().replace(" ", "")
-            if t.startswith("rgb(") and t.endswith(")"):
-                parts = t[4:-1].split(",")
-                if len(parts) == 3:
-                    vals = [int(x) for x in parts]
-                    return all(0 <= v <= 255 for v in vals)
-            return False
-        except Exception:
+        if not s:
             return False
+        # 常见的 #RGB/#RRGGBB：逐字符查表，不做额外字符串分配
+        if s[0] == "#":
+            n = len(s)
+            if n != 7 and n != 4:
+                return False
+            return all(c in _HEX_DIGITS for c in s[1:])
+        return _parse_rgb(s) is not None
 
     def _contrast_ratio(self, bg: str, fg: str) -> float:
         """
@@ -2174,26 +2840,10 @@ class _MoyuSettingsDialog(QDialog):
             浮点对比度值。
         """
         try:
-            def to_rgb(s):
-                if s.startswith("#"):
-                    c = QColor(s)
-                    return (c.red(), c.green(), c.blue())
-                t = s.lower().replace(" ", "")
-                if t.startswith("rgb(") and t.endswith(")"):
-                    p = [int(x) for x in t[4:-1].split(",")]
-                    return (p[0], p[1], p[2])
-                c = QColor(s)
-                return (c.red(), c.green(), c.blue())
-            def rel_lum(rgb):
-                def f(u):
-                    u = u / 255.0
-                    return u / 12.92 if u <= 0.04045 else ((u + 0.055) / 1.055) ** 2.4
-                r, g, b = rgb
-                return 0.2126 * f(r) + 0.7152 * f(g) + 0.0722 * f(b)
-            L1 = rel_lum(to_rgb(fg))
-            L2 = rel_lum(to_rgb(bg))
-            if L1 < L2:
-                L1, L2 = L2, L1
-            return (L1 + 0.05) / (L2 + 0.05)
+            L1 = _rel_luminance(fg)
+            L2 = _rel_luminance(bg)
         except Exception:
             return 0.0
+        if L1 < L2:
+            L1, L2 = L2, L1
+        return (L1 + 0.05) / (L2 + 0.05)
@@ -6,8 +6,8 @@
 
 from typing import Optional
 
-from PySide6.QtCore import Qt, QSettings, QCoreApplication, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, QTimer, QThread, QObject, Signal
-from PySide6.QtGui import QTextLayout, QTextOption, QPainter, QPen, QColor, QCursor, QGuiApplication
+from PySide6.QtCore import Qt, QEvent, QSettings, QPropertyAnimation, QVariantAnimation, QEasingCurve, QTimer, QThread, QObject, QCoreApplication, QMetaObject, Signal, Slot
+from PySide6.QtGui import QFont, QTextDocument, QTextLayout, QTextOption, QPainter, QPen, QColor, QCursor, QGuiApplication, QPalette
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -19,6 +19,7 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QLabel,
     QPlainTextEdit,
+    QPlainTextDocumentLayout,
     QFrame,
     QGraphicsOpacityEffect,
     QDialog,
@@ -27,6 +28,9 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QSplitter,
 )
+import functools
+import hmac
+import math
 import os
 import random
 import hashlib
@@ -34,12 +38,379 @@ import time
 import re
 from bisect import bisect_right
 
-from core.book_loader import load_book_content, list_supported_book_files
+from core.book_loader import iter_book_text_chunks, load_book_content, list_supported_book_files
 from core.expr_parser import safe_eval
 from core.memory_store import MemoryStore
 from core.settings_service import SettingsService
 
 
+# 按键网格：按行展开的扁平序列，每行 _BUTTON_COLUMNS 个
+_BUTTON_COLUMNS = 4
+_BUTTON_LAYOUT = (
+    "%", "√", "x²", "1/x",
+    "CE", "C", "Back", "÷",
+    "7", "8", "9", "×",
+    "4", "5", "6", "-",
+    "1", "2", "3", "+",
+    "±", "0", ".", "=",
+)
+
+
+def _reciprocal(v: float) -> float:
+    """
+    函数: _reciprocal
+    作用: 求倒数，0 的倒数按除零错误处理。
+    参数:
+        v: 操作数。
+    返回:
+        float。
+    """
+    if v == 0:
+        raise ValueError("除零错误")
+    return 1.0 / v
+
+
+# 一元操作按键到计算函数的映射（± 只切换输入符号，单独处理），
+# 以及运算符显示文本到表达式符号的转换表（也用于粘贴的 × ÷ − 表达式）
+_UNARY_FUNCS = {
+    "%": lambda v: v / 100.0,
+    "√": math.sqrt,
+    "x²": lambda v: v * v,
+    "1/x": _reciprocal,
+}
+_UNARY_OPS = frozenset(_UNARY_FUNCS) | {"±"}
+_OP_TABLE = str.maketrans({"×": "*", "÷": "/", "−": "-"})
+# 历史列表最多保留的条目数，超出时移除最早的记录
+_HISTORY_LIMIT = 500
+# 按键分组：导入时一次性转为整数集合，按键处理只做哈希查找，不再逐个解析 Qt.Key 枚举
+_MOYU_PREV_KEYS = frozenset(int(k) for k in (Qt.Key_W, Qt.Key_PageUp, Qt.Key_Up, Qt.Key_Left))
+_MOYU_NEXT_KEYS = frozenset(int(k) for k in (Qt.Key_S, Qt.Key_PageDown, Qt.Key_Down, Qt.Key_Right))
+_DIGIT_KEYS = frozenset(range(int(Qt.Key_0), int(Qt.Key_9) + 1))
+_ENTER_KEYS = frozenset(int(k) for k in (Qt.Key_Return, Qt.Key_Enter))
+_BACKSPACE_KEY = int(Qt.Key_Backspace)
+_OP_KEYS = frozenset(int(k) for k in (
+    Qt.Key_Plus, Qt.Key_Minus, Qt.Key_Asterisk, Qt.Key_Slash,
+    Qt.Key_Period, Qt.Key_ParenLeft, Qt.Key_ParenRight,
+))
+# 事件过滤器用到的事件类型，同样在导入时取出一次
+_ET_ENTER = QEvent.Type.Enter
+_ET_LEAVE = QEvent.Type.Leave
+_ET_WHEEL = QEvent.Type.Wheel
+_ET_KEY_PRESS = QEvent.Type.KeyPress
+_ET_FONT_CHANGE = QEvent.Type.FontChange
+_ET_RESIZE = QEvent.Type.Resize
+_ET_MOUSE_PRESS = QEvent.Type.MouseButtonPress
+_ET_MOUSE_MOVE = QEvent.Type.MouseMove
+_ET_MOUSE_RELEASE = QEvent.Type.MouseButtonRelease
+_ET_MOUSE_DBLCLICK = QEvent.Type.MouseButtonDblClick
+# 滚轮一格（15°）对应的 angleDelta 增量，累计满一格翻一页
+_WHEEL_STEP = 120
+
+
+def _wheel_delta(event) -> int:
+    """
+    函数: _wheel_delta
+    作用: 取滚轮事件的纵向增量；无角度增量（部分触控板）时改用像素增量。
+    参数:
+        event: QWheelEvent。
+    返回:
+        int。
+    """
+    return event.angleDelta().y() or event.pixelDelta().y()
+
+
+def _new_layout_document(font: QFont) -> QTextDocument:
+    """
+    函数: _new_layout_document
+    作用: 创建用于换行排版的独立 QTextDocument（单词边界优先、无文档边距）。
+    参数:
+        font: 排版字体。
+    返回:
+        QTextDocument。
+    """
+    doc = QTextDocument()
+    doc.setDefaultFont(font)
+    opt = QTextOption()
+    opt.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+    doc.setDefaultTextOption(opt)
+    # 宽度已扣除视图边距，文档自身不再留边
+    doc.setDocumentMargin(0)
+    return doc
+
+
+def _layout_text_with_offsets(text: str, width: int, font: QFont, doc: Optional[QTextDocument] = None) -> tuple:
+    """
+    函数: _layout_text_with_offsets
+    作用: 用独立的 QTextDocument 按指定宽度与字体对文本换行（单词边界优先），
+         返回行文本与其起始字符偏移；不依赖任何控件，可在工作线程中调用。
+    参数:
+        text: 原始文本。
+        width: 内容宽度（像素）。
+        font: 排版字体。
+        doc: 可复用的排版文档（由 _new_layout_document 创建，字体须与 font 一致）；
+             为空时临时创建。复用时排版完成后清空内容，只保留字体与换行设置。
+    返回:
+        tuple[list[str], list[int]]。
+    """
+    reused = doc is not None
+    if not reused:
+        doc = _new_layout_document(font)
+    doc.setPlainText(text)
+    doc.setTextWidth(float(width))
+    # 文档布局是惰性的：读取尺寸以一次性完成全文排版，否则各段 lineCount 为 0
+    doc.size()
+    lines = []
+    offsets = []
+    # 逐行热路径：追加方法在循环外绑定为局部变量，省去每行的属性查找
+    add_line = lines.append
+    add_offset = offsets.append
+    blk = doc.firstBlock()
+    while blk.isValid():
+        lay = blk.layout()
+        line_at = lay.lineAt
+        base = int(blk.position())
+        # 每个段落只取一次文本，避免逐行重复构造 Python 字符串
+        btxt = blk.text()
+        for i in range(lay.lineCount()):
+            ln = line_at(i)
+            start = ln.textStart()
+            add_line(btxt[start:start + ln.textLength()])
+            add_offset(base + start)
+        blk = blk.next()
+    if reused:
+        # 释放全文排版占用的内存，文档对象留待下次使用
+        doc.clear()
+    return lines, offsets
+
+
+def _split_lines_with_offsets(text: str) -> tuple:
+    """
+    函数: _split_lines_with_offsets
+    作用: 仅按换行符切分文本（不做宽度换行），返回行文本与其起始字符偏移，作为排版失败时的回退。
+    参数:
+        text: 原始文本。
+    返回:
+        tuple[list[str], list[int]]。
+    """
+    lines = text.split("\n")
+    offsets = []
+    pos = 0
+    for ln in lines:
+        offsets.append(pos)
+        pos += len(ln) + 1
+    return lines, offsets
+
+
+def _stop_thread(thread: QThread) -> None:
+    """
+    函数: _stop_thread
+    作用: 结束线程事件循环并等待线程退出；线程对象在运行中被析构会导致进程中止。
+    参数:
+        thread: 要结束的线程。
+    返回:
+        无。
+    """
+    thread.quit()
+    thread.wait()
+
+
+class _MoyuPages:
+    """
+    类: _MoyuPages
+    作用: 以“全文 + 页首偏移表”表示的只读页序列，取页时才从全文切片，
+         不再为每页常驻一份字符串副本；页与页之间的换行符不计入页文本。
+    """
+
+    __slots__ = ("_text", "_offsets")
+
+    def __init__(self, text: str, offsets: list) -> None:
+        self._text = text
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> str:
+        n = len(self._offsets)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(index)
+        start = self._offsets[index]
+        if index + 1 < n:
+            end = self._offsets[index + 1]
+            # 下一页从新段落开始时，去掉两页之间的换行符；软换行处切开则无需处理
+            if end > start and self._text[end - 1] == "\n":
+                end -= 1
+        else:
+            end = len(self._text)
+        return self._text[start:end]
+
+
+class _MoyuLoaderWorker(QObject):
+    """
+    类: _MoyuLoaderWorker
+    作用: 在工作线程中逐个读取电子书文件，以信号发送文本与章节目录；
+         给定宽度与字体时同时按完整段落换行并发送各行的全文偏移，给定每页行数时再发送整页的页首偏移，
+         主线程只需拼接列表。不接触任何界面对象。
+    """
+
+    textChunk = Signal(str)
+    headerChunk = Signal(str)
+    linesChunk = Signal(object)
+    pagesChunk = Signal(object)
+    wrapFailed = Signal()
+    bookMeta = Signal(object)
+    finished = Signal()
+    error = Signal(str)
+
+    def __init__(
+        self,
+        base_path: str,
+        names: list,
+        emit_header: bool,
+        width: int = 0,
+        font: Optional[QFont] = None,
+        lines_per_page: int = 0,
+    ) -> None:
+        super().__init__()
+        self.base_path = base_path
+        self.names = names
+        self.emit_header = bool(emit_header)
+        # 换行参数在主线程取值后按值复制，工作线程不读取控件
+        self.width = int(width)
+        self.font = QFont(font) if font is not None and self.width > 0 else None
+        # 排版文档在工作线程中首次换行时创建，各文本块复用，任务结束时释放
+        self._layout_doc = None  # type: Optional[QTextDocument]
+        self._pending = ""  # 尚未换行的尾段（最后一个换行符之后的文本）
+        self._consumed = 0  # 已换行文本在全文中的长度，作为下一批行偏移的基准
+        self.lines_per_page = max(0, int(lines_per_page))
+        self._page_offsets = []  # type: list[int]  # 未满一页的行偏移
+        # 取消标志：主线程发起新加载时置位，工作线程在文件/文本块之间检查后尽快结束
+        self.cancelled = False
+
+    def _emit_text(self, signal, s: str) -> None:
+        """
+        函数: _emit_text
+        作用: 发送文本片段，并对其中已完整的段落换行后发送各行的全文偏移；
+             段落按块独立排版，分段换行与整篇换行结果一致。
+        参数:
+            signal: 文本信号（textChunk 或 headerChunk）。
+            s: 文本片段。
+        返回:
+            无。
+        """
+        signal.emit(s)
+        if self.font is None:
+            return
+        self._pending += s
+        cut = self._pending.rfind("\n")
+        if cut >= 0:
+            self._emit_lines(self._pending[:cut])
+            self._consumed += cut + 1
+            self._pending = self._pending[cut + 1:]
+
+    def _emit_lines(self, text: str) -> None:
+        """
+        函数: _emit_lines
+        作用: 对不含末尾换行符的段落文本换行，偏移加上已换行长度后发送；失败时停止换行并通知主线程。
+        参数:
+            text: 段落文本。
+        返回:
+            无。
+        """
+        try:
+            if self._layout_doc is None:
+                self._layout_doc = _new_layout_document(self.font)
+            _, offsets = _layout_text_with_offsets(text, self.width, self.font, self._layout_doc)
+        except Exception:
+            self.font = None
+            self.wrapFailed.emit()
+            return
+        base = self._consumed
+        offsets = [base + o for o in offsets]
+        self.linesChunk.emit(offsets)
+        if self.lines_per_page:
+            self._emit_pages(offsets, final=False)
+
+    def _emit_pages(self, offsets: list, final: bool) -> None:
+        """
+        函数: _emit_pages
+        作用: 将新行偏移接在未满一页的行之后，按每页行数切出整页并发送页首偏移；
+             final 为 True 时剩余行也作为最后一页发送。切页方式与 _compute_moyu_pages_from_text 一致。
+        参数:
+            offsets: 新物理行的全文偏移。
+            final: 是否为最后一批。
+        返回:
+            无。
+        """
+        n = self.lines_per_page
+        carry = self._page_offsets
+        total = len(carry) + len(offsets)
+        end = total if final else total - total % n
+        # 按下标跨步取页首，不再把整批新行拼接到未满页之后再切片：
+        # 逻辑序列为 carry + offsets，第 0 页首行在 carry 中（若有），其后各页首行均落在 offsets 内
+        page_offsets = []
+        if carry and end > 0:
+            page_offsets.append(carry[0])
+        page_offsets.extend(offsets[(n - len(carry)) % n:end - len(carry):n])
+        if end >= len(carry):
+            self._page_offsets = offsets[end - len(carry):]
+        else:
+            self._page_offsets = carry[end:] + offsets
+        if page_offsets:
+            self.pagesChunk.emit(page_offsets)
+
+    @Slot()
+    def run(self) -> None:
+        """
+        函数: run
+        作用: 依次读取文件；多文件模式下先发送文件标题行，单个文件读取失败时发送错误并继续。
+             被取消时跳过剩余内容，但仍发送 finished 以便主线程释放本对象。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        try:
+            for name in self.names:
+                if self.cancelled:
+                    break
+                fp = os.path.join(self.base_path, name)
+                if self.emit_header:
+                    self._emit_text(self.headerChunk, f"===== {name} =====\n")
+                try:
+                    if os.path.splitext(name)[1].lower() == ".txt":
+                        # TXT 无章节目录：按块流式解码并逐块发送，工作线程只保留未完结的尾段
+                        for chunk in iter_book_text_chunks(fp):
+                            if self.cancelled:
+                                break
+                            self._emit_text(self.textChunk, chunk)
+                        continue
+                    content = load_book_content(fp)
+                    self.bookMeta.emit({
+                        "name": name,
+                        "chapters": [(chapter.title, chapter.char_offset) for chapter in content.chapters],
+                    })
+                    # 整本文本一次发送，换行同样在本线程完成
+                    self._emit_text(self.textChunk, content.text)
+                except Exception as e:
+                    self.error.emit(f"读取失败: {name} -> {e}")
+            if self.font is not None and not self.cancelled:
+                # 最后一段（全文以换行结尾时为空段，对应文档末尾的空块）
+                self._emit_lines(self._pending)
+                self._pending = ""
+                if self.font is not None and self.lines_per_page:
+                    self._emit_pages([], final=True)
+            # 在创建它的工作线程中释放排版文档
+            self._layout_doc = None
+            self.finished.emit()
+        except Exception as e:
+            self._layout_doc = None
+            self.error.emit(str(e))
+            self.finished.emit()
+
+
 class NormalPanel(QWidget):
     """
     类: NormalPanel
@@ -47,6 +418,13 @@ class NormalPanel(QWidget):
          记忆功能（MC/MR/M+/M-）与历史记录列表。
     """
 
+    # 摸鱼模式下连续点击“=”的最大间隔（秒）
+    _EQUAL_MULTI_WINDOW = 2.0
+    # 摸鱼文本视图与页码标签的基础样式；淡入淡出时在其后追加带 alpha 的颜色
+    _MOYU_VIEW_SS = "border: none; font-size: 13pt;"
+    _MOYU_LABEL_SS = "color: #9aa0a6;"
+    _MOYU_LABEL_COLOR = "#9aa0a6"
+
     def __init__(self, memory_store: MemoryStore, parent: Optional[QWidget] = None) -> None:
         """
         函数: __init__
@@ -62,6 +440,9 @@ class NormalPanel(QWidget):
         self.setFocusPolicy(Qt.StrongFocus)
         # 摸鱼密钥（输入后点击“=”触发设置按钮显示）
         self._moyu_secret = "666888"
+        # 长度不同的输入直接跳过密钥比较；compare_digest 不接受非 ASCII 字符串，按 UTF-8 字节比较
+        self._moyu_secret_len = len(self._moyu_secret)
+        self._moyu_secret_bytes = self._moyu_secret.encode("utf-8")
         # 模式状态：是否处于摸鱼模式（用于帮助文案切换）
         self._in_moyu_mode = False
 
@@ -71,16 +452,26 @@ class NormalPanel(QWidget):
         self.display.setPlaceholderText("请输入表达式，例如: (1+2)*3")
         self.display.setAlignment(Qt.AlignRight)
         self.display.setMinimumHeight(40)
+        # 功能键分派表：CE 仅清空当前输入；C 清空输入但保留历史，便于对比
+        self._button_handlers = {
+            "CE": self.display.clear,
+            "C": self.display.clear,
+            "Back": self.display.backspace,
+            "=": self.evaluate_and_record,
+        }
 
         self.history = QListWidget()
         self.history.setMinimumWidth(200)
         # 历史列表优化：开启自动换行，禁用水平滚动，避免提示被截断
-        try:
-            self.history.setWordWrap(True)
-            self.history.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            self.history.setUniformItemSizes(False)
-        except Exception:
-            pass
+        self.history.setWordWrap(True)
+        self.history.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.history.setUniformItemSizes(False)
+        # 历史记录合并：同一轮事件循环内追加的记录先暂存，空闲时一次性插入，只布局/重绘一次
+        self._history_pending = []  # type: list[str]
+        self._history_timer = QTimer(self)
+        self._history_timer.setSingleShot(True)
+        self._history_timer.setInterval(0)
+        self._history_timer.timeout.connect(self._flush_history)
 
         # 左侧栈：显示 + 网格
         left_box = QWidget()
@@ -91,35 +482,24 @@ class NormalPanel(QWidget):
 
         grid = QGridLayout()
         grid.setSpacing(8)
-
-        buttons = [
-            ["%", "√", "x²", "1/x"],
-            ["CE", "C", "Back", "÷"],
-            ["7", "8", "9", "×"],
-            ["4", "5", "6", "-"],
-            ["1", "2", "3", "+"],
-            ["±", "0", ".", "="]
-        ]
-
-        for r, row in enumerate(buttons):
-            for c, text in enumerate(row):
-                btn = QPushButton(text)
-                btn.setMinimumHeight(40)
-                btn.clicked.connect(lambda checked=False, t=text: self.on_button_clicked(t))
-                grid.addWidget(btn, r, c)
+        # 暂停布局计算，24 个按键全部加入后统一布局一次
+        grid.setEnabled(False)
+        for i, text in enumerate(_BUTTON_LAYOUT):
+            btn = QPushButton(text)
+            btn.setMinimumHeight(40)
+            btn.clicked.connect(functools.partial(self.on_button_clicked, text))
+            r, c = divmod(i, _BUTTON_COLUMNS)
+            grid.addWidget(btn, r, c)
+        grid.setEnabled(True)
 
         left_v.addLayout(grid)
 
         # 页码标签：放置在红框区域内（容器中），默认隐藏
         self.moyu_page_label = QLabel("")
         self.moyu_page_label.setVisible(False)
-        try:
-            self.moyu_page_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            self.moyu_page_label.setObjectName("moyuPageLabel")
-            self.moyu_page_label.setStyleSheet("color: #9aa0a6;")
-            self.moyu_page_label.installEventFilter(self)
-        except Exception:
-            pass
+        self.moyu_page_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self.moyu_page_label.setObjectName("moyuPageLabel")
+        self.moyu_page_label.setStyleSheet(self._MOYU_LABEL_SS)
 
         # 摸鱼区域：隐藏设置按钮 + 路径输入框 + 文本展示
         self.moyu_settings_btn = QPushButton("设置")
@@ -143,50 +523,40 @@ class NormalPanel(QWidget):
 
         self.moyu_view = QPlainTextEdit()
         self.moyu_view.setReadOnly(True)
-        try:
-            f = self.moyu_view.font()
-            f.setPointSize(13)
-            self.moyu_view.setFont(f)
-        except Exception:
-            pass
+        f = self.moyu_view.font()
+        f.setPointSize(13)
+        self.moyu_view.setFont(f)
         # 由外部容器固定高度，文本视图自适应填充
         self.moyu_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         # 无痕显示：去边框、去滚动条、按控件宽度换行
-        try:
-            self.moyu_view.setFrameStyle(QFrame.NoFrame)
-            self.moyu_view.setStyleSheet("border: none; font-size: 13pt;")
-            self.moyu_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            self.moyu_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            self.moyu_view.setLineWrapMode(QPlainTextEdit.WidgetWidth)
-            # 文档边距适当收紧，避免底部出现被裁剪的半行
-            try:
-                self.moyu_view.document().setDocumentMargin(2)
-            except Exception:
-                pass
-            # 通过事件过滤器实现滚轮/方向键翻页
-            self.moyu_view.installEventFilter(self)
-        except Exception:
-            pass
+        self.moyu_view.setFrameStyle(QFrame.NoFrame)
+        self.moyu_view.setStyleSheet(self._MOYU_VIEW_SS)
+        self.moyu_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.moyu_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.moyu_view.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+        # 页文档缓存：每页一个已排版的 QTextDocument，翻页时直接切换文档，回看页无需重新排版
+        self._moyu_page_docs = {}  # type: dict[int, QTextDocument]
+        self._moyu_page_docs_font = None
+        # 视图上实际显示的页（-1 表示显示临时文档）；翻页节流期间 _moyu_page_index 可能已领先于它
+        self._moyu_shown_index = -1
+        # 临时文档：伪装文本等非分页内容写入此文档，避免改写缓存的页文档；
+        # 文档边距（2）由 _new_moyu_document 统一设置，收紧边距避免底部出现被裁剪的半行
+        self._moyu_scratch_doc = self._new_moyu_document("")
+        self.moyu_view.setDocument(self._moyu_scratch_doc)
         self.moyu_view.setVisible(False)
-        # 固定三行显示：根据当前字体行距设置文本视图高度为 3 行
-        try:
-            line_h = max(1, int(self.moyu_view.fontMetrics().lineSpacing()))
-            doc_m = int(self.moyu_view.document().documentMargin()) if hasattr(self.moyu_view, 'document') else 0
-            # 预设高度，稍后由 adjust_moyu_box_height 进行统一微调
-            self.moyu_view.setFixedHeight(line_h * 3 + doc_m * 2)
-        except Exception:
-            pass
+        # 字体度量缓存：行高/文档边距/视口边距，仅在文本视图字体变化时刷新
+        self._refresh_moyu_metrics()
+        # 固定三行显示：根据当前字体行距设置文本视图高度为 3 行（预设高度，稍后由 adjust_moyu_box_height 统一微调）
+        self.moyu_view.setFixedHeight(self._moyu_line_h * 3 + self._moyu_doc_margin * 2)
         # 红框区域容器：固定高度，占位不随显示隐藏变化
         self.moyu_box = QWidget()
-        try:
-            self.moyu_box.setObjectName("moyuBox")
-        except Exception:
-            pass
+        self.moyu_box.setObjectName("moyuBox")
         self.moyu_box.setFixedHeight(96)
-        try:
-            self.moyu_box.installEventFilter(self)
-        except Exception:
-            pass
+        # 事件过滤器在三个控件都创建后再安装，过滤器内无需判断属性是否存在：
+        # 容器移入移出淡入淡出、页码标签双击跳转；文本视图的滚轮/方向键翻页过滤器
+        # 由 _set_moyu_view_visible 在显示时安装、隐藏时卸载
+        self.moyu_box.installEventFilter(self)
+        self.moyu_page_label.installEventFilter(self)
         box_v = QVBoxLayout(self.moyu_box)
         box_v.setContentsMargins(0, 0, 0, 0)
         box_v.setSpacing(2)
@@ -194,10 +564,7 @@ class NormalPanel(QWidget):
         box_v.addWidget(self.moyu_view)
         left_v.addWidget(self.moyu_box)
         # 初始化后统一调整容器高度，确保完整三行不被裁剪
-        try:
-            self.adjust_moyu_box_height()
-        except Exception:
-            pass
+        self.adjust_moyu_box_height()
         # 预填持久化路径但不自动显示
         try:
             saved = SettingsService.moyu_path("")
@@ -222,31 +589,66 @@ class NormalPanel(QWidget):
         root.addWidget(splitter)
 
         # 分页状态
-        self._moyu_pages = []  # type: list[str]
+        self._moyu_pages = []  # type: list[str] | _MoyuPages
         self._moyu_page_index = 0
         self._moyu_page_char_offsets = []  # type: list[int]
-        # 行缓存与分批加载暂存
-        self._moyu_line_cache = {}  # key: (width, font_key, content_hash) -> list[str]
-        self._moyu_line_staging = []  # 暂存未满一页的行
-        self._moyu_chunk_buffer = ""  # 分批加载时跨块的尾行缓冲
-        # 淡入淡出动画资源
-        self._moyu_effect = None
+        # 全文换行缓存：key: (width, font_key, content_hash) -> 各物理行起始偏移，先进先出淘汰
+        self._moyu_wrap_cache = {}
+        # 分页缓存：key: (width, font_key, content_hash, lines_per_page) -> 页首偏移表，先进先出淘汰
+        self._moyu_page_offsets_cache = {}
+        # 主线程换行复用的排版文档与其字体键，首次换行时创建，字体变化时才重设
+        self._moyu_layout_doc = None  # type: Optional[QTextDocument]
+        self._moyu_layout_font_key = None
+        self._moyu_full_text_key = ""  # 全文内容哈希，加载完成时计算一次
+        # 分批加载暂存
+        self._moyu_loaded_len = 0  # 异步加载中已接收的字符数（用于章节偏移）
+        self._moyu_text_parts = []  # type: list[str]
+        # 工作线程预先换行的结果：(宽度, 字体键) 与加载结束时一致则直接写入换行缓存
+        self._moyu_loaded_offsets = []  # type: list[int]
+        self._moyu_loaded_wrap_key = None
+        self._moyu_loaded_page_offsets = []  # type: list[int]
+        self._moyu_loaded_lines_per_page = 0
+        self._moyu_loading_path = ""
+        self._moyu_loading_name = ""
+        # 淡入淡出动画资源：当前透明度与覆盖样式前的基准颜色
         self._moyu_anim = None
-        self._moyu_effect_label = None
-        self._moyu_anim_label = None
-        self._moyu_anim_group = None
+        self._moyu_fade_opacity = 1.0
+        self._moyu_fade_colors = None
         self._wheel_accum = 0
         self._equal_press_count = 0
         self._last_equal_ts = 0.0
         self._minimal_reader = None
-        self._moyu_prefetch_cache = {}
         self._moyu_full_text = ""
         self._moyu_explicit_chapters = []  # type: list[tuple[str, int]]
         self._moyu_progress_key = ""
+        # 加载线程首次加载时创建并常驻，之后每次加载只向其投递新的工作对象
         self._loader_thread = None
         self._loader_worker = None
+        self._moyu_retired_workers = set()  # 已取消但尚未结束的旧工作对象，结束前保留引用
         self._dynamic_moyu_height = True
         self._last_moyu_view_h = 0
+        self._last_moyu_view_w = 0
+        # 缩放防抖：拖动窗口期间合并多次尺寸变化，停止后仅重新分页一次
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self._do_repaginate)
+        # 邻页预排版：0ms 单次定时器，当前页绘制完成、事件循环空闲后才执行；连续翻页只预排一次
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(0)
+        self._prefetch_timer.timeout.connect(self._prefetch_current_neighbors)
+        # 滚轮合并：高频滚轮的多个事件先累计增量，事件循环空闲时一次性翻页，只重绘一次
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(0)
+        self._wheel_timer.timeout.connect(self._flush_wheel)
+        # 翻页节流：按住 W/S 或高频滚轮时每帧（16ms）最多切换一次页文档，期间只记录目标页
+        self._moyu_page_pending = False
+        self._page_timer = QTimer(self)
+        self._page_timer.setSingleShot(True)
+        self._page_timer.setInterval(16)
+        self._page_timer.timeout.connect(self._flush_moyu_page)
 
     def adjust_moyu_box_height(self) -> None:
         """
@@ -258,27 +660,58 @@ class NormalPanel(QWidget):
         返回:
             无。
         """
-        try:
-            if getattr(self, "_dynamic_moyu_height", False):
-                return
-            line_h = max(1, int(self.moyu_view.fontMetrics().lineSpacing()))
-            doc_m = int(self.moyu_view.document().documentMargin()) if hasattr(self.moyu_view, 'document') else 0
-            # 视口边距（QAbstractScrollArea），不同平台可能非 0
-            try:
-                vm = self.moyu_view.viewportMargins()
-                vp_pad = int(vm.top()) + int(vm.bottom())
-            except Exception:
-                vp_pad = 0
-            # 冗余高度：按行高的 30% 取整，至少 6 像素，解决 2.5 行问题
-            fudge = max(6, int(round(line_h * 0.30)))
-            view_h = line_h * 3 + doc_m * 2 + vp_pad + fudge
-            self.moyu_view.setFixedHeight(view_h)
-            label_h = int(self.moyu_page_label.sizeHint().height())
-            spacing = 2  # 与 box_v.setSpacing 保持一致
-            box_h = view_h + label_h + spacing
-            self.moyu_box.setFixedHeight(box_h)
-        except Exception:
-            pass
+        if getattr(self, "_dynamic_moyu_height", False):
+            return
+        line_h = self._moyu_line_h
+        doc_m = self._moyu_doc_margin
+        vp_pad = self._moyu_vp_pad
+        # 冗余高度：按行高的 30% 取整，至少 6 像素，解决 2.5 行问题
+        fudge = max(6, int(round(line_h * 0.30)))
+        view_h = line_h * 3 + doc_m * 2 + vp_pad + fudge
+        self.moyu_view.setFixedHeight(view_h)
+        label_h = int(self.moyu_page_label.sizeHint().height())
+        spacing = 2  # 与 box_v.setSpacing 保持一致
+        box_h = view_h + label_h + spacing
+        self.moyu_box.setFixedHeight(box_h)
+
+    def _refresh_moyu_metrics(self) -> None:
+        """
+        函数: _refresh_moyu_metrics
+        作用: 重新读取文本视图的行距、文档边距与视口上下边距并缓存，
+              避免缩放/分页热路径中反复构造 QFontMetrics。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        self._moyu_line_h = max(1, self.moyu_view.fontMetrics().lineSpacing())
+        self._moyu_doc_margin = int(self.moyu_view.document().documentMargin())
+        # 视口边距（QAbstractScrollArea），不同平台可能非 0
+        vm = self.moyu_view.viewportMargins()
+        self._moyu_vp_pad = vm.top() + vm.bottom()
+        # 文档边距可能随字体变化，内容宽度下次取用时重新计算
+        self._moyu_content_width = None
+
+    def _set_moyu_view_visible(self, visible: bool) -> None:
+        """
+        函数: _set_moyu_view_visible
+        作用: 显示/隐藏文本视图，并随之安装/卸载其事件过滤器：
+              隐藏期间不再为视图上的每个事件进入 eventFilter。
+        参数:
+            visible: 是否显示。
+        返回:
+            无。
+        """
+        if not visible:
+            self.moyu_view.removeEventFilter(self)
+            self.moyu_view.setVisible(False)
+            return
+        if not self.moyu_view.isHidden():
+            return
+        self.moyu_view.installEventFilter(self)
+        self.moyu_view.setVisible(True)
+        # 隐藏期间可能漏掉字体变化事件，重新显示时补一次度量刷新
+        self._refresh_moyu_metrics()
 
     def get_help_text(self) -> str:
         """
@@ -370,13 +803,14 @@ class NormalPanel(QWidget):
         self._in_moyu_mode = bool(on)
         try:
             self._last_moyu_view_h = int(self.moyu_view.viewport().height())
+            self._last_moyu_view_w = int(self.moyu_view.viewport().width())
         except Exception:
             pass
 
     def resizeEvent(self, event) -> None:
         """
         函数: resizeEvent
-        作用: 监测视口高度变化，必要时基于全文重新分页以适配窗口尺寸。
+        作用: 监测尺寸变化，在摸鱼模式下启动防抖定时器，待拖动停止后再重新分页。
         参数:
             event: 尺寸事件。
         返回:
@@ -386,16 +820,35 @@ class NormalPanel(QWidget):
             super().resizeEvent(event)
         except Exception:
             pass
+        self._moyu_content_width = None
+        if getattr(self, "_in_moyu_mode", False) and getattr(self, "_moyu_full_text", ""):
+            # start() 会重置未触发的定时器，连续缩放只分页一次
+            self._resize_timer.start()
+
+    def _do_repaginate(self) -> None:
+        """
+        函数: _do_repaginate
+        作用: 缩放防抖定时器回调；视口宽度或高度变化时重新分页，并保持当前阅读位置。
+              仅高度变化时换行缓存按宽度命中，只重新切页，不重新换行。
+        参数:
+            无。
+        返回:
+            无。
+        """
         try:
             if getattr(self, "_in_moyu_mode", False):
-                h = int(self.moyu_view.viewport().height())
-                if h != self._last_moyu_view_h and self._moyu_full_text:
+                vp = self.moyu_view.viewport()
+                w = int(vp.width())
+                h = int(vp.height())
+                if (w != self._last_moyu_view_w or h != self._last_moyu_view_h) and self._moyu_full_text:
                     old_total = len(self._moyu_pages) if self._moyu_pages else 0
                     old_index = int(self._moyu_page_index)
                     old_ratio = self._moyu_page_ratio(old_index, old_total)
                     old_char = self._moyu_char_offset_for_index(old_index)
+                    self._last_moyu_view_w = w
                     self._last_moyu_view_h = h
-                    self._compute_moyu_pages_from_text(self._moyu_full_text)
+                    # 内容哈希沿用加载时的结果；宽度变化时重新换行，仅高度变化时命中换行缓存，只重新切页
+                    self._compute_moyu_pages_from_text(self._moyu_full_text, self._moyu_full_text_key)
                     if old_char >= 0:
                         self._show_moyu_page(self._moyu_index_from_char_offset(old_char))
                     else:
@@ -412,31 +865,52 @@ class NormalPanel(QWidget):
         返回:
             无。
         """
-        if text == "CE":
-            # 仅清空当前输入
-            self.display.clear()
+        handler = self._button_handlers.get(text)
+        if handler is not None:
+            handler()
             return
-        if text == "C":
-            # 清空输入与不清除历史，保留对比
-            self.display.clear()
-            return
-        if text == "Back":
-            self.display.backspace()
-            return
-        if text == "=":
-            self.evaluate_and_record()
-            return
-        if text in {"%", "√", "x²", "1/x", "±"}:
+        if text in _UNARY_OPS:
             self.apply_unary(text)
             return
+        # 运算符与数字插入（× ÷ 转换为表达式运算符）
+        self.display.insert(text.translate(_OP_TABLE))
+
+    def _push_history(self, *texts: str) -> None:
+        """
+        函数: _push_history
+        作用: 向历史列表追加一条或多条记录；记录先暂存，由 0ms 单次定时器在事件循环空闲时统一插入，
+              加载过程中连续产生的提示因此只触发一次列表布局。
+        参数:
+            texts: 要追加的文本。
+        返回:
+            无。
+        """
+        self._history_pending.extend(texts)
+        if not self._history_timer.isActive():
+            self._history_timer.start()
 
-        # 运算符与数字插入
-        to_insert = text
-        if text == "×":
-            to_insert = "*"
-        elif text == "÷":
-            to_insert = "/"
-        self.display.insert(to_insert)
+    def _flush_history(self) -> None:
+        """
+        函数: _flush_history
+        作用: 暂停重绘与信号后批量插入暂存的历史记录，
+              并将总条目数限制在 _HISTORY_LIMIT 以内，避免列表无限增长拖慢布局。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        pending = self._history_pending[-_HISTORY_LIMIT:]
+        self._history_pending = []
+        if not pending:
+            return
+        self.history.setUpdatesEnabled(False)
+        self.history.blockSignals(True)
+        self.history.addItems(pending)
+        overflow = self.history.count() - _HISTORY_LIMIT
+        for _ in range(max(0, overflow)):
+            self.history.takeItem(0)
+        self.history.blockSignals(False)
+        self.history.setUpdatesEnabled(True)
 
     def handle_memory(self, op: str) -> None:
         """
@@ -451,7 +925,7 @@ class NormalPanel(QWidget):
             current = 0.0
             txt = self.display.text().strip()
             if txt:
-                current = safe_eval(txt)
+                current = safe_eval(txt.translate(_OP_TABLE))
             if op == "MC":
                 self.memory_store.clear()
             elif op == "MR":
@@ -461,7 +935,7 @@ class NormalPanel(QWidget):
             elif op == "M-":
                 self.memory_store.subtract(current)
         except Exception as e:
-            self.history.addItem(f"[错误] 记忆操作: {e}")
+            self._push_history(f"[错误] 记忆操作: {e}")
 
     def evaluate_and_record(self) -> None:
         """
@@ -478,7 +952,7 @@ class NormalPanel(QWidget):
         if not expr:
             return
         # 摸鱼密钥检测：当输入为指定密钥并点击“=”时，显示设置按钮
-        if expr == self._moyu_secret:
+        if len(expr) == self._moyu_secret_len and hmac.compare_digest(expr.encode("utf-8"), self._moyu_secret_bytes):
             # 通过主窗口在顶部显示“设置”按钮
             try:
                 win = self.window()
@@ -486,16 +960,17 @@ class NormalPanel(QWidget):
                     win.reveal_moyu_button()
             except Exception:
                 pass
-            self.history.addItem("[提示] 设置已解锁：点击顶部‘设置’按钮配置")
+            self._push_history("[提示] 设置已解锁：点击顶部‘设置’按钮配置")
             # 不进行求值，清空输入便于继续操作
             self.display.clear()
             return
         try:
-            result = safe_eval(expr)
+            # 粘贴的表达式可能带有 × ÷ − 等显示符号，求值前统一转换
+            result = safe_eval(expr.translate(_OP_TABLE))
             self.display.setText(str(result))
-            self.history.addItem(f"{expr} = {result}")
+            self._push_history(f"{expr} = {result}")
         except Exception as e:
-            self.history.addItem(f"[错误] {expr} -> {e}")
+            self._push_history(f"[错误] {expr} -> {e}")
     def _handle_equal_press_trigger(self) -> bool:
         """
         函数: _handle_equal_press_trigger
@@ -509,8 +984,9 @@ class NormalPanel(QWidget):
             self._equal_press_count = 0
             self._last_equal_ts = 0.0
             return False
-        now = time.time()
-        if self._last_equal_ts == 0.0 or (now - self._last_equal_ts) <= 2.0:
+        # 单调时钟：不受系统时间校准/夏令时跳变影响
+        now = time.monotonic()
+        if self._last_equal_ts == 0.0 or (now - self._last_equal_ts) <= self._EQUAL_MULTI_WINDOW:
             self._equal_press_count += 1
         else:
             self._equal_press_count = 1
@@ -535,7 +1011,7 @@ class NormalPanel(QWidget):
                 return
             # 若已存在极简窗口，置顶并激活即可
             try:
-                if self._minimal_reader is not None and hasattr(self._minimal_reader, 'isVisible') and self._minimal_reader.isVisible():
+                if self._minimal_reader is not None and self._minimal_reader.isVisible():
                     try:
                         self._minimal_reader.raise_()
                         self._minimal_reader.activateWindow()
@@ -578,25 +1054,16 @@ class NormalPanel(QWidget):
                 dlg.setAttribute(Qt.WA_TransparentForMouseEvents, False)
             except Exception:
                 pass
-            try:
-                if hasattr(dlg, "_view") and dlg._view is not None and hasattr(dlg._view, "viewport"):
-                    dlg._view.viewport().setAttribute(Qt.WA_TransparentForMouseEvents, False)
-            except Exception:
-                pass
+            view = self._reader_view(dlg)
+            if view is not None:
+                view.viewport().setAttribute(Qt.WA_TransparentForMouseEvents, False)
             try:
                 dlg.setFocusPolicy(Qt.StrongFocus)
             except Exception:
                 pass
             try:
-                settings = QSettings()
-                percent = int(settings.value("minimal_opacity_percent", 100, type=int))
-                percent = max(1, min(100, percent))
-                self._apply_minimal_opacity(dlg, percent)
-            except Exception:
-                pass
-            try:
-                theme = self._get_saved_minimal_theme()
-                self._apply_minimal_theme(dlg, theme)
+                # 透明度与配色一次性合并应用，避免重复设置样式表
+                self._apply_minimal_appearance(dlg, self._get_saved_minimal_theme(), SettingsService.minimal_opacity_percent())
             except Exception:
                 pass
             try:
@@ -628,10 +1095,36 @@ class NormalPanel(QWidget):
             p = 100
         p = max(1, min(100, p))
         try:
-            settings = QSettings()
-            settings.setValue("minimal_opacity_percent", int(p))
+            SettingsService.set_minimal_opacity_percent(p)
         except Exception:
             pass
+    def _reader_view(self, dlg: Optional[QDialog]) -> Optional[QPlainTextEdit]:
+        """
+        函数: _reader_view
+        作用: 返回极简窗口的文本视图；窗口不存在或尚未创建视图时返回 None。
+        参数:
+            dlg: 极简窗口实例，可为 None。
+        返回:
+            Optional[QPlainTextEdit]。
+        """
+        return getattr(dlg, "_view", None) if dlg is not None else None
+
+    def _apply_reader_hover_delay(self, delay_ms: int) -> None:
+        """
+        函数: _apply_reader_hover_delay
+        作用: 将移入显示延迟同步到已打开的极简窗口；窗口未打开时忽略。
+        参数:
+            delay_ms: 已钳制的延迟毫秒数。
+        返回:
+            无。
+        """
+        dlg = self._minimal_reader
+        timer = getattr(dlg, "_hover_show_delay_timer", None) if dlg is not None else None
+        if timer is None:
+            return
+        dlg._hover_delay_ms = int(delay_ms)
+        timer.setInterval(int(delay_ms))
+
     def set_minimal_reader_hover_delay(self, delay_ms: int) -> None:
         """
         函数: set_minimal_reader_hover_delay
@@ -647,20 +1140,10 @@ class NormalPanel(QWidget):
             d = 1500
         d = max(0, min(10000, d))
         try:
-            settings = QSettings()
-            settings.setValue("minimal_hover_delay_ms", int(d))
-        except Exception:
-            pass
-        try:
-            dlg = getattr(self, "_minimal_reader", None)
-            if dlg is not None and hasattr(dlg, "_hover_show_delay_timer") and dlg._hover_show_delay_timer is not None:
-                try:
-                    dlg._hover_delay_ms = int(d)
-                except Exception:
-                    pass
-                dlg._hover_show_delay_timer.setInterval(int(d))
+            SettingsService.set_minimal_hover_delay_ms(d)
         except Exception:
             pass
+        self._apply_reader_hover_delay(d)
     def preview_minimal_reader_hover_delay(self, delay_ms: int) -> None:
         """
         函数: preview_minimal_reader_hover_delay
@@ -674,16 +1157,7 @@ class NormalPanel(QWidget):
             d = max(0, min(10000, int(delay_ms)))
         except Exception:
             d = 1500
-        try:
-            dlg = getattr(self, "_minimal_reader", None)
-            if dlg is not None and hasattr(dlg, "_hover_show_delay_timer") and dlg._hover_show_delay_timer is not None:
-                try:
-                    dlg._hover_delay_ms = int(d)
-                except Exception:
-                    pass
-                dlg._hover_show_delay_timer.setInterval(int(d))
-        except Exception:
-            pass
+        self._apply_reader_hover_delay(d)
     def set_minimal_reader_theme(self, theme: dict, persist: bool = True) -> None:
         """
         函数: set_minimal_reader_theme
@@ -695,16 +1169,11 @@ class NormalPanel(QWidget):
             无。
         """
         try:
-            dlg = getattr(self, "_minimal_reader", None)
-            if dlg is not None:
-                self._apply_minimal_theme(dlg, theme)
+            if self._minimal_reader is not None:
+                self._apply_minimal_theme(self._minimal_reader, theme)
             if persist:
                 try:
-                    settings = QSettings()
-                    settings.setValue("minimal_theme_bg", str(theme.get("bg", "")))
-                    settings.setValue("minimal_theme_fg", str(theme.get("fg", "")))
-                    settings.setValue("minimal_theme_accent", str(theme.get("accent", "")))
-                    settings.setValue("minimal_theme_name", str(theme.get("name", "")))
+                    SettingsService.set_minimal_theme(theme)
                 except Exception:
                     pass
         except Exception:
@@ -718,125 +1187,60 @@ class NormalPanel(QWidget):
         返回:
             无。
         """
+        # 不在此处再做合并：连续预览已由设置对话框防抖（自定义取色 120ms、透明度 60ms），
+        # 方案按钮为单次点击，到达这里的每次预览都直接应用
         try:
-            dlg = getattr(self, "_minimal_reader", None)
-            if dlg is not None:
-                self._apply_minimal_theme(dlg, theme)
+            if self._minimal_reader is not None:
+                self._apply_minimal_theme(self._minimal_reader, theme)
         except Exception:
             pass
-    def _apply_minimal_opacity(self, dlg: QDialog, percent: int) -> None:
+    def _apply_minimal_appearance(self, dlg: QDialog, theme: dict, percent: int) -> None:
         """
-        函数: _apply_minimal_opacity
-        作用: 应用极简窗口透明度；当为 0 时，背景透明且文本以 50% 透明度显示，保留交互。
+        函数: _apply_minimal_appearance
+        作用: 一次性应用极简窗口的透明度与配色：先确定透明/不透明分支，
+              再为窗口、文本视图与尺寸手柄各设置一次样式表。
+              透明度为 1 时背景透明、文本 0.9 不透明度并显示淡边框；其他取值按百分比设置整窗透明度。
         参数:
-            dlg: 极简阅读窗口。
-            percent: 透明度 0~100。
+            dlg: 极简窗口实例。
+            theme: 包含 bg/fg/accent 的字典。
+            percent: 透明度 1~100。
         返回:
             无。
         """
+        view = self._reader_view(dlg)
+        if view is None:
+            return
         try:
             p = max(1, min(100, int(percent)))
         except Exception:
             p = 100
-        if p == 1:
-            try:
-                dlg.setAttribute(Qt.WA_TranslucentBackground, True)
-            except Exception:
-                pass
-            try:
-                dlg.setStyleSheet("background: transparent;")
-            except Exception:
-                pass
-            try:
-                if hasattr(dlg, "_view") and dlg._view is not None:
-                    dlg._view.setStyleSheet("background: transparent; border: none; font-size: 13pt;")
-                    eff = QGraphicsOpacityEffect(dlg._view.viewport())
-                    eff.setOpacity(0.9)
-                    dlg._view.viewport().setGraphicsEffect(eff)
-                    dlg._text_effect = eff
-                    try:
-                        dlg._view.setTextInteractionFlags(Qt.NoTextInteraction)
-                        dlg._view.viewport().setCursor(Qt.ArrowCursor)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            try:
-                dlg.setWindowOpacity(1.0)
-            except Exception:
-                pass
-            try:
-                dlg._show_border = True
-            except Exception:
-                pass
-            try:
-                if hasattr(dlg, "_size_grip") and dlg._size_grip is not None:
-                    dlg._size_grip.setStyleSheet("QSizeGrip{background: transparent; border: 0px;}")
-                    try:
-                        dlg._size_grip.setFixedSize(12, 12)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            return
-        try:
-            bg = None
-            try:
-                bg = getattr(dlg, "_theme_bg", None)
-            except Exception:
-                bg = None
-            if not bg:
-                try:
-                    settings = QSettings()
-                    bg = str(settings.value("minimal_theme_bg", "#F5F5F7", type=str))
-                except Exception:
-                    bg = "#F5F5F7"
-            dlg.setAttribute(Qt.WA_TranslucentBackground, False)
-            dlg.setStyleSheet(f"background: {bg}; border: none;")
-        except Exception:
-            pass
-        try:
-            if hasattr(dlg, "_view") and dlg._view is not None:
-                dlg._view.setStyleSheet("")
-                eff = dlg._view.viewport().graphicsEffect()
-                if not eff:
-                    eff = QGraphicsOpacityEffect(dlg._view.viewport())
-                    dlg._view.viewport().setGraphicsEffect(eff)
-                try:
-                    eff.setOpacity(0.5)
-                    dlg._text_effect = eff
-                except Exception:
-                    pass
-                try:
-                    dlg._view.setTextInteractionFlags(Qt.NoTextInteraction)
-                    dlg._view.viewport().setCursor(Qt.ArrowCursor)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            dlg.setWindowOpacity(p / 100.0)
-        except Exception:
-            pass
-        try:
-            dlg._show_border = False
-        except Exception:
-            pass
-        try:
-            if hasattr(dlg, "_size_grip") and dlg._size_grip is not None:
-                try:
-                    bg = getattr(dlg, "_theme_bg", None)
-                except Exception:
-                    bg = None
-                if not bg:
-                    try:
-                        settings = QSettings()
-                        bg = str(settings.value("minimal_theme_bg", "#F5F5F7", type=str))
-                    except Exception:
-                        bg = "#F5F5F7"
-                dlg._size_grip.setStyleSheet(f"QSizeGrip{{background: {bg}; border: 0px;}}")
-        except Exception:
-            pass
+        bg = str(theme.get("bg", "#F5F5F7"))
+        fg = str(theme.get("fg", "#1E1E1E"))
+        ac = str(theme.get("accent", "#3B82F6"))
+        dlg._theme_bg = bg
+        transparent = p == 1
+        if transparent:
+            dlg_ss = "background: transparent; border: none;"
+            view_ss = f"QPlainTextEdit{{color:{fg}; background: transparent; border: none; font-size: 14pt; selection-background-color:{ac}; selection-color:{fg};}}"
+            grip_ss = "QSizeGrip{background: transparent; border: 0px;}"
+        else:
+            dlg_ss = f"background: {bg}; border: none;"
+            view_ss = f"QPlainTextEdit{{color:{fg}; background:{bg}; border: none; font-size: 13pt; selection-background-color:{ac}; selection-color:{fg};}}"
+            grip_ss = f"QSizeGrip{{background: {bg}; border: 0px;}}"
+        dlg.setAttribute(Qt.WA_TranslucentBackground, transparent)
+        dlg.setStyleSheet(dlg_ss)
+        view.setStyleSheet(view_ss)
+        viewport = view.viewport()
+        dlg._text_opacity_effect().setOpacity(0.9 if transparent else 0.5)
+        view.setTextInteractionFlags(Qt.NoTextInteraction)
+        viewport.setCursor(Qt.ArrowCursor)
+        dlg.setWindowOpacity(1.0 if transparent else p / 100.0)
+        dlg._show_border = transparent
+        grip = getattr(dlg, "_size_grip", None)
+        if grip is not None:
+            grip.setStyleSheet(grip_ss)
+            grip.setFixedSize(12, 12)
+
     def _get_saved_minimal_theme(self) -> dict:
         """
         函数: _get_saved_minimal_theme
@@ -846,76 +1250,24 @@ class NormalPanel(QWidget):
         返回:
             dict: {bg, fg, accent, name}
         """
-        try:
-            settings = QSettings()
-            bg = str(settings.value("minimal_theme_bg", "#F5F5F7", type=str))
-            fg = str(settings.value("minimal_theme_fg", "#1E1E1E", type=str))
-            ac = str(settings.value("minimal_theme_accent", "#3B82F6", type=str))
-            name = str(settings.value("minimal_theme_name", "白天默认", type=str))
-            return {"bg": bg, "fg": fg, "accent": ac, "name": name}
-        except Exception:
-            return {"bg": "#F5F5F7", "fg": "#1E1E1E", "accent": "#3B82F6", "name": "白天默认"}
+        return SettingsService.minimal_theme()
     def _apply_minimal_theme(self, dlg: QDialog, theme: dict) -> None:
         """
         函数: _apply_minimal_theme
-        作用: 将配色方案应用到极简窗口文本视图与边框选中效果。
+        作用: 将配色方案应用到极简窗口文本视图与边框选中效果，透明度取已保存设置。
         参数:
             dlg: 极简窗口实例。
             theme: 包含 bg/fg/accent 的字典。
-        返回:
-            无。
-        """
-        try:
-            if dlg is None or not hasattr(dlg, "_view") or dlg._view is None:
-                return
-            bg = str(theme.get("bg", "#F5F5F7"))
-            fg = str(theme.get("fg", "#1E1E1E"))
-            ac = str(theme.get("accent", "#3B82F6"))
-            try:
-                dlg._theme_bg = bg
-            except Exception:
-                pass
-            settings = QSettings()
-            percent = int(settings.value("minimal_opacity_percent", 100, type=int))
-            percent = 1 if percent < 1 else (100 if percent > 100 else percent)
-            if percent == 1:
-                dlg._view.setStyleSheet(
-                    f"QPlainTextEdit{{color:{fg}; background: transparent; border: none; font-size: 14pt; selection-background-color:{ac}; selection-color:{fg};}}"
-                )
-                try:
-                    dlg.setAttribute(Qt.WA_TranslucentBackground, True)
-                    dlg.setStyleSheet("background: transparent; border: none;")
-                except Exception:
-                    pass
-                try:
-                    if hasattr(dlg, "_size_grip") and dlg._size_grip is not None:
-                        dlg._size_grip.setStyleSheet("QSizeGrip{background: transparent; border: 0px;}")
-                        dlg._size_grip.setFixedSize(12, 12)
-                except Exception:
-                    pass
-            else:
-                dlg._view.setStyleSheet(
-                    f"QPlainTextEdit{{color:{fg}; background:{bg}; border: none; font-size: 13pt; selection-background-color:{ac}; selection-color:{fg};}}"
-                )
-                try:
-                    dlg.setAttribute(Qt.WA_TranslucentBackground, False)
-                    dlg.setStyleSheet(f"background: {bg}; border: none;")
-                except Exception:
-                    pass
-                try:
-                    if hasattr(dlg, "_size_grip") and dlg._size_grip is not None:
-                        dlg._size_grip.setStyleSheet(f"QSizeGrip{{background: {bg}; border: 0px;}}")
-                        dlg._size_grip.setFixedSize(12, 12)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-    def _on_minimal_page_changed(self, idx: int) -> None:
-        """
-        函数: _on_minimal_page_changed
-        作用: 当极简阅读窗口翻页时，同步主面板当前页并持久化。
-        参数:
-            idx: 新页索引。
+        返回:
+            无。
+        """
+        self._apply_minimal_appearance(dlg, theme, SettingsService.minimal_opacity_percent())
+    def _on_minimal_page_changed(self, idx: int) -> None:
+        """
+        函数: _on_minimal_page_changed
+        作用: 当极简阅读窗口翻页时，同步主面板当前页并持久化。
+        参数:
+            idx: 新页索引。
         返回:
             无。
         """
@@ -937,26 +1289,24 @@ class NormalPanel(QWidget):
         # 摸鱼模式全局翻页快捷键：W/S
         try:
             if self._in_moyu_mode and self.moyu_view.isVisible():
-                if key in (Qt.Key_W, Qt.Key_PageUp, Qt.Key_Up, Qt.Key_Left):
-                    self._show_moyu_page(self._moyu_page_index - 1)
+                if key in _MOYU_PREV_KEYS:
+                    self._queue_moyu_page(self._moyu_page_index - 1)
                     return
-                if key in (Qt.Key_S, Qt.Key_PageDown, Qt.Key_Down, Qt.Key_Right):
-                    self._show_moyu_page(self._moyu_page_index + 1)
+                if key in _MOYU_NEXT_KEYS:
+                    self._queue_moyu_page(self._moyu_page_index + 1)
                     return
         except Exception:
             pass
-        if key in (Qt.Key_0, Qt.Key_1, Qt.Key_2, Qt.Key_3, Qt.Key_4,
-                   Qt.Key_5, Qt.Key_6, Qt.Key_7, Qt.Key_8, Qt.Key_9):
+        if key in _DIGIT_KEYS:
             self.display.insert(chr(key))
             return
-        if key == Qt.Key_Return or key == Qt.Key_Enter:
+        if key in _ENTER_KEYS:
             self.evaluate_and_record()
             return
-        if key == Qt.Key_Backspace:
+        if key == _BACKSPACE_KEY:
             self.display.backspace()
             return
-        if key in (Qt.Key_Plus, Qt.Key_Minus, Qt.Key_Asterisk, Qt.Key_Slash,
-                   Qt.Key_Period, Qt.Key_ParenLeft, Qt.Key_ParenRight):
+        if key in _OP_KEYS:
             self.display.insert(event.text())
             return
         super().keyPressEvent(event)
@@ -985,67 +1335,60 @@ class NormalPanel(QWidget):
         返回:
             bool: 是否已处理事件。
         """
-        try:
-            # 摸鱼容器的移入/移出：在摸鱼模式下对文本区域进行淡入淡出
-            if obj is self.moyu_box:
-                et = event.type()
-                if self._in_moyu_mode:
-                    if et == event.Type.Enter:
-                        self._fade_show_moyu_view()
-                        return False
-                    if et == event.Type.Leave:
-                        self._fade_hide_moyu_view()
-                        return False
-            # 页码标签双击跳转
-            if obj is getattr(self, "moyu_page_label", None):
-                et = event.type()
-                if et == event.Type.MouseButtonDblClick:
-                    try:
-                        if getattr(self, "_in_moyu_mode", False) and self._moyu_pages:
-                            self._prompt_moyu_jump()
-                            return True
-                    except Exception:
-                        pass
-            # 仅处理摸鱼文本视图的事件
-            # 仅处理摸鱼文本视图的事件
-            if obj is self.moyu_view and self.moyu_view.isVisible():
-                et = event.type()
-                if et == event.Type.Wheel:
-                    try:
-                        delta = int(event.angleDelta().y())
-                    except Exception:
-                        delta = 0
-                    if delta == 0:
-                        try:
-                            delta = int(getattr(event.pixelDelta(), 'y', lambda: 0)())
-                        except Exception:
-                            delta = 0
-                    self._wheel_accum += delta
-                    step = 120
-                    moved = False
-                    while self._wheel_accum >= step:
-                        self._show_moyu_page(self._moyu_page_index - 1)
-                        self._wheel_accum -= step
-                        moved = True
-                    while self._wheel_accum <= -step:
-                        self._show_moyu_page(self._moyu_page_index + 1)
-                        self._wheel_accum += step
-                        moved = True
-                    if moved:
-                        return True
+        et = event.type()
+        if obj is self.moyu_view:
+            # 文本视图字体变化（含样式表生效）时刷新度量缓存
+            if et == _ET_FONT_CHANGE:
+                self._refresh_moyu_metrics()
+            # 视图尺寸变化时作废内容宽度缓存
+            elif et == _ET_RESIZE:
+                self._moyu_content_width = None
+            # 仅在可见时处理滚轮/方向键翻页
+            elif self.moyu_view.isVisible():
+                if et == _ET_WHEEL:
+                    self._wheel_accum += _wheel_delta(event)
+                    if not self._wheel_timer.isActive():
+                        self._wheel_timer.start()
                     return True
-                if et == event.Type.KeyPress:
+                if et == _ET_KEY_PRESS:
                     key = event.key()
-                    if key in (Qt.Key_PageUp, Qt.Key_Up, Qt.Key_Left, Qt.Key_W):
-                        self._show_moyu_page(self._moyu_page_index - 1)
+                    if key in _MOYU_PREV_KEYS:
+                        self._queue_moyu_page(self._moyu_page_index - 1)
                         return True
-                    if key in (Qt.Key_PageDown, Qt.Key_Down, Qt.Key_Right, Qt.Key_S):
-                        self._show_moyu_page(self._moyu_page_index + 1)
+                    if key in _MOYU_NEXT_KEYS:
+                        self._queue_moyu_page(self._moyu_page_index + 1)
                         return True
-        except Exception:
-            pass
+        elif obj is self.moyu_box:
+            # 摸鱼容器的移入/移出：在摸鱼模式下对文本区域进行淡入淡出
+            if self._in_moyu_mode:
+                if et == _ET_ENTER:
+                    self._fade_show_moyu_view()
+                    return False
+                if et == _ET_LEAVE:
+                    self._fade_hide_moyu_view()
+                    return False
+        elif obj is self.moyu_page_label:
+            # 页码标签双击跳转
+            if et == _ET_MOUSE_DBLCLICK and self._in_moyu_mode and self._moyu_pages:
+                self._prompt_moyu_jump()
+                return True
         return super().eventFilter(obj, event)
 
+    def _flush_wheel(self) -> None:
+        """
+        函数: _flush_wheel
+        作用: 滚轮合并定时器回调；按 120 阈值将累计增量折算为页数，一次跳转到目标页，余量保留到下次。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        steps = int(self._wheel_accum / _WHEEL_STEP)
+        if steps == 0:
+            return
+        self._wheel_accum -= steps * _WHEEL_STEP
+        self._queue_moyu_page(self._moyu_page_index - steps)
+
     def _prompt_moyu_page_jump(self) -> None:
         """
         函数: _prompt_moyu_page_jump
@@ -1213,7 +1556,7 @@ class NormalPanel(QWidget):
             chapters = self._extract_moyu_chapters()
             if not chapters:
                 try:
-                    self.history.addItem("[提示] 未识别到章节标题，已切换为页码跳转。")
+                    self._push_history("[提示] 未识别到章节标题，已切换为页码跳转。")
                 except Exception:
                     pass
                 self._prompt_moyu_page_jump()
@@ -1239,37 +1582,58 @@ class NormalPanel(QWidget):
     def _setup_moyu_fade(self) -> None:
         """
         函数: _setup_moyu_fade
-        作用: 初始化摸鱼文本视图的透明度特效与动画资源。
+        作用: 初始化摸鱼文本视图与页码标签共用的透明度动画。
+              动画只驱动一个 0~1 的数值，由 _apply_moyu_fade_opacity 换算为文字/背景颜色的 alpha，
+              不再安装 QGraphicsOpacityEffect，避免每帧离屏渲染整块文本控件。
         参数:
             无。
         返回:
             无。
         """
+        if self._moyu_anim is not None:
+            return
+        self._moyu_anim = QVariantAnimation(self)
+        self._moyu_anim.setDuration(220)
+        self._moyu_anim.setEasingCurve(QEasingCurve.InOutQuad)
+        self._moyu_anim.valueChanged.connect(self._apply_moyu_fade_opacity)
+        self._moyu_anim.finished.connect(self._on_moyu_fade_finished)
+
+    def _apply_moyu_fade_opacity(self, value) -> None:
+        """
+        函数: _apply_moyu_fade_opacity
+        作用: 按给定透明度改写文本视图与页码标签样式表中的颜色 alpha。
+              基准颜色在首次进入淡入淡出时从当前主题调色板取得；完全不透明时恢复原样式表，交还主题控制。
+        参数:
+            value: 透明度 0.0~1.0。
+        返回:
+            无。
+        """
         try:
-            if self._moyu_effect is None:
-                self._moyu_effect = QGraphicsOpacityEffect(self.moyu_view)
-                self.moyu_view.setGraphicsEffect(self._moyu_effect)
-                self._moyu_effect.setOpacity(0.0 if not self.moyu_view.isVisible() else 1.0)
-            if self._moyu_anim is None:
-                self._moyu_anim = QPropertyAnimation(self._moyu_effect, b"opacity", self)
-                self._moyu_anim.setDuration(220)
-                try:
-                    self._moyu_anim.setEasingCurve(QEasingCurve.InOutQuad)
-                except Exception:
-                    pass
-            if self._moyu_effect_label is None:
-                self._moyu_effect_label = QGraphicsOpacityEffect(self.moyu_page_label)
-                self.moyu_page_label.setGraphicsEffect(self._moyu_effect_label)
-                self._moyu_effect_label.setOpacity(0.0 if not self.moyu_page_label.isVisible() else 1.0)
-            if self._moyu_anim_label is None:
-                self._moyu_anim_label = QPropertyAnimation(self._moyu_effect_label, b"opacity", self)
-                self._moyu_anim_label.setDuration(220)
-                try:
-                    self._moyu_anim_label.setEasingCurve(QEasingCurve.InOutQuad)
-                except Exception:
-                    pass
+            op = max(0.0, min(1.0, float(value)))
         except Exception:
-            pass
+            op = 1.0
+        self._moyu_fade_opacity = op
+        if op >= 0.999:
+            if self._moyu_fade_colors is not None:
+                self._moyu_fade_colors = None
+                self.moyu_view.setStyleSheet(self._MOYU_VIEW_SS)
+                self.moyu_page_label.setStyleSheet(self._MOYU_LABEL_SS)
+            return
+        if self._moyu_fade_colors is None:
+            # 覆盖样式前记录主题下的文字/背景色，覆盖后调色板不再反映主题
+            pal = self.moyu_view.palette()
+            self._moyu_fade_colors = (
+                pal.color(QPalette.Text),
+                pal.color(QPalette.Base),
+                QColor(self._MOYU_LABEL_COLOR),
+            )
+        fg, bg, lbl = self._moyu_fade_colors
+
+        def rgba(c: QColor) -> str:
+            return f"rgba({c.red()},{c.green()},{c.blue()},{int(round(c.alpha() * op))})"
+
+        self.moyu_view.setStyleSheet(f"{self._MOYU_VIEW_SS} color: {rgba(fg)}; background: {rgba(bg)};")
+        self.moyu_page_label.setStyleSheet(f"color: {rgba(lbl)};")
 
     def _fade_show_moyu_view(self) -> None:
         """
@@ -1280,53 +1644,24 @@ class NormalPanel(QWidget):
         返回:
             无。
         """
+        if not self._in_moyu_mode:
+            return
+        if not self._moyu_pages:
+            return
+        self._setup_moyu_fade()
+        self._moyu_anim.stop()
+        # 从隐藏状态进入时先置为全透明再显示，避免闪现一帧
+        start = self._moyu_fade_opacity if self.moyu_view.isVisible() else 0.0
+        self._apply_moyu_fade_opacity(start)
+        self._set_moyu_view_visible(True)
         try:
-            if not self._in_moyu_mode:
-                return
-            if not self._moyu_pages:
-                return
-            self._setup_moyu_fade()
-            # 可见并从当前透明度淡入到 1.0
-            self.moyu_view.setVisible(True)
-            try:
-                self._update_moyu_page_label()
-                self.moyu_page_label.setVisible(True)
-            except Exception:
-                pass
-            start = 0.0
-            try:
-                start = float(self._moyu_effect.opacity())
-            except Exception:
-                start = 0.0
-            try:
-                self._moyu_anim.stop()
-            except Exception:
-                pass
-            try:
-                self._moyu_anim.setStartValue(start)
-                self._moyu_anim.setEndValue(1.0)
-                self._moyu_anim.start()
-            except Exception:
-                # 无动画回退：直接显示
-                self.moyu_view.setVisible(True)
-            # 页码标签淡入
-            try:
-                lbl_start = 0.0
-                try:
-                    lbl_start = float(self._moyu_effect_label.opacity())
-                except Exception:
-                    lbl_start = 0.0
-                self._moyu_anim_label.stop()
-                self._moyu_anim_label.setStartValue(lbl_start)
-                self._moyu_anim_label.setEndValue(1.0)
-                self._moyu_anim_label.start()
-            except Exception:
-                try:
-                    self.moyu_page_label.setVisible(True)
-                except Exception:
-                    pass
+            self._update_moyu_page_label()
         except Exception:
             pass
+        self.moyu_page_label.setVisible(True)
+        self._moyu_anim.setStartValue(start)
+        self._moyu_anim.setEndValue(1.0)
+        self._moyu_anim.start()
 
     def _fade_hide_moyu_view(self) -> None:
         """
@@ -1337,81 +1672,32 @@ class NormalPanel(QWidget):
         返回:
             无。
         """
-        try:
-            if not self._in_moyu_mode:
-                return
-            self._setup_moyu_fade()
-            start = 1.0
-            try:
-                start = float(self._moyu_effect.opacity())
-            except Exception:
-                start = 1.0
-            lbl_start = 1.0
-            try:
-                lbl_start = float(self._moyu_effect_label.opacity())
-            except Exception:
-                lbl_start = 1.0
-            try:
-                self._moyu_anim.stop()
-            except Exception:
-                pass
-            try:
-                self._moyu_anim_label.stop()
-            except Exception:
-                pass
-            try:
-                self._moyu_anim.setStartValue(start)
-                self._moyu_anim.setEndValue(0.0)
-                self._moyu_anim_label.setStartValue(lbl_start)
-                self._moyu_anim_label.setEndValue(0.0)
-                # 并行动画：两个透明度同时变化
-                self._moyu_anim_group = QParallelAnimationGroup(self)
-                self._moyu_anim_group.addAnimation(self._moyu_anim)
-                self._moyu_anim_group.addAnimation(self._moyu_anim_label)
-                try:
-                    # 先断开旧连接，避免重复调用
-                    self._moyu_anim_group.finished.disconnect()
-                except Exception:
-                    pass
-                self._moyu_anim_group.finished.connect(self._on_moyu_fade_out_finished)
-                self._moyu_anim_group.start()
-            except Exception:
-                # 无动画回退：直接隐藏
-                try:
-                    self.moyu_view.setVisible(False)
-                    self.moyu_page_label.setVisible(False)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        if not self._in_moyu_mode:
+            return
+        self._setup_moyu_fade()
+        self._moyu_anim.stop()
+        self._moyu_anim.setStartValue(self._moyu_fade_opacity)
+        self._moyu_anim.setEndValue(0.0)
+        self._moyu_anim.start()
 
-    def _on_moyu_fade_out_finished(self) -> None:
+    def _on_moyu_fade_finished(self) -> None:
         """
-        函数: _on_moyu_fade_out_finished
-        作用: 淡出动画结束回调，将文本视图设置为不可见以阻止事件。
+        函数: _on_moyu_fade_finished
+        作用: 淡入淡出动画结束回调；淡出到 0 时隐藏文本视图与页码标签以阻止事件，并恢复原样式表。
         参数:
             无。
         返回:
             无。
         """
-        try:
-            # 动画结束时若透明度为 0 则隐藏
-            op = 1.0
-            try:
-                op = float(self._moyu_effect.opacity())
-            except Exception:
-                op = 0.0
-            if op <= 0.001:
-                self.moyu_view.setVisible(False)
-            lbl_op = 1.0
-            try:
-                lbl_op = float(self._moyu_effect_label.opacity())
-            except Exception:
-                lbl_op = 0.0
-            if lbl_op <= 0.001:
-                self.moyu_page_label.setVisible(False)
-        except Exception:
-            pass
+        if self._moyu_fade_opacity > 0.001:
+            return
+        self._set_moyu_view_visible(False)
+        self.moyu_page_label.setVisible(False)
+        # 隐藏后交还主题样式；下次淡入会先重新置为全透明
+        self._moyu_fade_colors = None
+        self.moyu_view.setStyleSheet(self._MOYU_VIEW_SS)
+        self.moyu_page_label.setStyleSheet(self._MOYU_LABEL_SS)
+
     def apply_unary(self, op: str) -> None:
         """
         函数: apply_unary
@@ -1423,32 +1709,25 @@ class NormalPanel(QWidget):
         """
         try:
             txt = self.display.text().strip()
-            val = 0.0
-            if txt:
-                val = safe_eval(txt)
-            if op == "%":
-                result = val / 100.0
-            elif op == "√":
-                result = safe_eval(f"sqrt({val})", functions={"sqrt": __import__("math").sqrt})
-            elif op == "x²":
-                result = val * val
-            elif op == "1/x":
-                if val == 0:
-                    raise ValueError("除零错误")
-                result = 1.0 / val
-            elif op == "±":
+            if op == "±":
                 # 直接切换输入的符号
                 if txt.startswith("-"):
                     self.display.setText(txt[1:])
                 else:
                     self.display.setText("-" + txt)
                 return
-            else:
+            func = _UNARY_FUNCS.get(op)
+            if func is None:
                 return
+            val = 0.0
+            if txt:
+                val = safe_eval(txt.translate(_OP_TABLE))
+            # 操作集合固定，直接调用对应函数，不再拼接表达式交给 safe_eval 重新解析
+            result = float(func(val))
             self.display.setText(str(result))
-            self.history.addItem(f"{op} -> {result}")
+            self._push_history(f"{op} -> {result}")
         except Exception as e:
-            self.history.addItem(f"[错误] 一元操作: {e}")
+            self._push_history(f"[错误] 一元操作: {e}")
 
     def _on_moyu_settings_clicked(self) -> None:
         """
@@ -1474,20 +1753,21 @@ class NormalPanel(QWidget):
             无。
         """
         if not path:
-            self.history.addItem("[提示] 请输入电子书目录路径")
+            self._push_history("[提示] 请输入电子书目录路径")
             return
         if not os.path.isdir(path):
-            self.history.addItem(f"[错误] 非有效目录: {path}")
+            self._push_history(f"[错误] 非有效目录: {path}")
             return
         try:
             files = list_supported_book_files(path)
         except Exception as exc:
-            self.history.addItem(f"[错误] {exc}")
+            self._push_history(f"[错误] {exc}")
             return
         if not files:
-            self.history.addItem("[提示] 目录下未找到支持的电子书文件（.txt / .epub）")
+            self._push_history("[提示] 目录下未找到支持的电子书文件（.txt / .epub）")
+            self._use_moyu_scratch_document()
             self.moyu_view.clear()
-            self.moyu_view.setVisible(False)
+            self._set_moyu_view_visible(False)
             return
         selected_mode = False
         selected_name = None
@@ -1512,14 +1792,14 @@ class NormalPanel(QWidget):
                     "Books (*.txt *.epub);;Text Files (*.txt);;EPUB Files (*.epub)",
                 )
                 if not fp:
-                    self.history.addItem("[提示] 已取消选择")
+                    self._push_history("[提示] 已取消选择")
                     return
                 try:
                     base = os.path.basename(fp)
                 except Exception:
                     base = fp
                 if base not in files:
-                    self.history.addItem("[错误] 请选择当前目录内的 TXT 或 EPUB 文件")
+                    self._push_history("[错误] 请选择当前目录内的 TXT 或 EPUB 文件")
                     return
                 files = [base]
                 selected_name = base
@@ -1535,344 +1815,375 @@ class NormalPanel(QWidget):
             pass
         # 提示加载进行中，避免用户误以为无响应
         try:
-            self.history.addItem("正在加载...")
+            self._push_history("正在加载...")
         except Exception:
             pass
-        # 初始化分页会话（行暂存与页面清空）
+        # 初始化分页会话（清空页面与换行缓存）
         self._moyu_pages = []
+        self._clear_moyu_page_documents()
         self._moyu_page_char_offsets = []
-        self._moyu_line_staging = []
-        self._moyu_line_cache.clear()
-        self._moyu_chunk_buffer = ""
+        # 换行缓存按内容哈希区分，不随加载清空：重新打开同一本书时直接命中
         self._moyu_full_text = ""
+        self._moyu_full_text_key = ""
+        self._moyu_loaded_len = 0
         self._moyu_explicit_chapters = []
         # 计算内容宽度
         width = self._get_moyu_content_width()
-        # 改为异步读取：将文件读取放入线程，主线程分页与渲染
-        try:
-            if self._loader_thread is not None:
-                try:
-                    self._loader_thread.quit()
-                    self._loader_thread.wait()
-                except Exception:
-                    pass
-            class _Worker(QObject):
-                textChunk = Signal(str)
-                headerChunk = Signal(str)
-                bookMeta = Signal(object)
-                fileEnded = Signal()
-                finished = Signal()
-                error = Signal(str)
-                def __init__(self, base_path: str, names: list, emit_header: bool) -> None:
-                    super().__init__()
-                    self.base_path = base_path
-                    self.names = names
-                    self.emit_header = bool(emit_header)
-                def run(self) -> None:
-                    try:
-                        for name in self.names:
-                            fp = os.path.join(self.base_path, name)
-                            if self.emit_header:
-                                self.headerChunk.emit(f"===== {name} =====\n")
-                            try:
-                                content = load_book_content(fp)
-                                self.bookMeta.emit({
-                                    "name": name,
-                                    "chapters": [(chapter.title, chapter.char_offset) for chapter in content.chapters],
-                                })
-                                text = content.text
-                                for idx in range(0, len(text), 64 * 1024):
-                                    chunk = text[idx:idx + (64 * 1024)]
-                                    self.textChunk.emit(chunk)
-                            except Exception as e:
-                                self.error.emit(f"读取失败: {name} -> {e}")
-                            self.fileEnded.emit()
-                        self.finished.emit()
-                    except Exception as e:
-                        self.error.emit(str(e))
-                        self.finished.emit()
-            self._loader_thread = QThread(self)
-            self._loader_worker = _Worker(path, files, emit_header=not selected_mode and len(files) > 1)
+        # 异步读取：文件读取放入线程，主线程在加载结束后一次性分页与渲染
+        try:
+            if self._loader_worker is not None:
+                # 上一次加载仍在进行：置取消标志，不再阻塞等待；其排队信号由发送者校验丢弃
+                self._loader_worker.cancelled = True
+                self._moyu_retired_workers.add(self._loader_worker)
+                self._loader_worker = None
+            if self._loader_thread is None:
+                self._loader_thread = QThread(self)
+                self._loader_thread.start()
+                QCoreApplication.instance().aboutToQuit.connect(self._stop_moyu_loader_thread)
+                # 未经事件循环退出（如脚本直接结束）时，面板析构前同样先结束线程
+                self.destroyed.connect(functools.partial(_stop_thread, self._loader_thread))
+            self._moyu_text_parts = []
+            self._moyu_loaded_offsets = []
+            # 换行在工作线程完成：按当前内容宽度与视图字体（按值复制）排版
+            self._moyu_loaded_wrap_key = (int(width), self._moyu_font_key())
+            self._moyu_loaded_page_offsets = []
+            self._moyu_loaded_lines_per_page = max(1, int(self._get_lines_per_page()))
+            self._moyu_loading_path = path
+            self._moyu_loading_name = selected_name
+            self._loader_worker = _MoyuLoaderWorker(
+                path, files, emit_header=not selected_mode and len(files) > 1,
+                width=width, font=self.moyu_view.font(),
+                lines_per_page=self._moyu_loaded_lines_per_page,
+            )
             self._loader_worker.moveToThread(self._loader_thread)
-            self._loader_thread.started.connect(self._loader_worker.run)
-            def on_header(s: str) -> None:
-                try:
-                    header_lines = self._wrap_text_to_lines_doc(s, width)
-                except Exception:
-                    header_lines = [s.strip()] if s.strip() else []
-                self._append_lines_to_pages(header_lines)
-                try:
-                    self._moyu_full_text += s
-                except Exception:
-                    pass
-                try:
-                    QCoreApplication.processEvents()
-                except Exception:
-                    pass
-            def on_book_meta(meta: object) -> None:
-                try:
-                    if isinstance(meta, dict):
-                        chapters = meta.get("chapters", [])
-                    else:
-                        chapters = []
-                    self._register_moyu_loaded_chapters(chapters, len(self._moyu_full_text))
-                except Exception:
-                    pass
-            def on_chunk(s: str) -> None:
-                combined = self._moyu_chunk_buffer + s
-                parts = combined.splitlines(True)
-                if parts:
-                    if not (parts[-1].endswith("\n") or parts[-1].endswith("\r")):
-                        self._moyu_chunk_buffer = parts[-1]
-                        commit_text = "".join(parts[:-1])
-                    else:
-                        self._moyu_chunk_buffer = ""
-                        commit_text = "".join(parts)
-                else:
-                    commit_text = combined
-                    self._moyu_chunk_buffer = ""
-                if commit_text:
-                    try:
-                        lines = self._wrap_text_to_lines_doc(commit_text, width)
-                    except Exception:
-                        lines = commit_text.splitlines()
-                    self._append_lines_to_pages(lines)
-                    try:
-                        self._moyu_full_text += commit_text
-                    except Exception:
-                        pass
-                try:
-                    QCoreApplication.processEvents()
-                except Exception:
-                    pass
-            def on_file_end() -> None:
-                try:
-                    if self._moyu_chunk_buffer:
-                        tail_lines = self._wrap_text_to_lines_doc(self._moyu_chunk_buffer, width)
-                        self._append_lines_to_pages(tail_lines)
-                        try:
-                            self._moyu_full_text += self._moyu_chunk_buffer
-                        except Exception:
-                            pass
-                        self._moyu_chunk_buffer = ""
-                except Exception:
-                    pass
-                self._append_lines_to_pages([""])
-            def on_finished() -> None:
-                self._finalize_pages_from_staging()
-                try:
-                    if self._moyu_full_text:
-                        self._compute_moyu_pages_from_text(self._moyu_full_text)
-                except Exception:
-                    pass
-                try:
-                    restore_idx = self._restore_moyu_page()
-                    self._show_moyu_page(restore_idx)
-                    self.set_moyu_mode(True)
-                except Exception:
-                    try:
-                        self.moyu_view.setPlainText(self._moyu_pages[0] if self._moyu_pages else "")
-                        self.moyu_view.setVisible(True)
-                        self.moyu_page_label.setVisible(True)
-                        self.set_moyu_mode(True)
-                    except Exception:
-                        pass
-                self.history.addItem("已加载")
-                try:
-                    SettingsService.set_moyu_path(path)
-                    if selected_name:
-                        SettingsService.set_moyu_last_file(selected_name)
-                except Exception:
-                    pass
-                try:
-                    if self.moyu_path_edit.isVisible():
-                        self.moyu_path_edit.setVisible(False)
-                except Exception:
-                    pass
-                try:
-                    self._loader_thread.quit()
-                except Exception:
-                    pass
-            def on_error(msg: str) -> None:
-                try:
-                    self.history.addItem(f"[警告] {msg}")
-                except Exception:
-                    pass
-            self._loader_worker.headerChunk.connect(on_header)
-            self._loader_worker.bookMeta.connect(on_book_meta)
-            self._loader_worker.textChunk.connect(on_chunk)
-            self._loader_worker.fileEnded.connect(on_file_end)
-            self._loader_worker.finished.connect(on_finished)
-            self._loader_worker.error.connect(on_error)
-            self._loader_thread.start()
+            # 连接到本对象的方法：接收者位于主线程，信号以队列方式投递，UI 线程只处理结果
+            self._loader_worker.headerChunk.connect(self._on_moyu_loader_text)
+            self._loader_worker.bookMeta.connect(self._on_moyu_loader_meta)
+            self._loader_worker.textChunk.connect(self._on_moyu_loader_text)
+            self._loader_worker.linesChunk.connect(self._on_moyu_loader_lines)
+            self._loader_worker.pagesChunk.connect(self._on_moyu_loader_pages)
+            self._loader_worker.wrapFailed.connect(self._on_moyu_loader_wrap_failed)
+            self._loader_worker.finished.connect(self._on_moyu_loader_finished)
+            self._loader_worker.error.connect(self._on_moyu_loader_error)
+            # 排队调用：run 在常驻线程中执行，被取消的旧任务结束后才开始
+            QMetaObject.invokeMethod(self._loader_worker, "run", Qt.QueuedConnection)
             return
         except Exception as e:
-            self.history.addItem(f"[错误] 启动异步加载失败: {e}")
-            # 回退到同步模式（原有逻辑）
-            for name in files:
-                fp = os.path.join(path, name)
-                opened = False
-                if not selected_mode and len(files) > 1:
-                    header = f"===== {name} =====\n"
-                    try:
-                        header_lines = self._wrap_text_to_lines_doc(header, width)
-                    except Exception:
-                        header_lines = [header.strip()] if header.strip() else []
-                    self._append_lines_to_pages(header_lines)
-                    try:
-                        self._moyu_full_text += header
-                    except Exception:
-                        pass
-                try:
-                    content = load_book_content(fp)
-                    self._register_moyu_loaded_chapters(
-                        [(chapter.title, chapter.char_offset) for chapter in content.chapters],
-                        len(self._moyu_full_text),
-                    )
-                    opened = True
-                    for idx in range(0, len(content.text), 64 * 1024):
-                        chunk = content.text[idx:idx + (64 * 1024)]
-                        combined = self._moyu_chunk_buffer + chunk
-                        parts = combined.splitlines(True)
-                        if parts:
-                            if not (parts[-1].endswith("\n") or parts[-1].endswith("\r")):
-                                self._moyu_chunk_buffer = parts[-1]
-                                commit_text = "".join(parts[:-1])
-                            else:
-                                self._moyu_chunk_buffer = ""
-                                commit_text = "".join(parts)
-                        else:
-                            commit_text = combined
-                            self._moyu_chunk_buffer = ""
-                        if commit_text:
-                            lines = self._wrap_text_to_lines_doc(commit_text, width)
-                            self._append_lines_to_pages(lines)
-                            try:
-                                self._moyu_full_text += commit_text
-                            except Exception:
-                                pass
-                            try:
-                                QCoreApplication.processEvents()
-                            except Exception:
-                                pass
-                    if self._moyu_chunk_buffer:
-                        tail_lines = self._wrap_text_to_lines_doc(self._moyu_chunk_buffer, width)
-                        self._append_lines_to_pages(tail_lines)
-                        try:
-                            self._moyu_full_text += self._moyu_chunk_buffer
-                        except Exception:
-                            pass
-                        self._moyu_chunk_buffer = ""
-                except Exception:
-                    opened = False
-                if not opened:
-                    self.history.addItem(f"[警告] 读取失败: {name}")
-                self._append_lines_to_pages([""])
-        # 会话收尾：若有剩余行，形成最后一页
-        self._finalize_pages_from_staging()
+            self._push_history(f"[错误] 启动异步加载失败: {e}")
+
+    def _is_current_moyu_loader(self) -> bool:
+        """
+        函数: _is_current_moyu_loader
+        作用: 判断信号是否来自当前加载任务，丢弃上一次加载残留的排队信号。
+        参数:
+            无。
+        返回:
+            bool: 发送者为当前工作对象时返回 True。
+        """
+        sender = self.sender()
+        return sender is None or sender is self._loader_worker
+
+    def _on_moyu_loader_text(self, s: str) -> None:
+        """
+        函数: _on_moyu_loader_text
+        作用: 暂存工作线程读取到的文本片段（含多文件标题行），加载结束后统一拼接。
+        参数:
+            s: 文本片段。
+        返回:
+            无。
+        """
+        if not self._is_current_moyu_loader():
+            return
+        self._moyu_text_parts.append(s)
+        self._moyu_loaded_len += len(s)
+
+    def _on_moyu_loader_lines(self, offsets: object) -> None:
+        """
+        函数: _on_moyu_loader_lines
+        作用: 暂存工作线程换行后各物理行的全文起始偏移，主线程只做列表拼接。
+        参数:
+            offsets: 物理行起始偏移列表。
+        返回:
+            无。
+        """
+        if not self._is_current_moyu_loader():
+            return
+        self._moyu_loaded_offsets.extend(offsets)
+
+    def _on_moyu_loader_pages(self, offsets: object) -> None:
+        """
+        函数: _on_moyu_loader_pages
+        作用: 暂存工作线程切好的整页页首偏移。
+        参数:
+            offsets: 各页在全文中的起始偏移。
+        返回:
+            无。
+        """
+        if not self._is_current_moyu_loader():
+            return
+        self._moyu_loaded_page_offsets.extend(offsets)
+
+    def _on_moyu_loader_wrap_failed(self) -> None:
+        """
+        函数: _on_moyu_loader_wrap_failed
+        作用: 工作线程换行失败时丢弃已收到的行，加载结束后改由主线程换行。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        if not self._is_current_moyu_loader():
+            return
+        self._moyu_loaded_wrap_key = None
+        self._moyu_loaded_offsets = []
+        self._moyu_loaded_page_offsets = []
+
+    def _on_moyu_loader_meta(self, meta: object) -> None:
+        """
+        函数: _on_moyu_loader_meta
+        作用: 登记当前文件的章节目录，偏移以已接收的字符数为基准。
+        参数:
+            meta: 形如 {"name": str, "chapters": list[tuple[str, int]]} 的字典。
+        返回:
+            无。
+        """
+        if not self._is_current_moyu_loader():
+            return
+        chapters = meta.get("chapters", []) if isinstance(meta, dict) else []
+        self._register_moyu_loaded_chapters(chapters, self._moyu_loaded_len)
+
+    def _on_moyu_loader_error(self, msg: str) -> None:
+        """
+        函数: _on_moyu_loader_error
+        作用: 在历史列表中提示工作线程的读取错误。
+        参数:
+            msg: 错误信息。
+        返回:
+            无。
+        """
+        if not self._is_current_moyu_loader():
+            return
+        self._push_history(f"[警告] {msg}")
+
+    def _on_moyu_loader_finished(self) -> None:
+        """
+        函数: _on_moyu_loader_finished
+        作用: 加载完成后拼接全文、一次性分页并恢复阅读位置，持久化路径并结束线程。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        sender = self.sender()
+        if sender in self._moyu_retired_workers:
+            # 被取消的旧任务已结束：此时释放引用，工作对象不会在运行中被析构
+            self._moyu_retired_workers.discard(sender)
+            return
+        if not self._is_current_moyu_loader():
+            return
+        path = self._moyu_loading_path
+        selected_name = self._moyu_loading_name
+        self._moyu_full_text = "".join(self._moyu_text_parts)
+        self._moyu_text_parts = []
+        offsets = self._moyu_loaded_offsets
+        page_offsets = self._moyu_loaded_page_offsets
+        self._moyu_loaded_offsets = []
+        self._moyu_loaded_page_offsets = []
         try:
             if self._moyu_full_text:
-                self._compute_moyu_pages_from_text(self._moyu_full_text)
+                self._moyu_full_text_key = self._moyu_text_key(self._moyu_full_text)
+                # 加载期间宽度与字体未变时，工作线程的换行结果直接作为换行缓存；
+                # 每页行数也未变时直接采用工作线程切好的页，否则按缓存重新切页
+                wrap_key = (int(self._get_moyu_content_width()), self._moyu_font_key())
+                paged = False
+                if offsets and wrap_key == self._moyu_loaded_wrap_key:
+                    cache_key = wrap_key + (self._moyu_full_text_key,)
+                    self._store_moyu_wrap(cache_key, offsets)
+                    n = max(1, int(self._get_lines_per_page()))
+                    if page_offsets and n == self._moyu_loaded_lines_per_page:
+                        self._store_moyu_page_offsets(cache_key + (n,), page_offsets)
+                        self._set_moyu_pages(self._moyu_full_text, page_offsets)
+                        paged = True
+                if not paged:
+                    self._compute_moyu_pages_from_text(self._moyu_full_text, self._moyu_full_text_key)
         except Exception:
             pass
-        # 展示恢复页并进入摸鱼模式
         try:
             restore_idx = self._restore_moyu_page()
             self._show_moyu_page(restore_idx)
             self.set_moyu_mode(True)
         except Exception:
-            # 回退：若分页失败则直接显示第一页或空
             try:
+                self._use_moyu_scratch_document()
                 self.moyu_view.setPlainText(self._moyu_pages[0] if self._moyu_pages else "")
-                self.moyu_view.setVisible(True)
+                self._set_moyu_view_visible(True)
                 self.moyu_page_label.setVisible(True)
                 self.set_moyu_mode(True)
             except Exception:
                 pass
-        # 更加隐形：不显示数量，仅提示“已加载”
-        self.history.addItem("已加载")
-        # 持久化路径
+        self._push_history("已加载")
         try:
             SettingsService.set_moyu_path(path)
             if selected_name:
                 SettingsService.set_moyu_last_file(selected_name)
         except Exception:
             pass
-        # 若本面板路径框当前可见，加载后隐藏
         try:
             if self.moyu_path_edit.isVisible():
                 self.moyu_path_edit.setVisible(False)
         except Exception:
             pass
+        # 本次加载结束：线程保留给下次加载复用，只释放工作对象
+        self._loader_worker = None
 
-    def _compute_moyu_pages_from_text(self, text: str) -> None:
+    def _stop_moyu_loader_thread(self) -> None:
+        """
+        函数: _stop_moyu_loader_thread
+        作用: 应用退出前取消正在进行的加载并结束常驻加载线程，避免线程运行中被析构。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        if self._loader_worker is not None:
+            self._loader_worker.cancelled = True
+        if self._loader_thread is not None:
+            _stop_thread(self._loader_thread)
+
+    def _compute_moyu_pages_from_text(self, text: str, content_key: str = "") -> None:
         """
         函数: _compute_moyu_pages_from_text
         作用: 将完整文本按当前视图内容宽度进行物理换行，
               并固定每页为三行进行分页；当视图尚未布局时，
-              回退使用容器宽度进行估算。
+              回退使用容器宽度进行估算。换行结果按（宽度, 字体, 内容哈希）缓存，
+              命中时仅按当前高度重新切页；切页结果再按每页行数缓存，全部命中时直接复用。
         参数:
             text: 完整文本内容。
+            content_key: 预先算好的内容哈希；为空时现场计算。
         返回:
             无。（结果存入 self._moyu_pages）
         """
+        # 动态每页行数：每页只记录首行偏移，页文本取页时从全文切片
+        n = max(1, int(self._get_lines_per_page()))
         try:
             width = self._get_moyu_content_width()
-            lines, line_offsets = self._wrap_text_to_lines_doc_with_offsets(text, width)
+            cache_key = (int(width), self._moyu_font_key(), content_key or self._moyu_text_key(text))
+            page_offsets = self._moyu_page_offsets_cache.get(cache_key + (n,))
+            if page_offsets is None:
+                line_offsets = self._moyu_wrap_cache.get(cache_key)
+                if line_offsets is None:
+                    _, line_offsets = self._wrap_text_to_lines_doc_with_offsets(text, width)
+                    self._store_moyu_wrap(cache_key, line_offsets)
+                # 命中换行缓存时宽度与字体未变，仅按当前高度重新切页
+                page_offsets = line_offsets[::n]
+                self._store_moyu_page_offsets(cache_key + (n,), page_offsets)
         except Exception:
             # 回退：按原始行切分
-            lines = text.splitlines()
-            line_offsets = []
-        # 动态每页行数
-        n = self._get_lines_per_page()
-        n = max(1, int(n))
-        pages = []
-        page_offsets = []
-        i = 0
-        total_lines = len(lines)
-        while i < total_lines:
-            j = min(i + n, total_lines)
-            pages.append("\n".join(lines[i:j]))
-            try:
-                if line_offsets and i < len(line_offsets):
-                    page_offsets.append(max(0, int(line_offsets[i])))
-                else:
-                    page_offsets.append(0)
-            except Exception:
-                page_offsets.append(0)
-            i = j
-        if not pages:
-            pages = [""]
+            _, line_offsets = _split_lines_with_offsets(text)
+            page_offsets = line_offsets[::n]
+        self._set_moyu_pages(text, page_offsets)
+
+    def _set_moyu_pages(self, text: str, page_offsets: list) -> None:
+        """
+        函数: _set_moyu_pages
+        作用: 采用新的分页结果：释放旧页文档，以全文与页首偏移表建立页序列并回到第一页。
+        参数:
+            text: 分页所依据的全文。
+            page_offsets: 各页首行在全文中的起始偏移；为空时视为一张空白页。
+        返回:
+            无。
+        """
+        if not page_offsets:
             page_offsets = [0]
-        self._moyu_pages = pages
-        if len(page_offsets) != len(self._moyu_pages):
-            page_offsets = [0 for _ in self._moyu_pages]
+        self._moyu_pages = _MoyuPages(text, page_offsets)
+        self._clear_moyu_page_documents()
         self._moyu_page_char_offsets = page_offsets
         self._moyu_page_index = 0
 
+    def _store_moyu_wrap(self, cache_key: tuple, offsets: list) -> None:
+        """
+        函数: _store_moyu_wrap
+        作用: 写入全文换行缓存；只保存各行起始偏移（行文本可由全文切出），
+              先进先出，超过 8 个键时淘汰最早写入的键。
+        参数:
+            cache_key: (宽度, 字体键, 内容哈希)。
+            offsets: 各物理行在全文中的起始偏移。
+        返回:
+            无。
+        """
+        self._moyu_wrap_cache[cache_key] = offsets
+        while len(self._moyu_wrap_cache) > 8:
+            self._moyu_wrap_cache.pop(next(iter(self._moyu_wrap_cache)), None)
+
+    def _store_moyu_page_offsets(self, cache_key: tuple, page_offsets: list) -> None:
+        """
+        函数: _store_moyu_page_offsets
+        作用: 写入分页缓存；先进先出，超过 4 个键时淘汰最早写入的键。
+        参数:
+            cache_key: (宽度, 字体键, 内容哈希, 每页行数)。
+            page_offsets: 各页首行在全文中的起始偏移。
+        返回:
+            无。
+        """
+        self._moyu_page_offsets_cache[cache_key] = page_offsets
+        while len(self._moyu_page_offsets_cache) > 4:
+            self._moyu_page_offsets_cache.pop(next(iter(self._moyu_page_offsets_cache)), None)
+
+    def _moyu_font_key(self) -> tuple:
+        """
+        函数: _moyu_font_key
+        作用: 返回文本视图当前字体的缓存键（字体族、字号、字重）。
+        参数:
+            无。
+        返回:
+            tuple: (family, pointSize, weight)；获取失败时返回 ("default",)。
+        """
+        try:
+            font = self.moyu_view.font()
+            return (font.family(), int(font.pointSize()), int(font.weight()))
+        except Exception:
+            return ("default",)
+
+    def _moyu_text_key(self, text: str) -> str:
+        """
+        函数: _moyu_text_key
+        作用: 计算文本内容哈希，作为换行缓存键的一部分。
+        参数:
+            text: 文本内容。
+        返回:
+            str: blake2b 十六进制摘要；失败时回退为长度标记。
+        """
+        try:
+            return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+        except Exception:
+            return f"len:{len(text)}"
+
     def _get_moyu_content_width(self) -> int:
         """
         函数: _get_moyu_content_width
         作用: 计算文本视图的内容可用宽度（减去文档边距），在视图未布局时回退到容器宽度。
+              视口已布局时缓存结果，视图尺寸或字体变化时作废。
         参数:
             无。
         返回:
             int: 内容像素宽度。
         """
-        try:
-            doc_m = int(self.moyu_view.document().documentMargin())
-        except Exception:
-            doc_m = 0
+        if self._moyu_content_width is not None:
+            return self._moyu_content_width
+        doc_m = self._moyu_doc_margin
         vw = 0
         try:
             vw = int(self.moyu_view.viewport().width())
         except Exception:
             vw = 0
-        if vw <= 1:
-            try:
-                vw = int(self.moyu_view.width())
-            except Exception:
-                vw = 0
+        if vw > 1:
+            self._moyu_content_width = max(1, vw - doc_m * 2)
+            return self._moyu_content_width
+        # 视口未布局：回退值不缓存
+        try:
+            vw = int(self.moyu_view.width())
+        except Exception:
+            vw = 0
         if vw <= 1:
             try:
                 vw = int(self.moyu_box.width())
@@ -1880,77 +2191,53 @@ class NormalPanel(QWidget):
                 vw = 320
         return max(1, vw - doc_m * 2)
 
-    def _wrap_text_to_lines(self, text: str, width: int) -> list:
+    def _moyu_wrap_option(self) -> QTextOption:
         """
-        函数: _wrap_text_to_lines
-        作用: 使用 QTextLayout 按指定宽度对原始文本进行物理换行，返回行列表；
-              保留空行，换行仅在单词边界或必要位置断开。
+        函数: _moyu_wrap_option
+        作用: 构造段落换行所用的文本选项（单词边界优先，必要时任意位置断行）。
         参数:
-            text: 原始文本。
-            width: 目标内容宽度（像素）。
+            无。
         返回:
-            list[str]: 换行后的物理行列表。
+            QTextOption。
         """
-        # 构造缓存键：宽度 + 字体 + 文本长度（避免存储过大哈希）
-        try:
-            font = self.moyu_view.font()
-            font_key = f"{font.family()}-{font.pointSize()}"
-        except Exception:
-            font_key = "default"
-        try:
-            content_key = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
-        except Exception:
-            content_key = f"len:{len(text)}"
-        cache_key = (int(width), font_key, content_key)
-        cached = self._moyu_line_cache.get(cache_key)
-        if cached is not None:
-            return cached
         opt = QTextOption()
+        opt.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        return opt
+
+    def _layout_paragraph_lines(self, para: str, width: int, font, opt: QTextOption) -> list:
+        """
+        函数: _layout_paragraph_lines
+        作用: 使用 QTextLayout 在 Qt 原生排版层对单个段落断行，仅按返回的起止位置切片取行；
+              排版失败时按平均字符宽度估算切分。
+        参数:
+            para: 不含换行符的非空段落。
+            width: 内容宽度（像素）。
+            font: 排版字体。
+            opt: 换行选项。
+        返回:
+            list[str]: 该段落的物理行。
+        """
+        lines_out = []
         try:
-            opt.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+            layout = QTextLayout(para, font)
+            layout.setTextOption(opt)
+            layout.beginLayout()
+            while True:
+                line = layout.createLine()
+                if not line.isValid():
+                    break
+                line.setLineWidth(float(width))
+                start = line.textStart()
+                lines_out.append(para[start:start + line.textLength()])
+            layout.endLayout()
         except Exception:
-            pass
-        lines_out = []
-        # 逐段处理，保持原始换行
-        for para in text.splitlines():
-            if para == "":
-                lines_out.append("")
-                continue
+            # 回退：简单按字符估算长度换行
             try:
-                layout = QTextLayout(para, self.moyu_view.font())
-                layout.setTextOption(opt)
-                layout.beginLayout()
-                while True:
-                    line = layout.createLine()
-                    if not line.isValid():
-                        break
-                    line.setLineWidth(float(width))
-                    start = int(line.textStart())
-                    length = int(line.textLength())
-                    lines_out.append(para[start:start+length])
-                layout.endLayout()
+                avg = max(1, int(self.moyu_view.fontMetrics().averageCharWidth()))
+                chars = max(1, int(width / avg))
             except Exception:
-                # 回退：简单按字符估算长度换行
-                try:
-                    avg = max(1, int(self.moyu_view.fontMetrics().averageCharWidth()))
-                    chars = max(1, int(width / avg))
-                except Exception:
-                    chars = 60
-                i = 0
-                while i < len(para):
-                    lines_out.append(para[i:i+chars])
-                    i += chars
-        # 写入缓存
-        self._moyu_line_cache[cache_key] = lines_out
-        # 简单的缓存上限：仅保留最近一个键，防止内存累积
-        try:
-            if len(self._moyu_line_cache) > 3:
-                # 移除非当前键的旧键
-                for k in list(self._moyu_line_cache.keys()):
-                    if k != cache_key:
-                        self._moyu_line_cache.pop(k, None)
-        except Exception:
-            pass
+                chars = 60
+            lines_out = [para[i:i + chars] for i in range(0, len(para), chars)]
         return lines_out
 
     def _show_moyu_page(self, index: int) -> None:
@@ -1963,31 +2250,58 @@ class NormalPanel(QWidget):
             无。
         """
         if not self._moyu_pages:
-            self.moyu_view.setVisible(False)
+            self._set_moyu_view_visible(False)
             self.moyu_page_label.setVisible(False)
             return
         index = max(0, min(index, len(self._moyu_pages) - 1))
         self._moyu_page_index = index
         # 双缓冲效果：更新前暂时禁用绘制，减少闪烁
-        try:
-            self.moyu_view.setUpdatesEnabled(False)
-        except Exception:
-            pass
-        self.moyu_view.setPlainText(self._moyu_pages[index])
-        try:
-            self.moyu_view.setUpdatesEnabled(True)
-            self.moyu_view.viewport().update()
-        except Exception:
-            pass
-        self.moyu_view.setVisible(True)
+        self.moyu_view.setUpdatesEnabled(False)
+        self.moyu_view.setDocument(self._moyu_page_document(index))
+        self._moyu_shown_index = index
+        self.moyu_view.setUpdatesEnabled(True)
+        self.moyu_view.viewport().update()
+        self._set_moyu_view_visible(True)
         self._update_moyu_page_label()
-        try:
-            self._prefetch_neighbors(index)
-        except Exception:
-            pass
+        self._prefetch_timer.start()
         # 持久化当前页码
         self._persist_moyu_page()
 
+    def _queue_moyu_page(self, index: int) -> None:
+        """
+        函数: _queue_moyu_page
+        作用: 交互翻页入口（按键/滚轮）：页码立即更新以便连续翻页正确累计；
+              本帧尚未翻页时立即显示，否则只记录目标页，由节流定时器在下一帧显示最新一页。
+        参数:
+            index: 目标页索引（0基）。
+        返回:
+            无。
+        """
+        if not self._moyu_pages:
+            return
+        self._moyu_page_index = max(0, min(index, len(self._moyu_pages) - 1))
+        if self._page_timer.isActive():
+            self._moyu_page_pending = True
+            return
+        self._show_moyu_page(self._moyu_page_index)
+        self._page_timer.start()
+
+    def _flush_moyu_page(self) -> None:
+        """
+        函数: _flush_moyu_page
+        作用: 翻页节流定时器回调；节流期间有被合并的翻页时显示最新目标页，并开始下一帧的节流。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        if not self._moyu_page_pending:
+            return
+        self._moyu_page_pending = False
+        if self._moyu_pages:
+            self._show_moyu_page(self._moyu_page_index)
+            self._page_timer.start()
+
     def _update_moyu_page_label(self) -> None:
         """
         函数: _update_moyu_page_label
@@ -1997,14 +2311,11 @@ class NormalPanel(QWidget):
         返回:
             无。
         """
-        try:
-            total = len(self._moyu_pages) if self._moyu_pages else 0
-            current = self._moyu_page_index + 1 if total > 0 else 0
-            # 仅显示数字页码
-            self.moyu_page_label.setText(f"{current} / {total}")
-            self.moyu_page_label.setVisible(total >= 1)
-        except Exception:
-            pass
+        total = len(self._moyu_pages)
+        current = self._moyu_page_index + 1 if total > 0 else 0
+        # 仅显示数字页码
+        self.moyu_page_label.setText(f"{current} / {total}")
+        self.moyu_page_label.setVisible(total >= 1)
 
     def _set_moyu_progress_context(self, path: str, selected_name: str) -> None:
         """
@@ -2293,30 +2604,12 @@ class NormalPanel(QWidget):
             int。
         """
         try:
-            fm = self.moyu_view.fontMetrics()
             h = int(self.moyu_view.viewport().height())
-            line_h = max(1, int(fm.lineSpacing()))
-            n = max(1, (h // line_h) - 1)
+            n = max(1, (h // self._moyu_line_h) - 1)
             return int(n)
         except Exception:
             return 3
 
-    def _wrap_text_to_lines_doc(self, text: str, width: int) -> list:
-        """
-        函数: _wrap_text_to_lines_doc
-        作用: 使用 QTextDocument 进行段落布局并按指定宽度换行，返回物理行列表。
-        参数:
-            text: 原始文本。
-            width: 内容宽度（像素）。
-        返回:
-            list[str]。
-        """
-        try:
-            lines, _ = self._wrap_text_to_lines_doc_with_offsets(text, width)
-            return lines
-        except Exception:
-            return text.splitlines()
-
     def _wrap_text_to_lines_fallback_with_offsets(self, text: str, width: int):
         """
         函数: _wrap_text_to_lines_fallback_with_offsets
@@ -2340,6 +2633,8 @@ class NormalPanel(QWidget):
         lines = []
         offsets = []
         pos = 0
+        font = self.moyu_view.font()
+        opt = self._moyu_wrap_option()
         for raw in raws:
             para = raw
             newline_len = 0
@@ -2349,13 +2644,11 @@ class NormalPanel(QWidget):
             elif raw.endswith("\n") or raw.endswith("\r"):
                 para = raw[:-1]
                 newline_len = 1
-            try:
-                if para == "":
-                    wrapped = [""]
-                else:
-                    wrapped = self._wrap_text_to_lines(para, width)
-            except Exception:
-                wrapped = [para] if para != "" else [""]
+            # 逐段直接排版；整篇结果由调用方按（宽度, 字体, 内容哈希）缓存
+            if para == "":
+                wrapped = [""]
+            else:
+                wrapped = self._layout_paragraph_lines(para, width, font, opt)
             if not wrapped:
                 wrapped = [""]
             rel = 0
@@ -2370,7 +2663,8 @@ class NormalPanel(QWidget):
     def _wrap_text_to_lines_doc_with_offsets(self, text: str, width: int):
         """
         函数: _wrap_text_to_lines_doc_with_offsets
-        作用: 使用 QTextDocument 按指定宽度换行，返回行文本与其在全文中的起始字符偏移。
+        作用: 使用 QTextDocument 按指定宽度换行，返回行文本与其在全文中的起始字符偏移；
+              复用面板持有的排版文档，字体键变化时才重设字体。
         参数:
             text: 原始文本。
             width: 内容宽度（像素）。
@@ -2378,46 +2672,14 @@ class NormalPanel(QWidget):
             tuple[list[str], list[int]]。
         """
         try:
-            from PySide6.QtGui import QTextDocument, QTextOption
-            doc = QTextDocument()
-            doc.setDefaultFont(self.moyu_view.font())
-            opt = QTextOption()
-            try:
-                opt.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
-            except Exception:
-                pass
-            doc.setDefaultTextOption(opt)
-            doc.setPlainText(text)
-            try:
-                doc.setTextWidth(float(width))
-            except Exception:
-                pass
-            lines = []
-            offsets = []
-            blk = doc.firstBlock()
-            while blk.isValid():
-                lay = blk.layout()
-                cnt = 0
-                try:
-                    cnt = lay.lineCount()
-                except Exception:
-                    cnt = 0
-                base = 0
-                try:
-                    base = int(blk.position())
-                except Exception:
-                    base = 0
-                for i in range(cnt):
-                    try:
-                        ln = lay.lineAt(i)
-                        start = int(ln.textStart())
-                        length = int(ln.textLength())
-                        seg = blk.text()[start:start + length]
-                        lines.append(seg)
-                        offsets.append(base + start)
-                    except Exception:
-                        pass
-                blk = blk.next()
+            font = self.moyu_view.font()
+            font_key = self._moyu_font_key()
+            if self._moyu_layout_doc is None:
+                self._moyu_layout_doc = _new_layout_document(font)
+            elif font_key != self._moyu_layout_font_key:
+                self._moyu_layout_doc.setDefaultFont(font)
+            self._moyu_layout_font_key = font_key
+            lines, offsets = _layout_text_with_offsets(text, width, font, self._moyu_layout_doc)
             if not lines or len(offsets) != len(lines):
                 return self._wrap_text_to_lines_fallback_with_offsets(text, width)
             return lines, offsets
@@ -2425,15 +2687,26 @@ class NormalPanel(QWidget):
             try:
                 return self._wrap_text_to_lines_fallback_with_offsets(text, width)
             except Exception:
-                lines = text.splitlines()
-                if not lines:
-                    lines = [""]
-                return lines, [0 for _ in lines]
+                return _split_lines_with_offsets(text)
+
+    def _prefetch_current_neighbors(self) -> None:
+        """
+        函数: _prefetch_current_neighbors
+        作用: 预排版定时器回调；以视图上实际显示的页为中心预排邻页。
+              翻页节流期间 _moyu_page_index 已指向尚未显示的目标页，不能以它为中心淘汰文档。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        if self._moyu_pages and self._moyu_shown_index >= 0:
+            self._prefetch_neighbors(self._moyu_shown_index)
 
     def _prefetch_neighbors(self, index: int) -> None:
         """
         函数: _prefetch_neighbors
-        作用: 预加载当前页的前后 2 页内容到缓存字典，提升翻页响应。
+        作用: 预排版当前页前后 2 页的文档，并释放窗口之外的页文档，提升翻页响应；
+              视图正在显示的文档无论是否在窗口内都不释放。
         参数:
             index: 当前页索引。
         返回:
@@ -2443,56 +2716,94 @@ class NormalPanel(QWidget):
             for d in (-2, -1, 1, 2):
                 j = index + d
                 if 0 <= j < len(self._moyu_pages):
-                    self._moyu_prefetch_cache[j] = self._moyu_pages[j]
+                    self._moyu_page_document(j)
+            shown = self.moyu_view.document()
+            for j in [k for k, doc in self._moyu_page_docs.items() if abs(k - index) > 2 and doc is not shown]:
+                self._moyu_page_docs.pop(j).deleteLater()
         except Exception:
             pass
 
-    def save_moyu_current_page(self) -> None:
+    def _new_moyu_document(self, text: str) -> QTextDocument:
         """
-        函数: save_moyu_current_page
-        作用: 主动保存当前页码（Esc 退出前调用）。
+        函数: _new_moyu_document
+        作用: 创建与文本视图排版参数一致（字体、边距、换行方式）的纯文本文档。
+        参数:
+            text: 文档内容。
+        返回:
+            QTextDocument: 以本面板为父对象的文档。
+        """
+        doc = QTextDocument(self)
+        doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+        doc.setUndoRedoEnabled(False)
+        doc.setDocumentMargin(2)
+        doc.setDefaultFont(self.moyu_view.font())
+        opt = QTextOption()
+        opt.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        doc.setDefaultTextOption(opt)
+        doc.setPlainText(text)
+        return doc
+
+    def _moyu_page_document(self, index: int) -> QTextDocument:
+        """
+        函数: _moyu_page_document
+        作用: 返回指定页的缓存文档，未命中时创建；视图字体变化时整体失效重建。
+        参数:
+            index: 页索引（0基）。
+        返回:
+            QTextDocument。
+        """
+        font_key = self._moyu_font_key()
+        if font_key != self._moyu_page_docs_font:
+            self._clear_moyu_page_documents()
+            self._moyu_page_docs_font = font_key
+        doc = self._moyu_page_docs.get(index)
+        if doc is None:
+            doc = self._new_moyu_document(self._moyu_pages[index])
+            self._moyu_page_docs[index] = doc
+        return doc
+
+    def _use_moyu_scratch_document(self) -> None:
+        """
+        函数: _use_moyu_scratch_document
+        作用: 将文本视图切回临时文档，之后的 setPlainText/clear 不会改写缓存的页文档。
         参数:
             无。
         返回:
             无。
         """
-        self._persist_moyu_page()
+        # 切走页文档后，节流期间被合并的翻页不再补显示
+        self._moyu_page_pending = False
+        self._moyu_shown_index = -1
+        self._moyu_scratch_doc.setDefaultFont(self.moyu_view.font())
+        if self.moyu_view.document() is not self._moyu_scratch_doc:
+            self.moyu_view.setDocument(self._moyu_scratch_doc)
 
-    def _append_lines_to_pages(self, lines: list) -> None:
+    def _clear_moyu_page_documents(self) -> None:
         """
-        函数: _append_lines_to_pages
-        作用: 将传入的物理行列表与暂存行合并，按三行规则生成页并追加到分页结果；保留未满一页的行到暂存区。
+        函数: _clear_moyu_page_documents
+        作用: 释放全部页文档（分页结果或字体变化后调用）；正在显示的文档先切回临时文档。
         参数:
-            lines: 物理行列表。
+            无。
         返回:
             无。
         """
-        try:
-            n = self._get_lines_per_page()
-            n = max(1, int(n))
-            buf = self._moyu_line_staging + list(lines)
-            while len(buf) >= n:
-                self._moyu_pages.append("\n".join(buf[:n]))
-                buf = buf[n:]
-            self._moyu_line_staging = buf
-        except Exception:
-            pass
+        if not self._moyu_page_docs:
+            return
+        self._use_moyu_scratch_document()
+        for doc in self._moyu_page_docs.values():
+            doc.deleteLater()
+        self._moyu_page_docs.clear()
 
-    def _finalize_pages_from_staging(self) -> None:
+    def save_moyu_current_page(self) -> None:
         """
-        函数: _finalize_pages_from_staging
-        作用: 将暂存区剩余的未满一页的行写入最后一页（若存在）。
+        函数: save_moyu_current_page
+        作用: 主动保存当前页码（Esc 退出前调用）。
         参数:
             无。
         返回:
             无。
         """
-        try:
-            if self._moyu_line_staging:
-                self._moyu_pages.append("\n".join(self._moyu_line_staging))
-                self._moyu_line_staging = []
-        except Exception:
-            pass
+        self._persist_moyu_page()
 
     def show_moyu_disguise(self) -> None:
         """
@@ -2514,15 +2825,16 @@ class NormalPanel(QWidget):
                 "∇·E = ρ/ε0\n∇×E = -∂B/∂t\n∇·B = 0",
             ]
             txt = random.choice(samples)
+            self._use_moyu_scratch_document()
             self.moyu_view.setPlainText(txt)
             self.moyu_page_label.setVisible(False)
-            self.moyu_view.setVisible(True)
+            self._set_moyu_view_visible(True)
         except Exception:
             try:
                 # 回退：若随机失败，显示固定伪装文本
                 self.moyu_view.setPlainText("y = ax^2 + bx + c\nΔ = b^2 - 4ac")
                 self.moyu_page_label.setVisible(False)
-                self.moyu_view.setVisible(True)
+                self._set_moyu_view_visible(True)
             except Exception:
                 pass
 
@@ -2562,6 +2874,10 @@ class _MinimalReaderDialog(QDialog):
         self._index = max(0, min(int(index), len(self._pages) - 1))
         self.on_page_changed = None
         self._wheel_accum = 0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(0)
+        self._wheel_timer.timeout.connect(self._flush_wheel)
         try:
             self.setWindowFlag(Qt.FramelessWindowHint, True)
         except Exception:
@@ -2587,16 +2903,12 @@ class _MinimalReaderDialog(QDialog):
         except Exception:
             pass
         self._size_grip = QSizeGrip(self)
+        # 文本透明度效果：首次使用时安装到视口，之后仅调整 opacity
+        self._text_effect = None
         root = QVBoxLayout(self)
         root.setContentsMargins(8, 8, 8, 8)
         root.setSpacing(4)
         root.addWidget(self._view)
-        try:
-            self.installEventFilter(self)
-            self._view.installEventFilter(self)
-            self._size_grip.installEventFilter(self)
-        except Exception:
-            pass
         try:
             self._show_border = False
             self._hover_hidden = False
@@ -2608,14 +2920,8 @@ class _MinimalReaderDialog(QDialog):
             self._hover_timer.setInterval(160)
             self._hover_timer.timeout.connect(self._on_hover_timer)
             self._hover_show_delay_timer = QTimer(self)
-            try:
-                settings = QSettings()
-                d = int(settings.value("minimal_hover_delay_ms", 1500, type=int))
-            except Exception:
-                d = 1500
-            d = 0 if d < 0 else (10000 if d > 10000 else d)
-            self._hover_delay_ms = int(d)
-            self._hover_show_delay_timer.setInterval(int(d))
+            self._hover_delay_ms = SettingsService.minimal_hover_delay_ms()
+            self._hover_show_delay_timer.setInterval(self._hover_delay_ms)
             self._hover_show_delay_timer.setSingleShot(True)
             self._hover_show_delay_timer.timeout.connect(self._hover_show_now)
             self._fade_anim = None
@@ -2625,6 +2931,13 @@ class _MinimalReaderDialog(QDialog):
             self._resize_snap_px = 12
         except Exception:
             pass
+        # 悬停/拖拽状态初始化完成后再安装事件过滤器，过滤器内可直接访问这些属性
+        self.installEventFilter(self)
+        self._view.installEventFilter(self)
+        self._size_grip.installEventFilter(self)
+        # 页文档缓存：与主面板一致，每页一个 QTextDocument，翻页时切换文档而非 setPlainText 重建文本块
+        self._page_docs = {}  # type: dict[int, QTextDocument]
+        self._page_docs_font = None
         self._show_page(self._index)
         try:
             self._update_size_grip_geometry()
@@ -2643,13 +2956,44 @@ class _MinimalReaderDialog(QDialog):
         if not self._pages:
             return
         self._index = max(0, min(int(index), len(self._pages) - 1))
-        self._view.setPlainText(self._pages[self._index])
+        self._view.setDocument(self._page_document(self._index))
+        # 只保留当前页前后 2 页的文档
+        for j in [k for k in self._page_docs if abs(k - self._index) > 2]:
+            self._page_docs.pop(j).deleteLater()
         if callable(self.on_page_changed):
             try:
                 self.on_page_changed(self._index)
             except Exception:
                 pass
 
+    def _page_document(self, index: int) -> QTextDocument:
+        """
+        函数: _page_document
+        作用: 返回指定页的缓存文档，未命中时创建；视图字体变化（如切换透明样式）时整体失效重建。
+        参数:
+            index: 页索引（0基）。
+        返回:
+            QTextDocument。
+        """
+        font = self._view.font()
+        font_key = (font.family(), int(font.pointSize()), int(font.weight()))
+        if font_key != self._page_docs_font:
+            # 正在显示的文档仍由视图使用，deleteLater 在本次切换完成后才释放
+            for doc in self._page_docs.values():
+                doc.deleteLater()
+            self._page_docs.clear()
+            self._page_docs_font = font_key
+        doc = self._page_docs.get(index)
+        if doc is None:
+            doc = QTextDocument(self)
+            doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+            doc.setUndoRedoEnabled(False)
+            # setDocument 不会把控件字体带到新文档，需显式设置
+            doc.setDefaultFont(font)
+            doc.setPlainText(self._pages[index])
+            self._page_docs[index] = doc
+        return doc
+
     def keyPressEvent(self, event) -> None:
         """
         函数: keyPressEvent
@@ -2660,10 +3004,10 @@ class _MinimalReaderDialog(QDialog):
             无。
         """
         key = event.key()
-        if key in (Qt.Key_PageUp, Qt.Key_Up, Qt.Key_Left, Qt.Key_W):
+        if key in _MOYU_PREV_KEYS:
             self._show_page(self._index - 1)
             return
-        if key in (Qt.Key_PageDown, Qt.Key_Down, Qt.Key_Right, Qt.Key_S):
+        if key in _MOYU_NEXT_KEYS:
             self._show_page(self._index + 1)
             return
         try:
@@ -2674,108 +3018,72 @@ class _MinimalReaderDialog(QDialog):
     def wheelEvent(self, event) -> None:
         """
         函数: wheelEvent
-        作用: 处理鼠标滚轮翻页，采用 120 阈值累计方式确保一致一页一翻。
+        作用: 处理鼠标滚轮翻页，采用 120 阈值累计方式确保一致一页一翻；
+              翻页合并到定时器回调中执行。
         参数:
             event: 滚轮事件。
         返回:
             无。
         """
-        delta = 0
-        try:
-            delta = int(event.angleDelta().y())
-        except Exception:
-            delta = 0
-        if delta == 0:
-            try:
-                delta = int(getattr(event.pixelDelta(), 'y', lambda: 0)())
-            except Exception:
-                delta = 0
-        self._wheel_accum += delta
-        step = 120
-        moved = False
-        while self._wheel_accum >= step:
-            self._show_page(self._index - 1)
-            self._wheel_accum -= step
-            moved = True
-        while self._wheel_accum <= -step:
-            self._show_page(self._index + 1)
-            self._wheel_accum += step
-            moved = True
-        if moved:
+        self._wheel_accum += _wheel_delta(event)
+        # 与主面板一致：累计后在事件循环空闲时一次性翻页
+        if not self._wheel_timer.isActive():
+            self._wheel_timer.start()
+
+    def _flush_wheel(self) -> None:
+        """
+        函数: _flush_wheel
+        作用: 滚轮合并定时器回调；按 120 阈值将累计增量折算为页数并一次翻到目标页。
+        参数:
+            无。
+        返回:
+            无。
+        """
+        steps = int(self._wheel_accum / _WHEEL_STEP)
+        if steps == 0:
             return
-        try:
-            super().wheelEvent(event)
-        except Exception:
-            pass
+        self._wheel_accum -= steps * _WHEEL_STEP
+        self._show_page(self._index - steps)
     def eventFilter(self, obj, event):
-        try:
-            if obj is self or obj is self._view:
-                et = event.type()
-                if et == event.Type.Enter:
-                    try:
-                        self._hover_show()
-                    except Exception:
-                        pass
-                    return False
-                if et == event.Type.Leave:
-                    try:
-                        if obj is self:
-                            if not getattr(self, "_resizing", False):
-                                self._hover_hide()
-                        # 忽略文本视图的 Leave，避免进入右下角尺寸区域时误判为移出窗口
-                    except Exception:
-                        pass
-                    return False
-                if et == event.Type.MouseButtonPress:
-                    if event.buttons() & Qt.LeftButton:
-                        try:
-                            self._drag_offset = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-                        except Exception:
-                            self._drag_offset = event.globalPos() - self.frameGeometry().topLeft()
-                        try:
-                            self.raise_()
-                            self.activateWindow()
-                            self.setFocus(Qt.MouseFocusReason)
-                        except Exception:
-                            pass
-                        return True
-                if et == event.Type.MouseMove:
-                    if self._drag_offset is not None and (event.buttons() & Qt.LeftButton):
-                        try:
-                            pos = event.globalPosition().toPoint() - self._drag_offset
-                        except Exception:
-                            pos = event.globalPos() - self._drag_offset
-                        self.move(pos)
-                        return True
-                if et == event.Type.MouseButtonRelease:
-                    self._drag_offset = None
+        et = event.type()
+        if obj is self or obj is self._view:
+            if et == _ET_ENTER:
+                self._hover_show()
+                return False
+            if et == _ET_LEAVE:
+                # 忽略文本视图的 Leave，避免进入右下角尺寸区域时误判为移出窗口
+                if obj is self and not self._resizing:
+                    self._hover_hide()
+                return False
+            if et == _ET_MOUSE_PRESS:
+                if event.buttons() & Qt.LeftButton:
+                    self._drag_offset = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+                    self.raise_()
+                    self.activateWindow()
+                    self.setFocus(Qt.MouseFocusReason)
                     return True
-                if et == event.Type.Wheel:
-                    try:
-                        self.wheelEvent(event)
-                        return True
-                    except Exception:
-                        pass
+            if et == _ET_MOUSE_MOVE:
+                if self._drag_offset is not None and (event.buttons() & Qt.LeftButton):
+                    self.move(event.globalPosition().toPoint() - self._drag_offset)
+                    return True
+            if et == _ET_MOUSE_RELEASE:
+                self._drag_offset = None
+                return True
+            if et == _ET_WHEEL:
+                self.wheelEvent(event)
+                return True
+        elif obj is self._size_grip:
             # 尺寸吸附：监听右下角 QSizeGrip 拖拽事件
-            if hasattr(self, "_size_grip") and obj is self._size_grip:
-                et = event.type()
-                if et == event.Type.MouseButtonPress:
-                    self._resizing = True
-                elif et == event.Type.MouseMove:
-                    if self._resizing:
-                        try:
-                            self._apply_resize_snapping()
-                        except Exception:
-                            pass
-                elif et == event.Type.MouseButtonRelease:
-                    self._resizing = False
-                    try:
-                        self._apply_resize_snapping()
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+            if et == _ET_MOUSE_PRESS:
+                self._resizing = True
+            elif et == _ET_MOUSE_MOVE:
+                if self._resizing:
+                    self._apply_resize_snapping()
+            elif et == _ET_MOUSE_RELEASE:
+                self._resizing = False
+                self._apply_resize_snapping()
         return super().eventFilter(obj, event)
+
     def enterEvent(self, event) -> None:
         """
         函数: enterEvent
@@ -2785,14 +3093,8 @@ class _MinimalReaderDialog(QDialog):
         返回:
             无。
         """
-        try:
-            self._hover_show()
-        except Exception:
-            pass
-        try:
-            super().enterEvent(event)
-        except Exception:
-            pass
+        self._hover_show()
+        super().enterEvent(event)
     def leaveEvent(self, event) -> None:
         """
         函数: leaveEvent
@@ -2802,15 +3104,9 @@ class _MinimalReaderDialog(QDialog):
         返回:
             无。
         """
-        try:
-            if not getattr(self, "_resizing", False):
-                self._hover_hide()
-        except Exception:
-            pass
-        try:
-            super().leaveEvent(event)
-        except Exception:
-            pass
+        if not self._resizing:
+            self._hover_hide()
+        super().leaveEvent(event)
     def _hover_show(self) -> None:
         """
         函数: _hover_show
@@ -2820,14 +3116,10 @@ class _MinimalReaderDialog(QDialog):
         返回:
             无。
         """
-        try:
-            if not getattr(self, "_hover_enabled", True):
-                return
-            if hasattr(self, "_hover_show_delay_timer") and self._hover_show_delay_timer is not None:
-                if not self._hover_show_delay_timer.isActive():
-                    self._hover_show_delay_timer.start()
-        except Exception:
-            pass
+        if not self._hover_enabled:
+            return
+        if not self._hover_show_delay_timer.isActive():
+            self._hover_show_delay_timer.start()
     def _hover_hide(self) -> None:
         """
         函数: _hover_hide
@@ -2837,35 +3129,14 @@ class _MinimalReaderDialog(QDialog):
         返回:
             无。
         """
-        try:
-            if getattr(self, "_resizing", False):
-                return
-            if not getattr(self, "_hover_enabled", True):
-                return
-            self._hover_hidden = True
-            try:
-                self._show_border = False
-            except Exception:
-                pass
-            try:
-                if hasattr(self, "_hover_show_delay_timer") and self._hover_show_delay_timer is not None:
-                    if self._hover_show_delay_timer.isActive():
-                        self._hover_show_delay_timer.stop()
-            except Exception:
-                pass
-            try:
-                target = float(getattr(self, "_hover_hidden_opacity", 0.06))
-                self._animate_opacity(target, 150)
-            except Exception:
-                pass
-            try:
-                if hasattr(self, "_hover_timer") and self._hover_timer is not None:
-                    if not self._hover_timer.isActive():
-                        self._hover_timer.start()
-            except Exception:
-                pass
-        except Exception:
-            pass
+        if self._resizing or not self._hover_enabled:
+            return
+        self._hover_hidden = True
+        self._show_border = False
+        self._hover_show_delay_timer.stop()
+        self._animate_opacity(self._hover_hidden_opacity, 150)
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
 
     def _hover_show_now(self) -> None:
         """
@@ -2879,44 +3150,42 @@ class _MinimalReaderDialog(QDialog):
         try:
             if not getattr(self, "_hover_enabled", True):
                 return
-            settings = QSettings()
-            percent = int(settings.value("minimal_opacity_percent", 100, type=int))
-            percent = max(1, min(100, percent))
+            percent = SettingsService.minimal_opacity_percent()
             if percent == 1:
                 try:
                     self._show_border = True
                     self.setAttribute(Qt.WA_TranslucentBackground, True)
                 except Exception:
                     pass
-                try:
-                    if hasattr(self, "_view") and self._view is not None:
-                        eff = self._view.viewport().graphicsEffect()
-                        if not eff:
-                            eff = QGraphicsOpacityEffect(self._view.viewport())
-                            self._view.viewport().setGraphicsEffect(eff)
-                        eff.setOpacity(0.9)
-                except Exception:
-                    pass
+                self._text_opacity_effect().setOpacity(0.9)
                 self._animate_opacity(1.0, 150)
             else:
                 try:
                     self._show_border = False
                 except Exception:
                     pass
-                try:
-                    if hasattr(self, "_view") and self._view is not None:
-                        eff = self._view.viewport().graphicsEffect()
-                        if not eff:
-                            eff = QGraphicsOpacityEffect(self._view.viewport())
-                            self._view.viewport().setGraphicsEffect(eff)
-                        eff.setOpacity(0.5)
-                except Exception:
-                    pass
+                self._text_opacity_effect().setOpacity(0.5)
                 self._animate_opacity(percent / 100.0, 150)
             self._hover_hidden = False
         except Exception:
             pass
 
+    def _text_opacity_effect(self) -> QGraphicsOpacityEffect:
+        """
+        函数: _text_opacity_effect
+        作用: 返回文本视口的透明度效果；仅在首次调用时创建并安装，
+              之后复用同一对象，避免重复分配与 setGraphicsEffect 触发整窗重绘。
+        参数:
+            无。
+        返回:
+            QGraphicsOpacityEffect。
+        """
+        if self._text_effect is None:
+            viewport = self._view.viewport()
+            self._text_effect = QGraphicsOpacityEffect(viewport)
+            viewport.setGraphicsEffect(self._text_effect)
+        return self._text_effect
+
     def _animate_opacity(self, target: float, duration: int = 300) -> None:
         """
         函数: _animate_opacity
@@ -2927,32 +3196,17 @@ class _MinimalReaderDialog(QDialog):
         返回:
             无。
         """
-        try:
-            if target < 0.0:
-                target = 0.0
-            if target > 1.0:
-                target = 1.0
-            anim = QPropertyAnimation(self, b"windowOpacity")
-            try:
-                anim.setDuration(int(duration))
-            except Exception:
-                pass
-            try:
-                anim.setStartValue(float(self.windowOpacity()))
-                anim.setEndValue(float(target))
-            except Exception:
-                pass
-            try:
-                anim.setEasingCurve(QEasingCurve.InOutQuad)
-            except Exception:
-                pass
-            try:
-                self._fade_anim = anim
-                anim.start()
-            except Exception:
-                pass
-        except Exception:
-            pass
+        target = max(0.0, min(1.0, float(target)))
+        # 替换旧动画前先停止，避免两段动画同时写入窗口不透明度
+        if self._fade_anim is not None:
+            self._fade_anim.stop()
+        anim = QPropertyAnimation(self, b"windowOpacity")
+        anim.setDuration(int(duration))
+        anim.setStartValue(float(self.windowOpacity()))
+        anim.setEndValue(target)
+        anim.setEasingCurve(QEasingCurve.InOutQuad)
+        self._fade_anim = anim
+        anim.start()
 
     def _apply_resize_snapping(self) -> None:
         """
@@ -3139,11 +3393,7 @@ class _MinimalReaderDialog(QDialog):
             except Exception:
                 col_str = None
             if not col_str:
-                try:
-                    settings = QSettings()
-                    col_str = str(settings.value("minimal_theme_bg", "#F5F5F7", type=str))
-                except Exception:
-                    col_str = "#F5F5F7"
+                col_str = SettingsService.minimal_theme()["bg"]
             try:
                 col = QColor(col_str)
                 if self.testAttribute(Qt.WA_TranslucentBackground):
@@ -66,6 +66,8 @@ class ScientificPanel(QWidget):
         self.memory_store = memory_store
         self.angle_mode = default_angle_mode
         self._game_secret = "666888"
+        # 当前打开的小游戏窗口（创建时登记，销毁时移除），供主窗口置顶互斥直接遍历
+        self._open_game_dialogs: List[QDialog] = []
 
         # 顶部：模式切换与提示
         top = QWidget()
@@ -396,6 +398,7 @@ class ScientificPanel(QWidget):
                             g.destroyed.connect(lambda *_: setattr(self, "_game_2048_dialog", None))
                         except Exception:
                             pass
+                        self._register_game_dialog(g)
                         try:
                             g.setWindowFlag(Qt.WindowStaysOnTopHint, True)
                         except Exception:
@@ -433,6 +436,7 @@ class ScientificPanel(QWidget):
                             s.destroyed.connect(lambda *_: setattr(self, "_game_snake_dialog", None))
                         except Exception:
                             pass
+                        self._register_game_dialog(s)
                         try:
                             s.setWindowFlag(Qt.WindowStaysOnTopHint, True)
                         except Exception:
@@ -469,6 +473,7 @@ class ScientificPanel(QWidget):
                             m.destroyed.connect(lambda *_: setattr(self, "_game_minesweeper_dialog", None))
                         except Exception:
                             pass
+                        self._register_game_dialog(m)
                         try:
                             m.setWindowFlag(Qt.WindowStaysOnTopHint, True)
                         except Exception:
@@ -505,6 +510,7 @@ class ScientificPanel(QWidget):
                             gmk.destroyed.connect(lambda *_: setattr(self, "_game_gomoku_dialog", None))
                         except Exception:
                             pass
+                        self._register_game_dialog(gmk)
                         try:
                             gmk.setWindowFlag(Qt.WindowStaysOnTopHint, True)
                         except Exception:
@@ -543,20 +549,49 @@ class ScientificPanel(QWidget):
         返回:
             无。
         """
+        for dlg in list(self._open_game_dialogs):
+            try:
+                dlg.close()
+            except Exception:
+                pass
+
+    def _register_game_dialog(self, dlg: QDialog) -> None:
+        """
+        函数: _register_game_dialog
+        作用: 登记新打开的小游戏窗口，并在其销毁时自动移出列表。
+        参数:
+            dlg: 小游戏窗口。
+        返回:
+            无。
+        """
+        self._open_game_dialogs.append(dlg)
         try:
-            for name in ("_game_2048_dialog", "_game_snake_dialog", "_game_minesweeper_dialog", "_game_gomoku_dialog"):
-                try:
-                    dlg = getattr(self, name, None)
-                except Exception:
-                    dlg = None
-                if dlg is not None:
-                    try:
-                        dlg.close()
-                    except Exception:
-                        pass
+            dlg.destroyed.connect(lambda *_, d=dlg: self._forget_game_dialog(d))
         except Exception:
             pass
 
+    def _forget_game_dialog(self, dlg: QDialog) -> None:
+        """
+        函数: _forget_game_dialog
+        作用: 将已销毁的小游戏窗口移出打开列表。
+        参数:
+            dlg: 小游戏窗口。
+        返回:
+            无。
+        """
+        self._open_game_dialogs = [d for d in self._open_game_dialogs if d is not dlg]
+
+    def iter_game_dialogs(self):
+        """
+        函数: iter_game_dialogs
+        作用: 遍历当前打开的小游戏窗口（快照，遍历期间关闭窗口不受影响）。
+        参数:
+            无。
+        返回:
+            小游戏窗口迭代器。
+        """
+        return iter(list(self._open_game_dialogs))
+
     def handle_memory(self, op: str) -> None:
         """
         函数: handle_memory
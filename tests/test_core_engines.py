@@ -14,6 +14,7 @@ if str(SRC) not in sys.path:
 
 from core.book_loader import (
     is_supported_book_file,
+    iter_book_text_chunks,
     list_supported_book_files,
     load_book_content,
     load_book_text,
@@ -153,9 +154,41 @@ class TestBookLoader(unittest.TestCase):
             (root / "b.epub").write_bytes(b"epub")
             (root / "A.txt").write_text("txt", encoding="utf-8")
             (root / "ignore.md").write_text("md", encoding="utf-8")
+            (root / "folder.txt").mkdir()
             files = list_supported_book_files(str(root))
             self.assertEqual(files, ["A.txt", "b.epub"])
 
+    def test_iter_book_text_chunks_streams_txt_like_full_read(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            text = "第一章 开始\r\n摸鱼阅读测试文本。\n" * 50
+            utf8_path = root / "utf8.txt"
+            utf8_path.write_bytes(text.encode("utf-8"))
+            gbk_path = root / "gbk.txt"
+            gbk_path.write_bytes(text.encode("gbk"))
+            for path in (utf8_path, gbk_path):
+                chunks = list(iter_book_text_chunks(str(path), chunk_size=7))
+                self.assertGreater(len(chunks), 1)
+                self.assertEqual("".join(chunks), text.replace("\r\n", "\n"))
+                self.assertEqual("".join(chunks), load_book_text(str(path)))
+
+    def test_txt_encoding_is_decided_by_first_non_ascii_block(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            preface = "Preface in plain ASCII\r\n" * 400
+            body = "第一章 开始\r\n摸鱼阅读测试文本。"
+            gbk_path = root / "ascii_then_gbk.txt"
+            gbk_path.write_bytes(preface.encode("ascii") + body.encode("gbk"))
+            bom_path = root / "bom.txt"
+            bom_path.write_bytes(b"\xef\xbb\xbf" + body.encode("utf-8"))
+            expected = {
+                gbk_path: (preface + body).replace("\r\n", "\n"),
+                bom_path: body.replace("\r\n", "\n"),
+            }
+            for path, text in expected.items():
+                self.assertEqual("".join(iter_book_text_chunks(str(path), chunk_size=7)), text)
+                self.assertEqual(load_book_text(str(path)), text)
+
     def test_load_book_text_reads_epub_in_spine_order(self) -> None:
         with TemporaryDirectory() as tmp:
             epub_path = Path(tmp) / "sample.epub"
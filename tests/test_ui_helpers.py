@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QEvent, QSettings
+from PySide6.QtWidgets import QApplication
+
+from core.memory_store import MemoryStore
+from ui.main_window import _MoyuSettingsDialog, _parse_rgb
+from ui.normal_panel import NormalPanel, _MoyuLoaderWorker, _MoyuPages
+
+
+_SETTINGS_DIR = TemporaryDirectory()
+
+
+def setUpModule() -> None:
+    # 页码持久化写入临时目录，不污染本机设置
+    QCoreApplication.setOrganizationName("thief_counter_tests")
+    QCoreApplication.setApplicationName("thief_counter_tests")
+    QSettings.setDefaultFormat(QSettings.IniFormat)
+    QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, _SETTINGS_DIR.name)
+    QApplication.instance() or QApplication([])
+
+
+class TestMoyuPages(unittest.TestCase):
+    def test_pages_slice_text_between_offsets(self) -> None:
+        text = "aa\nbb\ncc\ndd"
+        pages = _MoyuPages(text, [0, 6])
+        self.assertEqual(len(pages), 2)
+        # 下一页从新段落开始时，两页之间的换行符不计入页文本
+        self.assertEqual(pages[0], "aa\nbb")
+        # 最后一页取到全文末尾
+        self.assertEqual(pages[1], "cc\ndd")
+        self.assertEqual(list(pages), ["aa\nbb", "cc\ndd"])
+
+    def test_soft_wrap_boundary_keeps_all_characters(self) -> None:
+        pages = _MoyuPages("abcdef", [0, 3])
+        self.assertEqual([pages[0], pages[1]], ["abc", "def"])
+
+    def test_negative_and_out_of_range_indices(self) -> None:
+        pages = _MoyuPages("aa\nbb\ncc", [0, 3, 6])
+        self.assertEqual(pages[-1], "cc")
+        self.assertEqual(pages[-3], "aa")
+        for index in (3, -4):
+            with self.assertRaises(IndexError):
+                pages[index]
+
+    def test_single_page(self) -> None:
+        # _set_moyu_pages 对空分页结果使用 [0]：整篇（含空文本）为一页
+        self.assertEqual(list(_MoyuPages("", [0])), [""])
+        pages = _MoyuPages("aa\nbb\n", [0])
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pages[0], "aa\nbb\n")
+
+
+class TestMoyuLoaderPages(unittest.TestCase):
+    def test_streamed_page_offsets_match_stride_of_all_lines(self) -> None:
+        offsets = list(range(0, 470, 10))
+        # 批次长度不是每页行数的整数倍，未满一页的行需跨批次携带
+        batches = (5, 1, 0, 7, 2, 11, 3, 8, 10)
+        for n in (1, 2, 3, 4, 7):
+            worker = _MoyuLoaderWorker("", [], False, lines_per_page=n)
+            got = []
+            worker.pagesChunk.connect(got.extend)
+            pos = 0
+            for size in batches:
+                worker._emit_pages(offsets[pos:pos + size], final=False)
+                pos += size
+                self.assertLess(len(worker._page_offsets), n)
+            worker._emit_pages([], final=True)
+            self.assertEqual(got, offsets[::n], n)
+            self.assertEqual(worker._page_offsets, [])
+
+    def test_final_batch_flushes_partial_page(self) -> None:
+        worker = _MoyuLoaderWorker("", [], False, lines_per_page=3)
+        got = []
+        worker.pagesChunk.connect(got.extend)
+        worker._emit_pages([0, 5], final=False)
+        self.assertEqual(got, [])
+        worker._emit_pages([9, 12, 20, 31], final=True)
+        self.assertEqual(got, [0, 12])
+
+
+class TestMoyuPaging(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = QApplication.instance()
+        self.panel = NormalPanel(MemoryStore())
+        self.panel.resize(600, 500)
+        self.panel.show()
+        text = "\n".join(f"第{i}行 摸鱼测试文本" for i in range(400))
+        self.panel._moyu_full_text = text
+        self.panel._compute_moyu_pages_from_text(text)
+
+    def tearDown(self) -> None:
+        self.panel.close()
+        self.panel.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def test_throttled_page_flips_keep_displayed_document(self) -> None:
+        panel = self.panel
+        # 同一帧内连续翻页：第一页立即显示，其余被节流，页码领先于视图
+        for index in (5, 6, 7, 8):
+            panel._queue_moyu_page(index)
+        shown = panel.moyu_view.document()
+        self.app.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        self.assertIn(shown, panel._moyu_page_docs.values())
+        self.assertIs(panel.moyu_view.document(), shown)
+        # 曾释放正在显示的文档，重绘时崩溃
+        panel.moyu_view.viewport().repaint()
+        self.assertEqual(panel._moyu_page_index, 8)
+
+
+class TestColorParsing(unittest.TestCase):
+    def test_parse_rgb_accepts_spaces_around_tokens(self) -> None:
+        for text in (
+            "rgb(1,2,3)",
+            " rgb(1,2,3)",
+            "rgb(1,2,3) ",
+            "rgb (1,2,3)",
+            "RGB( 1 , 2 , 3 )",
+        ):
+            self.assertEqual(_parse_rgb(text), (1, 2, 3), text)
+
+    def test_parse_rgb_rejects_malformed(self) -> None:
+        for text in ("", "   ", "rgb()", "rgb(1,2)", "rgb(1,2,3,4)", "rgb(256,0,0)", "rgb(1,2,3", "rgbx(1,2,3)", "rgb(a,b,c)"):
+            self.assertIsNone(_parse_rgb(text), text)
+
+    def test_valid_color(self) -> None:
+        valid = _MoyuSettingsDialog._valid_color
+        self.assertTrue(valid(None, "#abc"))
+        self.assertTrue(valid(None, "#A1B2C3"))
+        self.assertTrue(valid(None, " rgb(10, 20, 30) "))
+        self.assertFalse(valid(None, "#ggg"))
+        self.assertFalse(valid(None, "rgb(1,2)"))
+
+
+if __name__ == "__main__":
+    unittest.main()